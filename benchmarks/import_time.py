@@ -0,0 +1,54 @@
+"""Measure the time it takes to import parts of mtkruto in a fresh interpreter.
+
+python benchmarks/import_time.py [runs]
+"""
+
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = [
+    "import mtkruto",
+    "import mtkruto.errors",
+    "import mtkruto.types",
+    "import mtkruto.filters",
+    "from mtkruto import Client",
+]
+
+CODE = """
+import time
+t = time.perf_counter()
+{}
+print(time.perf_counter() - t)
+"""
+
+
+def measure(statement: str, runs: int) -> list[float]:
+    # warm the bytecode cache
+    subprocess.run([sys.executable, "-c", statement], check=True)
+    return [
+        float(
+            subprocess.run(
+                [sys.executable, "-c", CODE.format(statement)],
+                check=True,
+                capture_output=True,
+                text=True,
+            ).stdout
+        )
+        for _ in range(runs)
+    ]
+
+
+def main() -> None:
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+    for statement in STATEMENTS:
+        times = measure(statement, runs)
+        print(
+            "{:<28} median {:7.1f} ms  min {:7.1f} ms".format(
+                statement, statistics.median(times) * 1e3, min(times) * 1e3
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
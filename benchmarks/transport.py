@@ -0,0 +1,96 @@
+"""Compare requests over TCP loopback with requests over a Unix domain socket.
+
+A stand-in server answering every method with a small JSON object is run in
+a separate process, listening on both.
+
+python benchmarks/transport.py [requests] [concurrency]
+"""
+
+import asyncio
+import multiprocessing
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+from aiohttp import web
+
+from mtkruto import Client
+
+BODY = b'{"id": 1, "isBot": true, "firstName": "Bot", "username": "bot"}'
+
+
+async def handle(request: web.Request) -> web.Response:
+    await request.read()
+    return web.Response(body=BODY, content_type="application/json")
+
+
+async def serve(port: int, path: str) -> None:
+    app = web.Application()
+    app.router.add_post("/{method}", handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", port).start()
+    await web.UnixSite(runner, path).start()
+    await asyncio.Event().wait()
+
+
+def run_server(port: int, path: str) -> None:
+    asyncio.run(serve(port, path))
+
+
+async def measure(endpoint_url: str, requests: int, concurrency: int) -> None:
+    client = Client(endpoint_url)
+    try:
+        # open the connections before timing
+        await asyncio.gather(*(client._request("getMe") for _ in range(concurrency)))
+        latencies = []
+        for _ in range(requests):
+            started = time.perf_counter()
+            await client._request("getMe")
+            latencies.append(time.perf_counter() - started)
+
+        async def send(count: int) -> None:
+            for _ in range(count):
+                await client._request("getMe")
+
+        started = time.perf_counter()
+        await asyncio.gather(
+            *(send(requests // concurrency) for _ in range(concurrency))
+        )
+        elapsed = time.perf_counter() - started
+    finally:
+        await client._http_client.close()
+    print(
+        "{:<5} median {:6.1f} µs  p99 {:6.1f} µs  {:8.0f} requests/s".format(
+            endpoint_url.split(":")[0],
+            statistics.median(latencies) * 1e6,
+            statistics.quantiles(latencies, n=100)[98] * 1e6,
+            requests // concurrency * concurrency / elapsed,
+        )
+    )
+
+
+def main() -> None:
+    requests = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    concurrency = int(sys.argv[2]) if len(sys.argv) > 2 else 16
+    port = 8765
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "mtkruto.sock")
+        server = multiprocessing.Process(
+            target=run_server, args=(port, path), daemon=True
+        )
+        server.start()
+        try:
+            while not os.path.exists(path):
+                time.sleep(0.01)
+            for endpoint_url in (f"http://127.0.0.1:{port}/", f"unix://{path}"):
+                asyncio.run(measure(endpoint_url, requests, concurrency))
+        finally:
+            server.terminate()
+            server.join()
+
+
+if __name__ == "__main__":
+    main()
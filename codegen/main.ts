@@ -6,23 +6,36 @@ import {
 
 const nodes = JSON.parse(Deno.readTextFileSync("3_types.json")) as DocNode[];
 
-let code = `import datetime
-from typing import Annotated, Any, List, Literal, Optional, Union
+let code = `from __future__ import annotations
+
+import datetime
+from typing import TYPE_CHECKING, Annotated, Any, List, Literal, Optional, Union
 
 
 FileSource = Union[str, bytes]
 
 class _Type:
+    __slots__ = ("_client", "_raw")
+
     _client: Any
 
+    if not TYPE_CHECKING:
+        def __getattr__(self, name: str) -> Any:
+            # fields of lazily decoded objects are decoded on first access
+            if name.startswith("_") or not hasattr(self, "_raw"):
+                raise AttributeError(name)
+            from ._utils import materialize
+
+            return materialize(self, name)
+
     def __repr__(self) -> str:
         return "{}({})".format(
             self.__class__.__name__,
             ", ".join(
-                map(
-                    lambda v: "=".join(v),
-                    [[k, repr(v)] for k, v in self.__dict__.items() if not k.startswith("_")],
-                )
+                "{}={!r}".format(k, getattr(self, k))
+                for c in self.__class__.__mro__
+                for k in c.__dict__.get("__slots__", ())
+                if not k.startswith("_")
             ),
         )
 
@@ -98,6 +111,46 @@ function getFieldsRecursive(name: string): Field[] {
   return fields;
 }
 
+// Python allows only one of the bases of a class to have a non-empty
+// __slots__ layout. When an interface extends several others, the one with
+// the most fields keeps its layout and the others become mixins: they get
+// empty __slots__ and no __init__, and their fields are slotted by the
+// classes that extend them.
+const mixins = new Set<string>();
+for (const node of nodes) {
+  if (node.kind != "interface" || node.interfaceDef.extends.length < 2) {
+    continue;
+  }
+  const bases = node.interfaceDef.extends.map((v) => v.repr);
+  const layout = bases.reduce((a, b) =>
+    getFieldsRecursive(b).length > getFieldsRecursive(a).length ? b : a
+  );
+  for (const base of bases) {
+    if (base != layout) {
+      mixins.add(base);
+    }
+  }
+}
+
+function getSlottedFields(name: string): Set<string> {
+  const slotted = new Set<string>();
+  if (mixins.has(name)) {
+    return slotted;
+  }
+  const mbInterface = nodes.find((v): v is DocNodeInterface =>
+    v.name == name && v.kind == "interface"
+  );
+  for (const extend of mbInterface?.interfaceDef.extends ?? []) {
+    for (const field of getSlottedFields(extend.repr)) {
+      slotted.add(field);
+    }
+  }
+  for (const field of getFieldsRecursive(name)) {
+    slotted.add(field.snake);
+  }
+  return slotted;
+}
+
 for (const node of nodes) {
   if (
     node.name.endsWith("Getter") || node.name.endsWith("Resolver") ||
@@ -121,6 +174,21 @@ for (const node of nodes) {
     }:
 `;
 
+    const inherited = new Set<string>();
+    for (const extend of node.interfaceDef.extends) {
+      for (const field of getSlottedFields(extend.repr)) {
+        inherited.add(field);
+      }
+    }
+    const slots = mixins.has(node.name)
+      ? []
+      : getFieldsRecursive(node.name).map((v) => v.snake).filter((v) =>
+        !inherited.has(v)
+      );
+    code += `    __slots__ = (${
+      slots.map((v) => `"${v}"`).join(", ")
+    }${slots.length == 1 ? "," : ""})\n\n`;
+
     let fields = new Array<Field>();
 
     const discriminators = new Array<string>();
@@ -151,21 +219,23 @@ for (const node of nodes) {
       code += "\n";
     }
 
-    fields = getFieldsRecursive(node.name);
-    code += "    def __init__(self, ";
-    for (const field of fields.filter((v) => !v.optional)) {
-      code += `${field.snake}: ${field.type}, `;
-    }
-    const optionalFields = fields.filter((v) => v.optional);
-    if (optionalFields.length) {
-      code += "*, ";
-    }
-    for (const field of optionalFields) {
-      code += `${field.snake}: ${field.type} = None, `;
-    }
-    code += "):\n";
-    for (const field of fields) {
-      code += `        self.${field.snake} = ${field.snake}\n`;
+    if (!mixins.has(node.name)) {
+      fields = getFieldsRecursive(node.name);
+      code += "    def __init__(self, ";
+      for (const field of fields.filter((v) => !v.optional)) {
+        code += `${field.snake}: ${field.type}, `;
+      }
+      const optionalFields = fields.filter((v) => v.optional);
+      if (optionalFields.length) {
+        code += "*, ";
+      }
+      for (const field of optionalFields) {
+        code += `${field.snake}: ${field.type} = None, `;
+      }
+      code += "):\n";
+      for (const field of fields) {
+        code += `        self.${field.snake} = ${field.snake}\n`;
+      }
     }
 
     if (discriminators.length) {
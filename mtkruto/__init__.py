@@ -1,3 +1,16 @@
-from ._client import Client
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._client import Client
 
 __all__ = ["Client"]
+
+
+def __getattr__(name: str) -> Any:
+    # Client, and with it aiohttp and the types, is only imported once it is
+    # used, so that importing a submodule stays cheap
+    if name == "Client":
+        from ._client import Client
+
+        return Client
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,26 +1,49 @@
 import asyncio
 import datetime
-import json
+import functools
+import inspect
 import logging
-from collections.abc import Callable, Coroutine
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable, Coroutine
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Any,
     AsyncGenerator,
+    Collection,
+    Deque,
     Generic,
     List,
     Literal,
     Optional,
+    Sequence,
     TypeVar,
     Union,
     cast,
+    get_args,
 )
 from urllib.parse import urljoin
 
 import aiohttp
 
-from ._utils import default, to, transform
+from ._connection import ConnectionStats, ConnectionTracer, connector_of
+from ._dispatcher import Dispatcher, chat_key_of
+from ._executor import Executor, ExecutorStats
+from ._stats import HandlerStats, SlowCall
+from ._utils import (
+    ArraySplitter,
+    IdentityMap,
+    decoder_of,
+    encode,
+    to,
+    transform,
+    union_dispatch,
+)
+from .backoff import Backoff, BackoffStats
+from .codecs import Codec, default_codec
 from .errors import InputError, InternalError, StopPropagation, TelegramError
-from .filters import Filter
+from .filters import Filter, call_memoized
+from .queues import Lane, UpdateQueue
 from .types import (
     ID,
     BotCommand,
@@ -115,43 +138,280 @@ from .types import (
 
 log = logging.getLogger(__name__)
 
+R = TypeVar("R")
+
 
 class Client:
     _running = False
-    _handlers = list["Handler[Any]"]()
 
-    def __init__(self, endpoint_url: str) -> None:
+    def __init__(
+        self,
+        endpoint_url: str,
+        *,
+        codec: Optional[Codec] = None,
+        lazy_updates: bool = False,
+        identity_map_size: int = 0,
+        workers: int = 0,
+        prefetch: int = 0,
+        executor: Optional[ThreadPoolExecutor] = None,
+        update_queue: Optional[UpdateQueue] = None,
+        lanes: Sequence[Lane] = (),
+        handler_timeout: Optional[float] = None,
+        slow_call_threshold: float = 1.0,
+        slow_calls: int = 100,
+        backoff: Optional[Backoff] = None,
+        max_connections: int = 100,
+        max_connections_per_host: int = 0,
+        keepalive_timeout: float = 15.0,
+        dns_cache_ttl: Optional[int] = 10,
+    ) -> None:
+        endpoint_url, connector = connector_of(
+            endpoint_url,
+            max_connections,
+            max_connections_per_host,
+            keepalive_timeout,
+            dns_cache_ttl,
+        )
         if not endpoint_url.endswith("/"):
             endpoint_url += "/"
         self._endpoint_url = endpoint_url
+        self._codec = codec or default_codec()
+        self._lazy_updates = lazy_updates
+        self._identity_map = (
+            IdentityMap(identity_map_size) if identity_map_size else None
+        )
+        self._handlers = list["AnyHandler"]()
+        self._handlers_by_type: dict[type[Update], list["AnyHandler"]] = {}
+        self._handled_types: Optional[frozenset[type[Update]]] = frozenset()
+        self._workers = workers
+        self._prefetch = prefetch
+        self._executor = Executor(executor)
+        self._update_queue = update_queue
+        self._lanes = lanes
+        self._handler_timeout = handler_timeout
+        self._slow_call_threshold = slow_call_threshold
+        self._slow_calls: Deque[SlowCall] = deque(maxlen=slow_calls)
+        self._backoff = backoff or Backoff()
+        self._debounced: dict[tuple[int, Optional[int]], asyncio.Task[None]] = {}
+        self._connection_tracer = ConnectionTracer()
         self._http_client = aiohttp.ClientSession(
-            json_serialize=json.JSONEncoder(default=default).encode
+            connector=connector,
+            trace_configs=[self._connection_tracer.config],
         )
 
     async def start(self) -> None:
         self._running = True
+        # with lanes, the other updates must not be handled inline either, or
+        # they would hold up the lanes
+        workers = self._workers or (1 if self._lanes else 0)
+        dispatcher = Dispatcher(self._handle_update, workers) if workers else None
+        lanes = [
+            (
+                lane.types,
+                Dispatcher(self._handle_update, lane.workers, lane.max_pending),
+            )
+            for lane in self._lanes
+        ]
+        dispatchers: dict[type[Update], Optional[Dispatcher]] = {}
+        updates = self._updates()
         try:
-            while self._running:
+            async for update in updates:
                 try:
-                    updates = await self.get_updates()
-                    for update in updates:
-                        for handler in self._handlers:
-                            if handler.filter(update):
-                                try:
-                                    await handler.callback(self, update)
-                                except StopPropagation:
-                                    break
-                                except BaseException as e:
-                                    log.exception(
-                                        "An error occurred when handling an update.", e
-                                    )
-                except InputError:
-                    raise
-                except BaseException as e:
-                    log.error("getUpdates failed: %s", e)
-                    await asyncio.sleep(5)
+                    update_dispatcher = dispatchers[update.__class__]
+                except KeyError:
+                    update_dispatcher = dispatchers[update.__class__] = next(
+                        (d for types, d in lanes if isinstance(update, types)),
+                        dispatcher,
+                    )
+                if update_dispatcher:
+                    await update_dispatcher.put(update)
+                else:
+                    await self._handle_update(update)
         finally:
             self._running = False
+            await updates.aclose()
+            for _, lane_dispatcher in lanes:
+                await lane_dispatcher.close()
+            if dispatcher:
+                await dispatcher.close()
+            await self._cancel_debounced()
+
+    async def _updates(self) -> AsyncGenerator[Update, None]:
+        queue = self._update_queue
+        if queue is not None:
+            # the updates of the lanes are taken first too, without changing
+            # the queue's own priority types
+            priority = tuple(t for lane in self._lanes for t in lane.types)
+            poller = asyncio.ensure_future(self._fill_update_queue(queue, priority))
+            try:
+                while self._running:
+                    yield await queue.get()
+            finally:
+                poller.cancel()
+        elif self._prefetch:
+            batches: asyncio.Queue[Union[list[Update], InputError]] = asyncio.Queue(
+                self._prefetch
+            )
+            poller = asyncio.ensure_future(self._prefetch_updates(batches))
+            try:
+                while self._running:
+                    updates = await batches.get()
+                    if isinstance(updates, InputError):
+                        raise updates
+                    for update in self._prioritize(updates):
+                        yield update
+            finally:
+                poller.cancel()
+        else:
+            while self._running:
+                for update in self._prioritize(await self._poll()):
+                    yield update
+
+    def _prioritize(self, updates: list[Update]) -> list[Update]:
+        if not self._lanes:
+            return updates
+        types = tuple(t for lane in self._lanes for t in lane.types)
+        return sorted(updates, key=lambda update: not isinstance(update, types))
+
+    async def _poll(self) -> list[Update]:
+        try:
+            updates = await self.get_updates(
+                lazy=self._lazy_updates, types=self._handled_types
+            )
+        except InputError:
+            raise
+        except Exception as e:
+            await self._back_off(e)
+            return []
+        self._backoff.success()
+        return updates
+
+    async def _back_off(self, error: Exception) -> None:
+        delay = self._backoff.failure(error)
+        log.error("getUpdates failed, retrying in %.2f seconds: %s", delay, error)
+        if delay:
+            await asyncio.sleep(delay)
+
+    async def _prefetch_updates(
+        self, batches: "asyncio.Queue[Union[list[Update], InputError]]"
+    ) -> None:
+        while self._running:
+            try:
+                updates = await self._poll()
+            except InputError as e:
+                await batches.put(e)
+                return
+            await batches.put(updates)
+
+    async def _fill_update_queue(
+        self, queue: UpdateQueue, priority: tuple[type[Update], ...]
+    ) -> None:
+        while self._running:
+            try:
+                updates = await self._poll()
+            except InputError as e:
+                queue.close(e)
+                return
+            for update in updates:
+                await queue.put(update, priority=isinstance(update, priority))
+
+    async def _handle_update(self, update: Update) -> None:
+        memos: dict[int, Any] = {}
+        for handler in self._handlers_of(update.__class__):
+            if not call_memoized(handler.filter, update, memos):
+                continue
+            if handler.debounce is not None:
+                self._debounce(handler, update, handler.debounce)
+                continue
+            try:
+                await self._call_handler(handler, update)
+            except StopPropagation:
+                break
+
+    def _debounce(self, handler: "AnyHandler", update: Update, delay: float) -> None:
+        # a newer update of the same chat, or user, supersedes the older one
+        key = (id(handler), chat_key_of(update))
+        if task := self._debounced.get(key):
+            task.cancel()
+        task = self._debounced[key] = asyncio.ensure_future(
+            self._call_debounced(handler, update, delay)
+        )
+        task.add_done_callback(functools.partial(self._debounce_done, key))
+
+    async def _call_debounced(
+        self, handler: "AnyHandler", update: Update, delay: float
+    ) -> None:
+        await asyncio.sleep(delay)
+        try:
+            await self._call_handler(handler, update)
+        except StopPropagation:
+            # there is nothing left to stop once the other handlers have run
+            pass
+
+    def _debounce_done(
+        self, key: tuple[int, Optional[int]], task: "asyncio.Task[None]"
+    ) -> None:
+        if self._debounced.get(key) is task:
+            del self._debounced[key]
+
+    async def _cancel_debounced(self) -> None:
+        tasks = list(self._debounced.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _call_handler(self, handler: "AnyHandler", update: Update) -> None:
+        """Run a handler's callback within its deadline, and record the call.
+
+        Only `StopPropagation` is raised.
+        """
+        timeout = self._handler_timeout if handler.timeout is None else handler.timeout
+        started = time.perf_counter()
+        try:
+            if timeout is None:
+                await handler.callback(self, update)
+            else:
+                # not wait_for, whose TimeoutError could not be told apart from
+                # one raised by the callback
+                task = asyncio.ensure_future(handler.callback(self, update))
+                try:
+                    done, _ = await asyncio.wait((task,), timeout=timeout)
+                finally:
+                    if not task.done():
+                        task.cancel()
+                if done:
+                    task.result()
+                else:
+                    await asyncio.gather(task, return_exceptions=True)
+                    handler.stats.timeouts += 1
+                    log.error(
+                        "%s timed out after %s seconds handling %s",
+                        handler.stats.name,
+                        timeout,
+                        update.__class__.__name__,
+                    )
+        except StopPropagation:
+            raise
+        except Exception:
+            handler.stats.failures += 1
+            log.exception("An error occurred when handling an update.")
+        finally:
+            self._record_call(handler, update, time.perf_counter() - started)
+
+    def _record_call(
+        self, handler: "AnyHandler", update: Update, duration: float
+    ) -> None:
+        handler.stats.record(duration)
+        if duration >= self._slow_call_threshold:
+            self._slow_calls.append(
+                SlowCall(
+                    handler.stats.name,
+                    update.__class__.__name__,
+                    chat_key_of(update),
+                    duration,
+                    datetime.datetime.now(datetime.timezone.utc),
+                )
+            )
 
     def run(self) -> None:
         try:
@@ -164,205 +424,368 @@ class Client:
         log.info("Running as %s", me)
         return loop.run_until_complete(self.start())
 
-    async def _request(
+    async def _post(
         self,
         method: str,
-        *args: Any,
-        timeout: Optional[int] = None,
-    ) -> Any:
-        for arg in args:
-            if isinstance(arg, dict):
-                transform(arg)
+        args: Any,
+        timeout: Optional[int],
+    ) -> aiohttp.ClientResponse:
+        args = encode(args)
         url = urljoin(self._endpoint_url, "./" + method)
         if len(args) >= 2 and isinstance(args[1], bytes):
             form_data = aiohttp.FormData()
             for arg in args:
                 form_data.add_field(
                     "_",
-                    arg if isinstance(arg, bytes) else json.dumps(arg, default=default),
+                    arg if isinstance(arg, bytes) else self._codec.encode(arg).decode(),
                 )
-            result = await self._http_client.post(
+            response = await self._http_client.post(
                 url,
                 data=form_data,
                 timeout=aiohttp.ClientTimeout(total=timeout),
             )
         else:
             response = await self._http_client.post(
-                url, json=args, timeout=aiohttp.ClientTimeout(total=timeout)
+                url,
+                data=self._codec.encode(args),
+                headers={"content-type": self._codec.content_type},
+                timeout=aiohttp.ClientTimeout(total=timeout),
             )
-            if response.status == 200:
-                if response.headers.get("content-type") == "application/json":
-                    return transform(await response.json())
-                else:
-                    return response.content.iter_chunks()
-            else:
-                data = await response.json()
-                if error := response.headers.get("x-error-type"):
-                    if "input" in error:
-                        raise InputError(data)
-                    elif "rpc" in error:
-                        raise TelegramError(response.status, data)
-                raise InternalError(data)
-        return result
-
-    def add_handler(self, handler: "AnyHandler") -> None:
-        self._handlers.append(handler)
+        if response.status != 200:
+            data = self._codec.decode(await response.read())
+            if error := response.headers.get("x-error-type"):
+                if "input" in error:
+                    raise InputError(data)
+                elif "rpc" in error:
+                    raise TelegramError(response.status, data)
+            raise InternalError(data)
+        return response
 
-    def on_update(self) -> Callable[["HandlerCallback[Update]"], None]:
+    async def _request(
+        self,
+        method: str,
+        *args: Any,
+        timeout: Optional[int] = None,
+    ) -> Any:
+        response = await self._post(method, args, timeout)
+        if response.headers.get("content-type") == "application/json":
+            return self._codec.decode(await response.read())
+        else:
+            return response.content.iter_chunks()
+
+    async def _stream(
+        self,
+        method: str,
+        *args: Any,
+        timeout: Optional[int] = None,
+    ) -> AsyncGenerator[Any, None]:
+        """Yield the elements of a JSON array response as they arrive.
+
+        Generators that stop iterating it must close it, or the response is only
+        released once it is garbage collected.
+        """
+        response = await self._post(method, args, timeout)
+        splitter = ArraySplitter()
+        try:
+            async for chunk in response.content.iter_any():
+                for element in splitter.feed(chunk):
+                    yield self._codec.decode(element)
+        finally:
+            response.release()
+
+    def executor_stats(self) -> ExecutorStats:
+        """Return statistics of the thread pool running synchronous handlers."""
+        return self._executor.stats()
+
+    def connection_stats(self) -> ConnectionStats:
+        """Return how many connections to the server have been opened and
+        reused, and how long requests have waited for a free one."""
+        return self._connection_tracer.stats()
+
+    def poll_stats(self) -> BackoffStats:
+        """Return the failures of polling for updates and the state of its
+        circuit breaker."""
+        return self._backoff.stats()
+
+    def handler_stats(self) -> list[HandlerStats]:
+        """Return the call statistics of every handler, in the order they were
+        added."""
+        return [handler.stats for handler in self._handlers]
+
+    def slow_calls(self) -> list[SlowCall]:
+        """Return the most recent handler calls that took at least
+        `slow_call_threshold` seconds, oldest first."""
+        return list(self._slow_calls)
+
+    def run_threadsafe(
+        self, coroutine: Coroutine[Any, Any, R], timeout: Optional[float] = None
+    ) -> R:
+        """Run a coroutine, such as a call of a client method, on the client's
+        event loop and wait for its result.
+
+        This is meant for synchronous handlers, which run outside of the event
+        loop's thread.
+        """
+        loop = self._executor.loop
+        if loop is None:
+            coroutine.close()
+            raise RuntimeError("No synchronous handler has been run yet")
+        try:
+            running_loop: Optional[asyncio.AbstractEventLoop] = (
+                asyncio.get_running_loop()
+            )
+        except RuntimeError:
+            running_loop = None
+        if running_loop is loop:
+            coroutine.close()
+            raise RuntimeError("run_threadsafe cannot be called from the event loop")
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result(timeout)
+
+    def add_handler(
+        self, handler: "AnyHandler", *, timeout: Optional[float] = None
+    ) -> None:
+        """Add a handler. With `timeout`, its calls are cancelled once they
+        have run for that many seconds, instead of after the client's
+        `handler_timeout`."""
+        if timeout is not None:
+            handler.timeout = timeout
+        self._handlers.append(handler)
+        self._handlers_by_type.clear()
+        if handler.update_type is None:
+            self._handled_types = None
+        elif self._handled_types is not None:
+            update_type = handler.update_type
+            self._handled_types |= {
+                t for t in get_args(Update) if issubclass(t, update_type)
+            }
+
+    def _handlers_of(self, update_type: type[Update]) -> list["AnyHandler"]:
+        handlers = self._handlers_by_type.get(update_type)
+        if handlers is None:
+            handlers = self._handlers_by_type[update_type] = [
+                handler
+                for handler in self._handlers
+                if handler.update_type is None
+                or issubclass(update_type, handler.update_type)
+            ]
+        return handlers
+
+    def on_update(
+        self, *, timeout: Optional[float] = None
+    ) -> Callable[["HandlerCallback[Update]"], None]:
         def decorator(callback: HandlerCallback[Update]) -> None:
-            self.add_handler(Handler(lambda _: True, callback))
+            self.add_handler(Handler(lambda _: True, callback), timeout=timeout)
 
         return decorator
 
     def on_new_message(
-        self, filter_: Optional[Filter] = None
+        self, filter_: Optional[Filter] = None, *, timeout: Optional[float] = None
     ) -> Callable[["HandlerCallback[Any]"], None]:
         def decorator(callback: HandlerCallback[Any]) -> None:
-            self.add_handler(NewMessageHandler(callback, filter_))
+            self.add_handler(NewMessageHandler(callback, filter_), timeout=timeout)
 
         return decorator
 
     def on_edited_message(
-        self, filter_: Optional[Filter] = None
+        self, filter_: Optional[Filter] = None, *, timeout: Optional[float] = None
     ) -> Callable[["HandlerCallback[Any]"], None]:
         def decorator(callback: HandlerCallback[Any]) -> None:
-            self.add_handler(EditedMessageHandler(callback, filter_))
+            self.add_handler(EditedMessageHandler(callback, filter_), timeout=timeout)
 
         return decorator
 
     def on_deleted_messages(
-        self,
+        self, *, timeout: Optional[float] = None
     ) -> Callable[["HandlerCallback[UpdateMessagesDeleted]"], None]:
         def decorator(callback: HandlerCallback[UpdateMessagesDeleted]) -> None:
-            self.add_handler(DeletedMessagesHandler(callback))
+            self.add_handler(DeletedMessagesHandler(callback), timeout=timeout)
 
         return decorator
 
-    def on_callback_query(self) -> Callable[["HandlerCallback[CallbackQuery]"], None]:
+    def on_callback_query(
+        self, *, timeout: Optional[float] = None
+    ) -> Callable[["HandlerCallback[CallbackQuery]"], None]:
         def decorator(callback: HandlerCallback[CallbackQuery]) -> None:
-            self.add_handler(CallbackQueryHandler(callback))
+            self.add_handler(CallbackQueryHandler(callback), timeout=timeout)
 
         return decorator
 
-    def on_inline_query(self) -> Callable[["HandlerCallback[InlineQuery]"], None]:
+    def on_inline_query(
+        self, debounce: Optional[float] = None, *, timeout: Optional[float] = None
+    ) -> Callable[["HandlerCallback[InlineQuery]"], None]:
         def decorator(callback: HandlerCallback[InlineQuery]) -> None:
-            self.add_handler(InlineQueryHandler(callback))
+            self.add_handler(InlineQueryHandler(callback, debounce), timeout=timeout)
 
         return decorator
 
     def on_chosen_inline_result(
-        self,
+        self, *, timeout: Optional[float] = None
     ) -> Callable[["HandlerCallback[ChosenInlineResult]"], None]:
         def decorator(callback: HandlerCallback[ChosenInlineResult]) -> None:
-            self.add_handler(ChosenInlineResultHandler(callback))
+            self.add_handler(ChosenInlineResultHandler(callback), timeout=timeout)
 
         return decorator
 
-    def on_new_chat(self) -> Callable[["HandlerCallback[ChatListItem]"], None]:
+    def on_new_chat(
+        self, *, timeout: Optional[float] = None
+    ) -> Callable[["HandlerCallback[ChatListItem]"], None]:
         def decorator(callback: HandlerCallback[ChatListItem]) -> None:
-            self.add_handler(NewChatHandler(callback))
+            self.add_handler(NewChatHandler(callback), timeout=timeout)
 
         return decorator
 
-    def on_edited_chat(self) -> Callable[["HandlerCallback[ChatListItem]"], None]:
+    def on_edited_chat(
+        self, *, timeout: Optional[float] = None
+    ) -> Callable[["HandlerCallback[ChatListItem]"], None]:
         def decorator(callback: HandlerCallback[ChatListItem]) -> None:
-            self.add_handler(EditedChatHandler(callback))
+            self.add_handler(EditedChatHandler(callback), timeout=timeout)
 
         return decorator
 
-    def on_deleted_chat(self) -> Callable[["HandlerCallback[int]"], None]:
+    def on_deleted_chat(
+        self, *, timeout: Optional[float] = None
+    ) -> Callable[["HandlerCallback[int]"], None]:
         def decorator(callback: HandlerCallback[int]) -> None:
-            self.add_handler(DeletedChatHandler(callback))
+            self.add_handler(DeletedChatHandler(callback), timeout=timeout)
 
         return decorator
 
     def on_message_interactions(
-        self,
+        self, *, timeout: Optional[float] = None
     ) -> Callable[["HandlerCallback[MessageInteractions]"], None]:
         def decorator(callback: HandlerCallback[MessageInteractions]) -> None:
-            self.add_handler(MessageInteractionsHandler(callback))
+            self.add_handler(MessageInteractionsHandler(callback), timeout=timeout)
 
         return decorator
 
     def on_message_reaction_count(
-        self,
+        self, *, timeout: Optional[float] = None
     ) -> Callable[["HandlerCallback[MessageReactionCount]"], None]:
         def decorator(callback: HandlerCallback[MessageReactionCount]) -> None:
-            self.add_handler(MessageReactionCountHandler(callback))
+            self.add_handler(MessageReactionCountHandler(callback), timeout=timeout)
 
         return decorator
 
     def on_message_reactions(
-        self,
+        self, *, timeout: Optional[float] = None
     ) -> Callable[["HandlerCallback[MessageReactions]"], None]:
         def decorator(callback: HandlerCallback[MessageReactions]) -> None:
-            self.add_handler(MessageReactionsHandler(callback))
+            self.add_handler(MessageReactionsHandler(callback), timeout=timeout)
 
         return decorator
 
-    def on_chat_member(self) -> Callable[["HandlerCallback[ChatMemberUpdated]"], None]:
+    def on_chat_member(
+        self, *, timeout: Optional[float] = None
+    ) -> Callable[["HandlerCallback[ChatMemberUpdated]"], None]:
         def decorator(callback: HandlerCallback[ChatMemberUpdated]) -> None:
-            self.add_handler(ChatMemberHandler(callback))
+            self.add_handler(ChatMemberHandler(callback), timeout=timeout)
 
         return decorator
 
     def on_my_chat_member(
-        self,
+        self, *, timeout: Optional[float] = None
     ) -> Callable[["HandlerCallback[ChatMemberUpdated]"], None]:
         def decorator(callback: HandlerCallback[ChatMemberUpdated]) -> None:
-            self.add_handler(MyChatMemberHandler(callback))
+            self.add_handler(MyChatMemberHandler(callback), timeout=timeout)
 
         return decorator
 
-    def on_deleted_story(self) -> Callable[["HandlerCallback[StoryReference]"], None]:
+    def on_deleted_story(
+        self, *, timeout: Optional[float] = None
+    ) -> Callable[["HandlerCallback[StoryReference]"], None]:
         def decorator(callback: HandlerCallback[StoryReference]) -> None:
-            self.add_handler(DeletedStoryHandler(callback))
+            self.add_handler(DeletedStoryHandler(callback), timeout=timeout)
 
         return decorator
 
-    def on_new_story(self) -> Callable[["HandlerCallback[Story]"], None]:
+    def on_new_story(
+        self, *, timeout: Optional[float] = None
+    ) -> Callable[["HandlerCallback[Story]"], None]:
         def decorator(callback: HandlerCallback[Story]) -> None:
-            self.add_handler(NewStoryHandler(callback))
+            self.add_handler(NewStoryHandler(callback), timeout=timeout)
 
         return decorator
 
     def on_business_connection(
-        self,
+        self, *, timeout: Optional[float] = None
     ) -> Callable[["HandlerCallback[BusinessConnection]"], None]:
         def decorator(callback: HandlerCallback[BusinessConnection]) -> None:
-            self.add_handler(BusinessConnectionHandler(callback))
+            self.add_handler(BusinessConnectionHandler(callback), timeout=timeout)
 
         return decorator
 
-    def on_video_chat(self) -> Callable[["HandlerCallback[VideoChat]"], None]:
+    def on_video_chat(
+        self, *, timeout: Optional[float] = None
+    ) -> Callable[["HandlerCallback[VideoChat]"], None]:
         def decorator(callback: HandlerCallback[VideoChat]) -> None:
-            self.add_handler(VideoChatHandler(callback))
+            self.add_handler(VideoChatHandler(callback), timeout=timeout)
 
         return decorator
 
     def on_pre_checkout_query(
-        self,
+        self, *, timeout: Optional[float] = None
     ) -> Callable[["HandlerCallback[PreCheckoutQuery]"], None]:
         def decorator(callback: HandlerCallback[PreCheckoutQuery]) -> None:
-            self.add_handler(PreCheckoutQueryHandler(callback))
+            self.add_handler(PreCheckoutQueryHandler(callback), timeout=timeout)
 
         return decorator
 
     def on_join_request(
-        self,
+        self, *, timeout: Optional[float] = None
     ) -> Callable[["HandlerCallback[JoinRequest]"], None]:
         def decorator(callback: HandlerCallback[JoinRequest]) -> None:
-            self.add_handler(JoinRequestHandler(callback))
+            self.add_handler(JoinRequestHandler(callback), timeout=timeout)
 
         return decorator
 
-    async def get_updates(self, timeout: Optional[int] = None) -> list[Update]:
-        return to(
-            list[Update], await self._request("getUpdates", timeout=timeout), self
-        )
+    async def get_updates(
+        self,
+        timeout: Optional[int] = None,
+        *,
+        lazy: bool = False,
+        types: Optional[Collection[type[Update]]] = None,
+    ) -> list[Update]:
+        """Fetch pending updates.
+
+        With `lazy`, only the type of each update is resolved up front; its
+        fields, and theirs, are decoded when they are first accessed.
+
+        With `types`, updates of other types are dropped as soon as their
+        type is resolved, without being decoded.
+        """
+        updates = await self._request("getUpdates", timeout=timeout)
+        if types is None:
+            return to(list[Update], updates, self, lazy)
+        dispatch = union_dispatch(Update)
+        decoded = []
+        for update in updates:
+            type_ = dispatch.resolve(update)
+            if type_ in types:
+                decoded.append(decoder_of(type_, lazy)(update, self))
+        return decoded
+
+    async def iter_updates(
+        self,
+        timeout: Optional[int] = None,
+        *,
+        lazy: bool = False,
+        types: Optional[Collection[type[Update]]] = None,
+    ) -> AsyncGenerator[Update, None]:
+        """Like `get_updates`, but yield each update as soon as it is received."""
+        decoder = decoder_of(Update, lazy)
+        dispatch = union_dispatch(Update)
+        stream = self._stream("getUpdates", timeout=timeout)
+        try:
+            async for update in stream:
+                if types is None:
+                    yield decoder(update, self)
+                elif (type_ := dispatch.resolve(update)) in types:
+                    yield decoder_of(type_, lazy)(update, self)
+        finally:
+            await stream.aclose()
 
     async def invoke(self, payload: Any) -> Any:
-        return await self._request("invoke", payload)
+        return transform(await self._request("invoke", payload))
 
     ########################### MESSAGES ########################
     async def send_scheduled_messages(
@@ -1220,6 +1643,37 @@ class Client:
             self,
         )
 
+    async def iter_search_messages(
+        self,
+        chat_id: ID,
+        *,
+        query: Optional[str] = "",
+        from_user: Optional[ID] = None,
+        filter: Optional[MessageSearchFilter] = None,
+        after: Optional[int] = None,
+        thread_id: Optional[int] = None,
+        limit: Optional[int] = 100,
+    ) -> AsyncGenerator[Message, None]:
+        """Like `search_messages`, but yield each message as soon as it is received."""
+        decoder = decoder_of(Message)
+        stream = self._stream(
+            "searchMessages",
+            chat_id,
+            query,
+            {
+                "from": from_user,
+                "filter": filter,
+                "after": after,
+                "threadId": thread_id,
+                "limit": limit,
+            },
+        )
+        try:
+            async for message in stream:
+                yield decoder(message, self)
+        finally:
+            await stream.aclose()
+
     async def pin_message(
         self,
         chat_id: ID,
@@ -2080,6 +2534,24 @@ class Client:
             self,
         )
 
+    async def iter_chats(
+        self,
+        *,
+        from_chat_list: Optional[Literal["main", "archived"]] = None,
+        after: Optional[ChatListItem] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncGenerator[ChatListItem, None]:
+        """Like `get_chats`, but yield each chat as soon as it is received."""
+        decoder = decoder_of(ChatListItem)
+        stream = self._stream(
+            "getChats", {"from": from_chat_list, "after": after, "limit": limit}
+        )
+        try:
+            async for chat in stream:
+                yield decoder(chat, self)
+        finally:
+            await stream.aclose()
+
     async def get_created_invite_links(
         self,
         chat_id: ID,
@@ -2121,6 +2593,22 @@ class Client:
             self,
         )
 
+    async def iter_history(
+        self,
+        chat_id: ID,
+        *,
+        after: Optional[Message] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncGenerator[Message, None]:
+        """Like `get_history`, but yield each message as soon as it is received."""
+        decoder = decoder_of(Message)
+        stream = self._stream("getHistory", chat_id, {"after": after, "limit": limit})
+        try:
+            async for message in stream:
+                yield decoder(message, self)
+        finally:
+            await stream.aclose()
+
     async def get_inactive_chats(
         self,
     ) -> List[InactiveChat]:
@@ -2244,6 +2732,20 @@ class Client:
             self,
         )
 
+    async def iter_chat_members(
+        self, chat_id: ID, *, offset: Optional[int] = None, limit: Optional[int] = None
+    ) -> AsyncGenerator[ChatMember, None]:
+        """Like `get_chat_members`, but yield each member as soon as it is received."""
+        decoder = decoder_of(ChatMember)
+        stream = self._stream(
+            "getChatMembers", chat_id, {"offset": offset, "limit": limit}
+        )
+        try:
+            async for member in stream:
+                yield decoder(member, self)
+        finally:
+            await stream.aclose()
+
     async def create_gorup(
         self,
         title: str,
@@ -2293,13 +2795,44 @@ class Client:
 
 
 T = TypeVar("T")
-HandlerCallback = Callable[[Client, T], Coroutine[Any, Any, None]]
+HandlerCallback = Callable[[Client, T], Optional[Coroutine[Any, Any, None]]]
+"""A coroutine function, or a plain function that is run on the client's
+thread pool."""
+
+
+def _asynchronous(
+    callback: HandlerCallback[T],
+) -> Callable[[Client, T], Awaitable[None]]:
+    if asyncio.iscoroutinefunction(callback) or asyncio.iscoroutinefunction(
+        getattr(callback, "__call__", None)
+    ):
+        return cast(Callable[[Client, T], Awaitable[None]], callback)
+
+    @functools.wraps(callback)
+    async def run_in_executor(client: Client, value: T) -> None:
+        result = await client._executor.run(callback, client, value)
+        # such as a lambda that returns the coroutine of a client method
+        if inspect.isawaitable(result):
+            await result
+
+    return run_in_executor
 
 
 class Handler(Generic[T]):
-    def __init__(self, filter_: Callable[[Update], bool], callback: HandlerCallback[T]):
+    def __init__(
+        self,
+        filter_: Callable[[Update], bool],
+        callback: HandlerCallback[T],
+        update_type: Optional[type[Update]] = None,
+    ):
         self.filter = filter_
-        self.callback = callback
+        self.callback = _asynchronous(callback)
+        self.update_type = update_type
+        self.timeout: Optional[float] = None
+        self.debounce: Optional[float] = None
+        self.stats = HandlerStats(
+            getattr(callback, "__qualname__", None) or repr(callback)
+        )
 
 
 AnyHandler = Handler[Any]
@@ -2309,16 +2842,18 @@ class NewMessageHandler(Handler[UpdateNewMessage]):
     def __init__(
         self, callback_: HandlerCallback[Any], filter_: Optional[Filter] = None
     ):
+        run = _asynchronous(callback_)
+
+        @functools.wraps(callback_)
         async def callback(client: Client, update: UpdateNewMessage) -> None:
-            await callback_(client, update.message)
+            await run(client, update.message)
 
         super().__init__(
-            lambda update: (
-                isinstance(update, UpdateNewMessage) and True
-                if filter_ is None
-                else filter_(cast(UpdateNewMessage, update).message)
-            ),
+            (lambda _: True)
+            if filter_ is None
+            else lambda update: filter_(cast(UpdateNewMessage, update).message),
             callback,
+            UpdateNewMessage,
         )
 
 
@@ -2326,178 +2861,226 @@ class EditedMessageHandler(Handler[UpdateMessageEdited]):
     def __init__(
         self, callback_: HandlerCallback[Any], filter_: Optional[Filter] = None
     ):
+        run = _asynchronous(callback_)
+
+        @functools.wraps(callback_)
         async def callback(client: Client, update: UpdateMessageEdited) -> None:
-            await callback_(client, update.edited_message)
+            await run(client, update.edited_message)
 
         super().__init__(
-            lambda update: (
-                isinstance(update, UpdateMessageEdited) and True
-                if filter_ is None
-                else filter_(cast(UpdateMessageEdited, update).edited_message)
+            (lambda _: True)
+            if filter_ is None
+            else lambda update: filter_(
+                cast(UpdateMessageEdited, update).edited_message
             ),
             callback,
+            UpdateMessageEdited,
         )
 
 
 class DeletedMessagesHandler(Handler[UpdateMessagesDeleted]):
     def __init__(self, callback_: HandlerCallback[UpdateMessagesDeleted]):
+        run = _asynchronous(callback_)
+
+        @functools.wraps(callback_)
         async def callback(client: Client, update: UpdateMessagesDeleted) -> None:
-            await callback_(client, update)
+            await run(client, update)
 
-        super().__init__(
-            lambda update: isinstance(update, UpdateMessagesDeleted), callback
-        )
+        super().__init__(lambda _: True, callback, UpdateMessagesDeleted)
 
 
 class CallbackQueryHandler(Handler[UpdateCallbackQuery]):
     def __init__(self, callback_: HandlerCallback[CallbackQuery]):
+        run = _asynchronous(callback_)
+
+        @functools.wraps(callback_)
         async def callback(client: Client, update: UpdateCallbackQuery) -> None:
-            await callback_(client, update.callback_query)
+            await run(client, update.callback_query)
 
-        super().__init__(
-            lambda update: isinstance(update, UpdateCallbackQuery), callback
-        )
+        super().__init__(lambda _: True, callback, UpdateCallbackQuery)
 
 
 class InlineQueryHandler(Handler[UpdateInlineQuery]):
-    def __init__(self, callback_: HandlerCallback[InlineQuery]):
+    """With `debounce`, the callback is run only once no newer inline query
+    from the same user has arrived for that many seconds, and a newer query
+    cancels the callback still running for an older one.
+    """
+
+    def __init__(
+        self,
+        callback_: HandlerCallback[InlineQuery],
+        debounce: Optional[float] = None,
+    ):
+        run = _asynchronous(callback_)
+
+        @functools.wraps(callback_)
         async def callback(client: Client, update: UpdateInlineQuery) -> None:
-            await callback_(client, update.inline_query)
+            await run(client, update.inline_query)
 
-        super().__init__(lambda update: isinstance(update, UpdateInlineQuery), callback)
+        super().__init__(lambda _: True, callback, UpdateInlineQuery)
+        self.debounce = debounce
 
 
 class ChosenInlineResultHandler(Handler[UpdateChosenInlineResult]):
     def __init__(self, callback_: HandlerCallback[ChosenInlineResult]):
+        run = _asynchronous(callback_)
+
+        @functools.wraps(callback_)
         async def callback(client: Client, update: UpdateChosenInlineResult) -> None:
-            await callback_(client, update.chosen_inline_result)
+            await run(client, update.chosen_inline_result)
 
-        super().__init__(
-            lambda update: isinstance(update, UpdateChosenInlineResult), callback
-        )
+        super().__init__(lambda _: True, callback, UpdateChosenInlineResult)
 
 
 class NewChatHandler(Handler[UpdateNewChat]):
     def __init__(self, callback_: HandlerCallback[ChatListItem]):
+        run = _asynchronous(callback_)
+
+        @functools.wraps(callback_)
         async def callback(client: Client, update: UpdateNewChat) -> None:
-            await callback_(client, update.new_chat)
+            await run(client, update.new_chat)
 
-        super().__init__(lambda update: isinstance(update, UpdateNewChat), callback)
+        super().__init__(lambda _: True, callback, UpdateNewChat)
 
 
 class EditedChatHandler(Handler[UpdateEditedChat]):
     def __init__(self, callback_: HandlerCallback[ChatListItem]):
+        run = _asynchronous(callback_)
+
+        @functools.wraps(callback_)
         async def callback(client: Client, update: UpdateEditedChat) -> None:
-            await callback_(client, update.edited_chat)
+            await run(client, update.edited_chat)
 
-        super().__init__(lambda update: isinstance(update, UpdateEditedChat), callback)
+        super().__init__(lambda _: True, callback, UpdateEditedChat)
 
 
 class DeletedChatHandler(Handler[UpdateDeletedChat]):
     def __init__(self, callback_: HandlerCallback[int]):
+        run = _asynchronous(callback_)
+
+        @functools.wraps(callback_)
         async def callback(client: Client, update: UpdateDeletedChat) -> None:
-            await callback_(client, update.deleted_chat.chat_id)
+            await run(client, update.deleted_chat.chat_id)
 
-        super().__init__(lambda update: isinstance(update, UpdateDeletedChat), callback)
+        super().__init__(lambda _: True, callback, UpdateDeletedChat)
 
 
 class MessageInteractionsHandler(Handler[UpdateMessageInteractions]):
     def __init__(self, callback_: HandlerCallback[MessageInteractions]):
+        run = _asynchronous(callback_)
+
+        @functools.wraps(callback_)
         async def callback(client: Client, update: UpdateMessageInteractions) -> None:
-            await callback_(client, update.message_interactions)
+            await run(client, update.message_interactions)
 
-        super().__init__(
-            lambda update: isinstance(update, UpdateMessageInteractions), callback
-        )
+        super().__init__(lambda _: True, callback, UpdateMessageInteractions)
 
 
 class MessageReactionCountHandler(Handler[UpdateMessageReactionCount]):
     def __init__(self, callback_: HandlerCallback[MessageReactionCount]):
+        run = _asynchronous(callback_)
+
+        @functools.wraps(callback_)
         async def callback(client: Client, update: UpdateMessageReactionCount) -> None:
-            await callback_(client, update.message_reaction_count)
+            await run(client, update.message_reaction_count)
 
-        super().__init__(
-            lambda update: isinstance(update, UpdateMessageReactionCount), callback
-        )
+        super().__init__(lambda _: True, callback, UpdateMessageReactionCount)
 
 
 class MessageReactionsHandler(Handler[UpdateMessageReactions]):
     def __init__(self, callback_: HandlerCallback[MessageReactions]):
+        run = _asynchronous(callback_)
+
+        @functools.wraps(callback_)
         async def callback(client: Client, update: UpdateMessageReactions) -> None:
-            await callback_(client, update.message_reactions)
+            await run(client, update.message_reactions)
 
-        super().__init__(
-            lambda update: isinstance(update, UpdateMessageReactions), callback
-        )
+        super().__init__(lambda _: True, callback, UpdateMessageReactions)
 
 
 class ChatMemberHandler(Handler[UpdateChatMember]):
     def __init__(self, callback_: HandlerCallback[ChatMemberUpdated]):
+        run = _asynchronous(callback_)
+
+        @functools.wraps(callback_)
         async def callback(client: Client, update: UpdateChatMember) -> None:
-            await callback_(client, update.chat_member)
+            await run(client, update.chat_member)
 
-        super().__init__(lambda update: isinstance(update, UpdateChatMember), callback)
+        super().__init__(lambda _: True, callback, UpdateChatMember)
 
 
 class MyChatMemberHandler(Handler[UpdateMyChatMember]):
     def __init__(self, callback_: HandlerCallback[ChatMemberUpdated]):
+        run = _asynchronous(callback_)
+
+        @functools.wraps(callback_)
         async def callback(client: Client, update: UpdateMyChatMember) -> None:
-            await callback_(client, update.my_chat_member)
+            await run(client, update.my_chat_member)
 
-        super().__init__(
-            lambda update: isinstance(update, UpdateMyChatMember), callback
-        )
+        super().__init__(lambda _: True, callback, UpdateMyChatMember)
 
 
 class DeletedStoryHandler(Handler[UpdateDeletedStory]):
     def __init__(self, callback_: HandlerCallback[StoryReference]):
+        run = _asynchronous(callback_)
+
+        @functools.wraps(callback_)
         async def callback(client: Client, update: UpdateDeletedStory) -> None:
-            await callback_(client, update.deleted_story)
+            await run(client, update.deleted_story)
 
-        super().__init__(
-            lambda update: isinstance(update, UpdateDeletedStory), callback
-        )
+        super().__init__(lambda _: True, callback, UpdateDeletedStory)
 
 
 class NewStoryHandler(Handler[UpdateNewStory]):
     def __init__(self, callback_: HandlerCallback[Story]):
+        run = _asynchronous(callback_)
+
+        @functools.wraps(callback_)
         async def callback(client: Client, update: UpdateNewStory) -> None:
-            await callback_(client, update.story)
+            await run(client, update.story)
 
-        super().__init__(lambda update: isinstance(update, UpdateNewStory), callback)
+        super().__init__(lambda _: True, callback, UpdateNewStory)
 
 
 class BusinessConnectionHandler(Handler[UpdateBusinessConnection]):
     def __init__(self, callback_: HandlerCallback[BusinessConnection]):
+        run = _asynchronous(callback_)
+
+        @functools.wraps(callback_)
         async def callback(client: Client, update: UpdateBusinessConnection) -> None:
-            await callback_(client, update.business_connection)
+            await run(client, update.business_connection)
 
-        super().__init__(
-            lambda update: isinstance(update, UpdateBusinessConnection), callback
-        )
+        super().__init__(lambda _: True, callback, UpdateBusinessConnection)
 
 
 class VideoChatHandler(Handler[UpdateVideoChat]):
     def __init__(self, callback_: HandlerCallback[VideoChat]):
+        run = _asynchronous(callback_)
+
+        @functools.wraps(callback_)
         async def callback(client: Client, update: UpdateVideoChat) -> None:
-            await callback_(client, update.video_chat)
+            await run(client, update.video_chat)
 
-        super().__init__(lambda update: isinstance(update, UpdateVideoChat), callback)
+        super().__init__(lambda _: True, callback, UpdateVideoChat)
 
 
 class PreCheckoutQueryHandler(Handler[UpdatePreCheckoutQuery]):
     def __init__(self, callback_: HandlerCallback[PreCheckoutQuery]):
+        run = _asynchronous(callback_)
+
+        @functools.wraps(callback_)
         async def callback(client: Client, update: UpdatePreCheckoutQuery) -> None:
-            await callback_(client, update.pre_checkout_query)
+            await run(client, update.pre_checkout_query)
 
-        super().__init__(
-            lambda update: isinstance(update, UpdatePreCheckoutQuery), callback
-        )
+        super().__init__(lambda _: True, callback, UpdatePreCheckoutQuery)
 
 
 class JoinRequestHandler(Handler[UpdateJoinRequest]):
     def __init__(self, callback_: HandlerCallback[JoinRequest]):
+        run = _asynchronous(callback_)
+
+        @functools.wraps(callback_)
         async def callback(client: Client, update: UpdateJoinRequest) -> None:
-            await callback_(client, update.join_request)
+            await run(client, update.join_request)
 
-        super().__init__(lambda update: isinstance(update, UpdateJoinRequest), callback)
+        super().__init__(lambda _: True, callback, UpdateJoinRequest)
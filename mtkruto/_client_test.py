@@ -0,0 +1,574 @@
+import asyncio
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Collection, Optional, cast
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from . import filters
+from ._client import (
+    Client,
+    DeletedMessagesHandler,
+    Handler,
+    HandlerCallback,
+    InlineQueryHandler,
+    NewMessageHandler,
+)
+from ._utils import to
+from .backoff import Backoff
+from .errors import InputError
+from .queues import Lane, UpdateQueue
+from .types import (
+    Update,
+    UpdateCallbackQuery,
+    UpdateMessagesDeleted,
+    UpdateNewMessage,
+)
+
+
+class FakeClient(Client):
+    def __init__(self, batches: int, **kwargs: Any) -> None:
+        super().__init__("http://localhost/", **kwargs)
+        self.batches = batches
+        self.polls = 0
+        self.completed_polls = 0
+        self.polls_while_handling: list[int] = []
+        self.overlapping_polls: list[bool] = []
+        self.read_ahead: list[int] = []
+
+    async def get_updates(
+        self,
+        timeout: Optional[int] = None,
+        *,
+        lazy: bool = False,
+        types: Optional[Collection[type[Update]]] = None,
+    ) -> list[Update]:
+        self.polls += 1
+        await asyncio.sleep(0.01 if self.polls <= self.batches else 60)
+        self.completed_polls += 1
+        return [to(Update, {"deletedMessages": []}, self)]
+
+    async def _handle_update(self, update: Update) -> None:
+        # every batch holds one update
+        handled = len(self.polls_while_handling) + 1
+        polls, in_flight = self.polls, self.polls > self.completed_polls
+        self.read_ahead.append(self.completed_polls - handled)
+        await asyncio.sleep(0.05)
+        self.read_ahead.append(self.completed_polls - handled)
+        self.overlapping_polls.append(in_flight or self.polls > polls)
+        self.polls_while_handling.append(self.polls)
+        if len(self.polls_while_handling) == self.batches:
+            self._running = False
+
+
+def run(batches: int, **kwargs: Any) -> FakeClient:
+    async def main() -> FakeClient:
+        client = FakeClient(batches, **kwargs)
+        await client.start()
+        await client._http_client.close()
+        return client
+
+    return asyncio.run(main())
+
+
+def test_start() -> None:
+    assert run(3).polls_while_handling == [1, 2, 3]
+
+
+def test_start_prefetch() -> None:
+    prefetch = 1
+    client = run(3, prefetch=prefetch)
+    # polling goes on while each batch is handled
+    assert all(client.overlapping_polls)
+    # the queue holds at most `prefetch` batches, and the poller one more
+    # that waits for room in it
+    assert max(client.read_ahead) <= prefetch + 1
+    # without prefetching, nothing is polled while handling
+    client = run(3)
+    assert not any(client.overlapping_polls)
+    assert max(client.read_ahead) == 0
+
+
+def test_start_update_queue() -> None:
+    client = run(3, update_queue=UpdateQueue(10))
+    assert len(client.polls_while_handling) == 3
+
+
+def test_start_lanes() -> None:
+    class FloodedClient(Client):
+        async def _poll(self) -> list[Update]:
+            if hasattr(self, "polled"):
+                await asyncio.sleep(60)
+            self.polled = True
+            message = {"message": {"text": "", "entities": []}}
+            updates = [to(Update, message, self) for _ in range(10)]
+            return [*updates, UpdateCallbackQuery.__new__(UpdateCallbackQuery)]
+
+    async def main(update_queue: Optional[UpdateQueue]) -> None:
+        lane = Lane((UpdateCallbackQuery,), workers=1)
+        client = FloodedClient(
+            "http://localhost/", lanes=[lane], update_queue=update_queue
+        )
+        handled: list[str] = []
+        done = asyncio.Event()
+
+        async def on_message(client: Client, message: Any) -> None:
+            await asyncio.sleep(0.01)
+            handled.append("message")
+            if len(handled) == 11:
+                done.set()
+
+        async def on_callback_query(client: Client, update: Any) -> None:
+            handled.append("callback query")
+
+        client.add_handler(NewMessageHandler(on_message))
+        client.add_handler(
+            Handler(lambda _: True, on_callback_query, UpdateCallbackQuery)
+        )
+        start = asyncio.ensure_future(client.start())
+        await asyncio.wait_for(done.wait(), 5)
+        start.cancel()
+        await asyncio.gather(start, return_exceptions=True)
+        await client._http_client.close()
+        assert handled.index("callback query") == 0
+        # the lanes' types are given priority without changing the queue
+        assert update_queue is None or update_queue.priority == ()
+
+    asyncio.run(main(None))
+    asyncio.run(main(UpdateQueue(100)))
+
+
+def test_handlers_of() -> None:
+    async def main() -> None:
+        client = Client("http://localhost/")
+        handled: list[str] = []
+
+        def record(name: str) -> HandlerCallback[Any]:
+            async def callback(client: Client, value: Any) -> None:
+                handled.append(name)
+
+            return callback
+
+        client.add_handler(NewMessageHandler(record("text"), filters.text))
+        client.add_handler(DeletedMessagesHandler(record("deleted")))
+        client.add_handler(Handler(lambda _: True, record("any")))
+        client.add_handler(NewMessageHandler(record("message")))
+
+        deleted = to(Update, {"deletedMessages": []}, client)
+        await client._handle_update(deleted)
+        assert handled == ["deleted", "any"]
+
+        handled.clear()
+        message = to(Update, {"message": {"text": "", "entities": []}}, client)
+        await client._handle_update(message)
+        assert handled == ["text", "any", "message"]
+
+        await client._http_client.close()
+
+    asyncio.run(main())
+
+
+def test_get_updates_types() -> None:
+    class RawClient(Client):
+        async def _request(self, method: str, *args: Any, **kwargs: Any) -> Any:
+            return [
+                {"deletedMessages": []},
+                {"message": {"text": "", "entities": []}},
+                {"messageReactions": {}},
+            ]
+
+    async def main() -> None:
+        client = RawClient("http://localhost/")
+        assert client._handled_types == frozenset()
+        client.add_handler(NewMessageHandler(lambda *_: asyncio.sleep(0)))
+        client.add_handler(DeletedMessagesHandler(lambda *_: asyncio.sleep(0)))
+        assert client._handled_types == {UpdateNewMessage, UpdateMessagesDeleted}
+
+        updates = await client.get_updates(types=client._handled_types)
+        assert [type(u) for u in updates] == [UpdateMessagesDeleted, UpdateNewMessage]
+
+        client.add_handler(Handler(lambda _: True, lambda *_: asyncio.sleep(0)))
+        assert client._handled_types is None
+
+        await client._http_client.close()
+
+    asyncio.run(main())
+
+
+def test_sync_handler() -> None:
+    async def main() -> None:
+        client = Client("http://localhost/")
+        threads: list[int] = []
+
+        async def get_thread() -> int:
+            return threading.get_ident()
+
+        def callback(client: Client, update: UpdateMessagesDeleted) -> None:
+            threads.append(threading.get_ident())
+            threads.append(client.run_threadsafe(get_thread()))
+
+        client.add_handler(DeletedMessagesHandler(callback))
+        await client._handle_update(to(Update, {"deletedMessages": []}, client))
+
+        assert threads[0] != threading.get_ident()
+        assert threads[1] == threading.get_ident()
+        stats = client.executor_stats()
+        assert (stats.queued, stats.running, stats.completed) == (0, 0, 1)
+
+        await client._http_client.close()
+
+    asyncio.run(main())
+
+
+def test_callbacks_returning_awaitables() -> None:
+    async def main() -> None:
+        client = Client("http://localhost/")
+        handled: list[str] = []
+
+        async def record(name: str) -> None:
+            handled.append(name)
+
+        class Callback:
+            async def __call__(self, client: Client, update: Any) -> None:
+                handled.append("object")
+
+        client.add_handler(DeletedMessagesHandler(lambda c, u: record("lambda")))
+        client.add_handler(DeletedMessagesHandler(Callback()))
+        await client._handle_update(to(Update, {"deletedMessages": []}, client))
+
+        assert handled == ["lambda", "object"]
+        # only the lambda is run on the thread pool
+        assert client.executor_stats().completed == 1
+
+        await client._http_client.close()
+
+    asyncio.run(main())
+
+
+def inline_query(user_id: int, query: str) -> Update:
+    from_ = {
+        "id": user_id,
+        "color": 0,
+        "isBot": False,
+        "firstName": "",
+        "isScam": False,
+        "isFake": False,
+        "isPremium": False,
+        "isVerified": False,
+        "isSupport": False,
+        "addedToAttachmentMenu": False,
+    }
+    raw = {"id": query, "from": from_, "query": query, "offset": ""}
+    return to(Update, {"inlineQuery": raw}, None)
+
+
+def test_inline_query_debounce() -> None:
+    async def main() -> None:
+        client = Client("http://localhost/")
+        started: list[str] = []
+        finished: list[str] = []
+
+        async def on_inline_query(client: Client, inline_query: Any) -> None:
+            started.append(inline_query.query)
+            await asyncio.sleep(0.15)
+            finished.append(inline_query.query)
+
+        client.add_handler(InlineQueryHandler(on_inline_query, 0.06))
+        for query in ("a", "ab", "abc"):
+            await client._handle_update(inline_query(1, query))
+            await asyncio.sleep(0.01)
+        await client._handle_update(inline_query(2, "x"))
+        await asyncio.sleep(0.09)
+        # "abc" has started; a newer query cancels it
+        await client._handle_update(inline_query(1, "abcd"))
+        await asyncio.sleep(0.3)
+
+        assert started == ["abc", "x", "abcd"]
+        assert finished == ["x", "abcd"]
+        # the cancelled call of "abc" is recorded too
+        assert client.handler_stats()[0].calls == 3
+        await client._http_client.close()
+
+    asyncio.run(main())
+
+
+def test_inline_query_debounce_deadline() -> None:
+    class InlineClient(Client):
+        async def _poll(self) -> list[Update]:
+            if hasattr(self, "polled"):
+                await asyncio.sleep(0.15)
+                raise InputError("stop")
+            self.polled = True
+            return [inline_query(1, "a"), inline_query(2, "b")]
+
+    async def main() -> None:
+        client = InlineClient("http://localhost/")
+        cancelled: list[str] = []
+
+        async def on_inline_query(client: Client, inline_query: Any) -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(inline_query.query)
+                raise
+
+        client.add_handler(InlineQueryHandler(on_inline_query, 0.01), timeout=0.05)
+        client.add_handler(InlineQueryHandler(on_inline_query, 0.3))
+        with pytest.raises(InputError):
+            await client.start()
+
+        # the first handler's calls time out, and the second's, still waiting
+        # when the client stops, are cancelled
+        timed_out, waiting = client.handler_stats()
+        assert (timed_out.calls, timed_out.timeouts) == (2, 2)
+        assert waiting.calls == 0
+        assert sorted(cancelled) == ["a", "b"]
+        assert not client._debounced
+        await client._http_client.close()
+
+    asyncio.run(main())
+
+
+def test_handler_timeout() -> None:
+    async def main() -> None:
+        client = Client("http://localhost/", handler_timeout=0.05)
+        cancelled: list[bool] = []
+
+        async def hang(client: Client, update: UpdateMessagesDeleted) -> None:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        async def fail(client: Client, update: UpdateMessagesDeleted) -> None:
+            raise ValueError
+
+        async def quick(client: Client, update: UpdateMessagesDeleted) -> None:
+            await asyncio.sleep(0.1)
+
+        client.add_handler(DeletedMessagesHandler(hang))
+        client.add_handler(DeletedMessagesHandler(fail))
+        client.add_handler(DeletedMessagesHandler(quick), timeout=1)
+        update = to(Update, {"deletedMessages": []}, client)
+        for _ in range(2):
+            await client._handle_update(update)
+
+        assert cancelled == [True, True]
+        hang_stats, fail_stats, quick_stats = client.handler_stats()
+        assert hang_stats.name.endswith("hang")
+        assert (hang_stats.calls, hang_stats.timeouts, hang_stats.failures) == (2, 2, 0)
+        assert (fail_stats.calls, fail_stats.timeouts, fail_stats.failures) == (2, 0, 2)
+        assert (quick_stats.calls, quick_stats.timeouts) == (2, 0)
+        assert sum(quick_stats.histogram.values()) == 2
+        assert quick_stats.histogram[0.5] == 2
+
+        await client._http_client.close()
+
+    asyncio.run(main())
+
+
+def test_handler_timeout_error() -> None:
+    async def main() -> None:
+        client = Client("http://localhost/")
+
+        async def callback(client: Client, update: UpdateMessagesDeleted) -> None:
+            raise asyncio.TimeoutError
+
+        client.add_handler(DeletedMessagesHandler(callback))
+        client.add_handler(DeletedMessagesHandler(callback), timeout=1)
+        await client._handle_update(to(Update, {"deletedMessages": []}, client))
+
+        # a TimeoutError raised by the callback is a failure, whether or not
+        # the handler has a deadline
+        for stats in client.handler_stats():
+            assert (stats.calls, stats.timeouts, stats.failures) == (1, 0, 1)
+
+        await client._http_client.close()
+
+    asyncio.run(main())
+
+
+def test_slow_calls() -> None:
+    async def main() -> None:
+        client = Client("http://localhost/", slow_call_threshold=0.05, slow_calls=2)
+
+        async def callback(client: Client, update: UpdateMessagesDeleted) -> None:
+            await asyncio.sleep(0.06 if update.deleted_messages else 0)
+
+        client.add_handler(DeletedMessagesHandler(callback))
+        for deleted in ([], [1], [2], [3]):
+            messages = [{"chatId": -100, "messageId": i} for i in deleted]
+            await client._handle_update(
+                to(Update, {"deletedMessages": messages}, client)
+            )
+
+        slow_calls = client.slow_calls()
+        assert len(slow_calls) == 2
+        assert all(call.handler.endswith("callback") for call in slow_calls)
+        assert all(call.update_type == "UpdateMessagesDeleted" for call in slow_calls)
+        assert all(call.chat_id == -100 for call in slow_calls)
+        assert all(call.duration >= 0.05 for call in slow_calls)
+
+        await client._http_client.close()
+
+    asyncio.run(main())
+
+
+def test_poll_backoff() -> None:
+    class FailingClient(Client):
+        failures = 2
+
+        async def get_updates(self, *args: Any, **kwargs: Any) -> list[Update]:
+            if self.failures:
+                self.failures -= 1
+                raise ConnectionError("refused")
+            return []
+
+    async def main() -> None:
+        client = FailingClient(
+            "http://localhost/", backoff=Backoff(0.01, jitter=0, threshold=2)
+        )
+        for _ in range(2):
+            assert await client._poll() == []
+        stats = client.poll_stats()
+        # the retry is due once _poll returns
+        assert (stats.state, stats.failures, stats.delay) == ("half_open", 2, 0.02)
+        assert stats.last_error == "ConnectionError: refused"
+
+        await client._poll()
+        assert client.poll_stats().state == "closed"
+
+        await client._http_client.close()
+
+    asyncio.run(main())
+
+
+def test_connection_stats() -> None:
+    async def get_me(request: web.Request) -> web.Response:
+        await asyncio.sleep(0.01)
+        # the client only decodes responses of exactly this content type
+        return web.Response(body=b'{"id": 1}', content_type="application/json")
+
+    async def main() -> None:
+        app = web.Application()
+        app.router.add_post("/getMe", get_me)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        client = Client(f"http://127.0.0.1:{port}/", max_connections=1)
+        try:
+            results = await asyncio.gather(
+                *(client._request("getMe") for _ in range(3))
+            )
+            assert results == [{"id": 1}] * 3
+            stats = client.connection_stats()
+            assert (stats.created, stats.reused, stats.queued) == (1, 2, 2)
+            assert stats.max_queue_wait >= stats.mean_queue_wait > 0
+        finally:
+            await client._http_client.close()
+            await runner.cleanup()
+
+    asyncio.run(main())
+
+
+def test_stream(monkeypatch: pytest.MonkeyPatch) -> None:
+    released: list[aiohttp.ClientResponse] = []
+    release = aiohttp.ClientResponse.release
+
+    def record_release(response: aiohttp.ClientResponse) -> Any:
+        released.append(response)
+        return release(response)
+
+    monkeypatch.setattr(aiohttp.ClientResponse, "release", record_release)
+    updates = [{"deletedMessages": [{"chatId": i, "messageId": i}]} for i in range(50)]
+
+    async def get_updates(request: web.Request) -> web.StreamResponse:
+        response = web.StreamResponse(headers={"content-type": "application/json"})
+        await response.prepare(request)
+        encoded = json.dumps(updates).encode()
+        # chunks that split the elements at arbitrary points
+        for i in range(0, len(encoded), 37):
+            await response.write(encoded[i : i + 37])
+        await response.write_eof()
+        return response
+
+    async def get_me(request: web.Request) -> web.Response:
+        return web.Response(body=b'{"id": 1}', content_type="application/json")
+
+    async def get_chats(request: web.Request) -> web.Response:
+        return web.Response(
+            status=400, body=b'"bad request"', headers={"x-error-type": "input"}
+        )
+
+    async def main() -> None:
+        app = web.Application()
+        app.router.add_post("/getUpdates", get_updates)
+        app.router.add_post("/getMe", get_me)
+        app.router.add_post("/getChats", get_chats)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        # with one connection, a response that is never released would block
+        # every later request
+        client = Client(f"http://127.0.0.1:{port}/", max_connections=1)
+        try:
+            received = [update async for update in client.iter_updates()]
+            assert [
+                cast(UpdateMessagesDeleted, u).deleted_messages[0].message_id
+                for u in received
+            ] == list(range(50))
+
+            assert len(released) == 1
+
+            stream = client.iter_updates()
+            async for update in stream:
+                assert isinstance(update, UpdateMessagesDeleted)
+                break
+            await stream.aclose()
+            # released as soon as the iteration is closed
+            assert len(released) == 2
+            await asyncio.wait_for(client._request("getMe"), 5)
+
+            with pytest.raises(InputError):
+                async for _ in client.iter_chats():
+                    pass
+            await asyncio.wait_for(client._request("getMe"), 5)
+        finally:
+            await client._http_client.close()
+            await runner.cleanup()
+
+    asyncio.run(main())
+
+
+def test_unix_endpoint() -> None:
+    async def get_me(request: web.Request) -> web.Response:
+        return web.Response(body=b'{"id": 1}', content_type="application/json")
+
+    async def main(path: str, url_path: str) -> None:
+        app = web.Application()
+        app.router.add_post(f"{url_path}/getMe", get_me)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        await web.UnixSite(runner, path).start()
+        client = Client(f"unix://{path}:{url_path}" if url_path else f"unix://{path}")
+        try:
+            assert await client._request("getMe") == {"id": 1}
+            assert client.connection_stats().created == 1
+        finally:
+            await client._http_client.close()
+            await runner.cleanup()
+
+    with tempfile.TemporaryDirectory() as directory:
+        asyncio.run(main(os.path.join(directory, "mtkruto.sock"), "/bot123"))
+        # neither the socket path nor the token ends at a ":"
+        asyncio.run(main(os.path.join(directory, "mt:kruto.sock"), "/bot123:abc"))
+        asyncio.run(main(os.path.join(directory, "mt:kruto2.sock"), ""))
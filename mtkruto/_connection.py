@@ -0,0 +1,100 @@
+import time
+from types import SimpleNamespace
+from typing import Any, NamedTuple, Optional, Tuple
+
+import aiohttp
+
+
+def connector_of(
+    endpoint_url: str,
+    max_connections: int,
+    max_connections_per_host: int,
+    keepalive_timeout: float,
+    dns_cache_ttl: Optional[int],
+) -> Tuple[str, aiohttp.BaseConnector]:
+    """Return the HTTP URL to send requests to and the connector to send them
+    through.
+
+    An endpoint of the form `unix:///path/to.sock`, optionally followed by
+    `:` and a URL path such as `/bot<token>`, is reached through that Unix
+    domain socket. The socket path may contain `:`, but not `:/`.
+    """
+    if not endpoint_url.startswith("unix://"):
+        return endpoint_url, aiohttp.TCPConnector(
+            limit=max_connections,
+            limit_per_host=max_connections_per_host,
+            keepalive_timeout=keepalive_timeout,
+            ttl_dns_cache=dns_cache_ttl,
+        )
+    address = endpoint_url[len("unix://") :]
+    # bot tokens contain ":" too, so only a ":/" ends the socket path
+    i = address.rfind(":/")
+    socket_path, path = (address[:i], address[i + 1 :]) if i >= 0 else (address, "")
+    if not socket_path:
+        raise ValueError(f"No socket path in {endpoint_url!r}")
+    # the host only fills in the Host header
+    return "http://localhost/" + path.lstrip("/"), aiohttp.UnixConnector(
+        socket_path,
+        limit=max_connections,
+        limit_per_host=max_connections_per_host,
+        keepalive_timeout=keepalive_timeout,
+    )
+
+
+class ConnectionStats(NamedTuple):
+    """How the client's connections to the server have been used."""
+
+    created: int
+    """Connections that have been opened."""
+    reused: int
+    """Requests that were sent on a connection opened by an earlier one."""
+    queued: int
+    """Requests that had to wait for a free connection."""
+    mean_queue_wait: float
+    """The mean time, in seconds, that queued requests waited."""
+    max_queue_wait: float
+    """The longest time, in seconds, that a request waited."""
+
+
+class ConnectionTracer:
+    """Counts the connections of a session through its trace hooks."""
+
+    def __init__(self) -> None:
+        self._created = 0
+        self._reused = 0
+        self._queued = 0
+        self._total_queue_wait = 0.0
+        self._max_queue_wait = 0.0
+        self.config = aiohttp.TraceConfig()
+        self.config.on_connection_create_end.append(self._on_create)
+        self.config.on_connection_reuseconn.append(self._on_reuse)
+        self.config.on_connection_queued_start.append(self._on_queued_start)
+        self.config.on_connection_queued_end.append(self._on_queued_end)
+
+    async def _on_create(self, *_: Any) -> None:
+        self._created += 1
+
+    async def _on_reuse(self, *_: Any) -> None:
+        self._reused += 1
+
+    async def _on_queued_start(
+        self, _: aiohttp.ClientSession, context: SimpleNamespace, __: Any
+    ) -> None:
+        context.queued = time.perf_counter()
+
+    async def _on_queued_end(
+        self, _: aiohttp.ClientSession, context: SimpleNamespace, __: Any
+    ) -> None:
+        wait = time.perf_counter() - context.queued
+        self._queued += 1
+        self._total_queue_wait += wait
+        self._max_queue_wait = max(self._max_queue_wait, wait)
+
+    def stats(self) -> ConnectionStats:
+        return ConnectionStats(
+            self._created,
+            self._reused,
+            self._queued,
+            self._total_queue_wait / self._queued if self._queued else 0.0,
+            self._max_queue_wait,
+        )
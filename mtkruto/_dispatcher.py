@@ -0,0 +1,126 @@
+import asyncio
+import logging
+from collections import deque
+from collections.abc import Awaitable, Callable
+from typing import Any, Deque, Dict, Hashable, List, Optional, Tuple
+
+from ._utils import fields_of
+
+log = logging.getLogger(__name__)
+
+_CHAT_ID_PATHS: Tuple[Tuple[str, ...], ...] = (
+    ("chat", "id"),
+    ("chat_id",),
+    ("message", "chat", "id"),
+    ("from_", "id"),
+    ("user", "id"),
+)
+
+
+def chat_key_of(update: Any) -> Optional[int]:
+    """Return the ID of the chat that an update belongs to, if it has one."""
+    fields = fields_of(update.__class__)
+    if not fields:
+        return None
+    value = getattr(update, fields[0][0], None)
+    if isinstance(value, list):
+        value = value[0] if value else None
+    for path in _CHAT_ID_PATHS:
+        id = value
+        for name in path:
+            id = getattr(id, name, None)
+            if id is None:
+                break
+        if isinstance(id, int):
+            return id
+    return None
+
+
+_RAW_CHAT_ID_PATHS: Tuple[Tuple[str, ...], ...] = (
+    ("chat", "id"),
+    ("chatId",),
+    ("message", "chat", "id"),
+    ("from", "id"),
+    ("user", "id"),
+)
+
+
+def raw_chat_key_of(update: Any) -> Optional[int]:
+    """Like `chat_key_of`, but for an update that has not been decoded."""
+    if not isinstance(update, dict) or not update:
+        return None
+    value = next(iter(update.values()))
+    if isinstance(value, list):
+        value = value[0] if value else None
+    for path in _RAW_CHAT_ID_PATHS:
+        id = value
+        for key in path:
+            id = id.get(key) if isinstance(id, dict) else None
+            if id is None:
+                break
+        if isinstance(id, int):
+            return id
+    return None
+
+
+class Dispatcher:
+    """Runs updates on a fixed number of workers, keeping each chat's order.
+
+    Updates of the same chat are handled one after another, in the order
+    they were put; updates of different chats, and updates that do not
+    belong to a chat, are handled concurrently.
+    """
+
+    def __init__(
+        self,
+        handle: Callable[[Any], Awaitable[None]],
+        workers: int,
+        max_pending: int = 1024,
+        key: Callable[[Any], Optional[int]] = chat_key_of,
+    ) -> None:
+        self._handle = handle
+        self._key = key
+        self._pending: Dict[Hashable, Deque[Any]] = {}
+        self._ready: "asyncio.Queue[Hashable]" = asyncio.Queue()
+        self._capacity = asyncio.Semaphore(max_pending)
+        self._workers: List["asyncio.Task[None]"] = [
+            asyncio.ensure_future(self._work()) for _ in range(workers)
+        ]
+
+    async def put(self, update: Any) -> None:
+        """Queue an update, waiting while `max_pending` updates are queued."""
+        await self._capacity.acquire()
+        key: Hashable = self._key(update)
+        if key is None:
+            key = object()
+        if key in self._pending:
+            self._pending[key].append(update)
+        else:
+            self._pending[key] = deque((update,))
+            self._ready.put_nowait(key)
+
+    async def _work(self) -> None:
+        while True:
+            key = await self._ready.get()
+            updates = self._pending[key]
+            while updates:
+                update = updates[0]
+                try:
+                    await self._handle(update)
+                except Exception:
+                    log.exception("An error occurred when handling an update.")
+                finally:
+                    updates.popleft()
+                    self._capacity.release()
+            del self._pending[key]
+            self._ready.task_done()
+
+    async def join(self) -> None:
+        """Wait until every queued update has been handled."""
+        await self._ready.join()
+
+    async def close(self) -> None:
+        """Stop the workers, dropping the updates that are still queued."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
@@ -0,0 +1,63 @@
+import asyncio
+from typing import Any
+
+from ._dispatcher import Dispatcher, chat_key_of, raw_chat_key_of
+from ._utils import to
+from .types import Update
+
+
+def new_message(chat_id: int, id: int) -> Any:
+    return to(
+        Update,
+        {
+            "message": {
+                "id": id,
+                "chat": {"type": "private", "id": chat_id, "firstName": ""},
+                "text": "",
+                "entities": [],
+            }
+        },
+        None,
+    )
+
+
+def test_chat_key_of() -> None:
+    assert chat_key_of(new_message(1, 2)) == 1
+    assert chat_key_of(to(Update, {"deletedMessages": []}, None)) is None
+    assert chat_key_of(to(Update, {"deletedMessages": [{"chatId": 3}]}, None)) == 3
+
+
+def test_dispatcher() -> None:
+    handled: list[tuple[int, int]] = []
+    running = 0
+    max_running = 0
+
+    async def handle(update: Any) -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        # later messages finish first if they are not kept in order
+        await asyncio.sleep(0.01 / update.message.id)
+        handled.append((update.message.chat.id, update.message.id))
+        running -= 1
+
+    async def main() -> None:
+        dispatcher = Dispatcher(handle, 4)
+        for id in range(1, 4):
+            for chat_id in range(4):
+                await dispatcher.put(new_message(chat_id, id))
+        while len(handled) < 12:
+            await asyncio.sleep(0.01)
+        await dispatcher.close()
+
+    asyncio.run(main())
+    assert max_running == 4
+    for chat_id in range(4):
+        assert [id for c, id in handled if c == chat_id] == [1, 2, 3]
+
+
+def test_raw_chat_key_of() -> None:
+    assert raw_chat_key_of({"message": {"chat": {"id": 1}}}) == 1
+    assert raw_chat_key_of({"callbackQuery": {"from": {"id": 2}}}) == 2
+    assert raw_chat_key_of({"deletedMessages": [{"chatId": 3}]}) == 3
+    assert raw_chat_key_of({"videoChat": {"id": "x"}}) is None
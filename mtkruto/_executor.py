@@ -0,0 +1,76 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, NamedTuple, Optional
+
+
+class ExecutorStats(NamedTuple):
+    """A snapshot of the thread pool that runs synchronous handlers."""
+
+    queued: int
+    """Calls waiting for a thread."""
+    running: int
+    """Calls being run."""
+    completed: int
+    """Calls that have returned or raised."""
+    mean_wait: float
+    """The mean time, in seconds, that started calls waited for a thread."""
+    max_wait: float
+    """The longest time, in seconds, that a call waited for a thread."""
+    mean_run: float
+    """The mean time, in seconds, that completed calls took to run."""
+
+
+class Executor:
+    """Runs synchronous callables on a thread pool, keeping statistics."""
+
+    def __init__(self, executor: Optional[ThreadPoolExecutor] = None) -> None:
+        self._executor = executor
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._completed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+        self._total_run = 0.0
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(thread_name_prefix="mtkruto")
+        self.loop = asyncio.get_running_loop()
+        submitted = time.perf_counter()
+        with self._lock:
+            self._queued += 1
+
+        def call() -> Any:
+            started = time.perf_counter()
+            wait = started - submitted
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+            try:
+                return fn(*args)
+            finally:
+                run = time.perf_counter() - started
+                with self._lock:
+                    self._running -= 1
+                    self._completed += 1
+                    self._total_run += run
+
+        return await self.loop.run_in_executor(self._executor, call)
+
+    def stats(self) -> ExecutorStats:
+        with self._lock:
+            started = self._completed + self._running
+            return ExecutorStats(
+                self._queued,
+                self._running,
+                self._completed,
+                self._total_wait / started if started else 0.0,
+                self._max_wait,
+                self._total_run / self._completed if self._completed else 0.0,
+            )
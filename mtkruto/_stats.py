@@ -0,0 +1,52 @@
+from bisect import bisect_left
+from datetime import datetime
+from typing import Dict, NamedTuple, Optional
+
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 10.0)
+"""Upper bounds, in seconds, of the buckets of `HandlerStats.histogram`."""
+
+
+class HandlerStats:
+    """Calls of a handler, their outcomes and how long they took."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.failures = 0
+        self.timeouts = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        # one more bucket for the calls slower than the last bound
+        self._histogram = [0] * (len(LATENCY_BUCKETS) + 1)
+
+    def record(self, duration: float) -> None:
+        self.calls += 1
+        self.total_time += duration
+        self.max_time = max(self.max_time, duration)
+        self._histogram[bisect_left(LATENCY_BUCKETS, duration)] += 1
+
+    @property
+    def histogram(self) -> Dict[float, int]:
+        """The number of calls by the upper bound of their duration."""
+        return dict(zip((*LATENCY_BUCKETS, float("inf")), self._histogram))
+
+    @property
+    def mean_time(self) -> float:
+        return self.total_time / self.calls if self.calls else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"HandlerStats({self.name!r}, calls={self.calls}, "
+            f"failures={self.failures}, timeouts={self.timeouts}, "
+            f"mean_time={self.mean_time:.6f}, max_time={self.max_time:.6f})"
+        )
+
+
+class SlowCall(NamedTuple):
+    """A handler call that took longer than the client's slow call threshold."""
+
+    handler: str
+    update_type: str
+    chat_id: Optional[int]
+    duration: float
+    at: datetime
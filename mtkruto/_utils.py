@@ -1,14 +1,22 @@
+import re
+from collections import OrderedDict
 from datetime import datetime
+from functools import lru_cache
 from typing import (
     Any,
+    Callable,
+    Dict,
+    List,
     Literal,
+    Optional,
+    Tuple,
     Union,
     get_args,
     get_origin,
     get_type_hints,
 )
 
-from .types import _Type
+from .types import User, _ChatPBase, _Type
 
 
 def transform(a: Any) -> Any:
@@ -39,90 +47,444 @@ def transform(a: Any) -> Any:
 
 PRIMITIVES = {datetime, int, str, bool}
 
+Decoder = Callable[[Any, Any], Any]
 
-def to(type_: Any, value: Any, client: Any) -> Any:
+_decoders: Dict[Any, Decoder] = {}
+
+
+def to(type_: Any, value: Any, client: Any, lazy: bool = False) -> Any:
+    return decoder_of(type_, lazy)(value, client)
+
+
+def decoder_of(type_: Any, lazy: bool = False) -> Decoder:
+    """Return the decoder compiled for `type_`, compiling it on first use.
+
+    Lazy decoders resolve which type a value is but leave its fields raw
+    until they are accessed.
+    """
+    try:
+        return _decoders[(type_, lazy)]
+    except KeyError:
+        decoder = _decoders[(type_, lazy)] = _compile(type_, lazy)
+        return decoder
+
+
+def _compile(type_: Any, lazy: bool) -> Decoder:
     # NoneType
-    if type_ == type(None) or value is None:
-        return
+    if type_ == type(None):
+        return _decode_none
+
+    if type_ is datetime:
+        return _decode_date
 
     # primitives
     if type_ in PRIMITIVES:
-        return value
+        return _decode_as_is
 
     # lists
     if get_origin(type_) is list:
-        if not isinstance(value, list):
-            return
-        type_ = get_args(type_)[0]
-        return [to(type_, i, client) for i in value]
+        return _compile_list(get_args(type_)[0], lazy)
 
     # literals
     if get_origin(type_) is Literal:
-        return value
+        return _decode_as_is
 
     # unions
     if get_origin(type_) is Union:
-        args = get_args(type_)
+        return _compile_union(type_, lazy)
+
+    # actual types
+    if isinstance(type_, type) and issubclass(type_, _Type):
+        # peers are decoded eagerly so that they can go through the identity map
+        if lazy and not issubclass(type_, (User, _ChatPBase)):
+            return _compile_lazy_type(type_)
+        return _compile_type(type_)
+
+    return _decode_any
+
+
+def _decode_none(value: Any, client: Any) -> Any:
+    return None
+
+
+def _decode_as_is(value: Any, client: Any) -> Any:
+    return value
+
+
+def _decode_date(value: Any, client: Any) -> Any:
+    if (
+        isinstance(value, dict)
+        and value.get("_") == "date"
+        and isinstance(value.get("value"), str)
+    ):
+        return datetime.fromisoformat(value["value"])
+    return value
+
+
+def _decode_any(value: Any, client: Any) -> Any:
+    # untyped values may still carry dates, convert them without
+    # touching the input
+    if isinstance(value, dict):
+        if value.get("_") == "date":
+            return _decode_date(value, client)
+        return {k: _decode_any(v, client) for k, v in value.items()}
+    elif isinstance(value, list):
+        return [_decode_any(i, client) for i in value]
+    return value
+
+
+def _compile_list(type_: Any, lazy: bool) -> Decoder:
+    item = decoder_of(type_, lazy)
+
+    def decode(value: Any, client: Any) -> Any:
+        if not isinstance(value, list):
+            return
+        return [item(i, client) for i in value]
+
+    return decode
+
+
+def _compile_union(type_: Any, lazy: bool) -> Decoder:
+    args = get_args(type_)
+
+    # optional
+    if args[0] != type(None) and args[1] == type(None):
+        return decoder_of(args[0], lazy)
+
+    if any(map(lambda v: v in PRIMITIVES, args)):
+        return _decode_as_is
+
+    dispatch = union_dispatch(type_)
+
+    def decode(value: Any, client: Any) -> Any:
+        if value is None:
+            return
+        member = dispatch.resolve(value)
+        if member is None:
+            raise ValueError("Type instantiation failed")
+        return decoder_of(member, lazy)(value, client)
+
+    return decode
+
+
+_PRESENT = object()
+
+# (position in the union, member, remaining discriminators)
+_Candidate = Tuple[int, Any, Tuple[Tuple[str, Any], ...]]
+
+
+class UnionDispatch:
+    """Index of a union's members by their first discriminator.
+
+    Members discriminated by a literal are looked up by (key, value); the
+    ones discriminated by presence are looked up by key. When several
+    members match, the one that comes first in the union wins.
+    """
+
+    def __init__(self, members: Tuple[Any, ...]) -> None:
+        self._keys: Dict[str, Tuple[Dict[Any, List[_Candidate]], List[_Candidate]]] = {}
+        for i, member in enumerate(members):
+            discriminators = discriminators_of(member)
+            if not discriminators:
+                continue
+            (key, expected), *rest = discriminators
+            by_value, present = self._keys.setdefault(key, ({}, []))
+            candidate = (i, member, tuple(rest))
+            if expected is _PRESENT:
+                present.append(candidate)
+            else:
+                by_value.setdefault(expected, []).append(candidate)
+
+    def resolve(self, value: Any) -> Any:
+        if not isinstance(value, dict):
+            return None
+        keys = self._keys
+        best: Optional[_Candidate] = None
+        for key in value if len(value) < len(keys) else keys:
+            if key not in keys or key not in value:
+                continue
+            by_value, present = keys[key]
+            try:
+                matches = by_value.get(value[key], ())
+            except TypeError:  # unhashable
+                matches = ()
+            for candidates in (matches, present):
+                for candidate in candidates:
+                    if best is not None and candidate[0] > best[0]:
+                        break
+                    if _satisfies(candidate[2], value):
+                        best = candidate
+                        break
+        return None if best is None else best[1]
+
+
+@lru_cache(maxsize=None)
+def union_dispatch(type_: Any) -> UnionDispatch:
+    return UnionDispatch(get_args(type_))
+
+
+def _satisfies(discriminators: Tuple[Tuple[str, Any], ...], value: Any) -> bool:
+    for key, expected in discriminators:
+        if key not in value:
+            return False
+        if expected is not _PRESENT and value[key] != expected:
+            return False
+    return True
+
 
-        # optional
-        if args[0] != type(None) and args[1] == type(None):
-            return to(args[0], value, client)
+@lru_cache(maxsize=None)
+def discriminators_of(type_: Any) -> Tuple[Tuple[str, Any], ...]:
+    """Return the (key, literal value) pairs that discriminate `type_`.
 
-        if any(map(lambda v: v in PRIMITIVES, args)):
+    Keys that only need to be present are paired with `_PRESENT`.
+    """
+    if not hasattr(type_, "__discriminators__"):
+        return ()
+    annotations = {key: type__ for _, key, type__ in fields_of(type_)}
+    discriminators = []
+    for d in type_.__discriminators__:
+        annotation = annotations.get(d)
+        if get_origin(annotation) is Literal:
+            discriminators.append((d, get_args(annotation)[0]))
+        else:
+            discriminators.append((d, _PRESENT))
+    return tuple(discriminators)
+
+
+def _compile_type(type_: Any) -> Decoder:
+    # The field plan is built on first use rather than here so that
+    # self-referencing types (e.g. Message.reply_to_message) compile.
+    plan: Optional[List[Tuple[str, str, Decoder]]] = None
+    peer = issubclass(type_, (User, _ChatPBase))
+
+    def decode(value: Any, client: Any) -> Any:
+        nonlocal plan
+        if value is None:
+            return
+        if plan is None:
+            plan = [(k, key, decoder_of(t)) for k, key, t in fields_of(type_)]
+        kwargs = {k: decoder(value.get(key), client) for k, key, decoder in plan}
+
+        id = kwargs["id"] if peer else None
+        # peers without an ID cannot be told apart, so they are not shared
+        identity_map = (
+            getattr(client, "_identity_map", None) if id is not None else None
+        )
+        if identity_map is not None:
+            instance = identity_map.get(type_, id)
+            if instance is not None:
+                # a partial payload leaves the fields that it lacks as they are
+                for k, v in kwargs.items():
+                    if v is not None:
+                        setattr(instance, k, v)
+                return instance
+
+        try:
+            instance = type_(**kwargs)
+        except TypeError:
             return value
 
-        for arg in args:
-            if satisfies_discriminators(arg, value):
-                return to(arg, value, client)
+        if client:
+            instance._client = client
 
-        raise ValueError("Type instantiation failed")
+        if identity_map is not None:
+            identity_map.put(type_, id, instance)
 
-    # actual types
-    kwargs = {}
+        return instance
+
+    return decode
+
+
+class IdentityMap:
+    """Keeps the most recently decoded users and chats by their type and ID.
+
+    Decoding a peer that is already in the map updates the existing object in
+    place instead of creating a new one.
+    """
+
+    def __init__(self, size: int) -> None:
+        self._size = size
+        self._objects: OrderedDict[Tuple[Any, int], Any] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def get(self, type_: Any, id: int) -> Any:
+        key = (type_, id)
+        instance = self._objects.get(key)
+        if instance is not None:
+            self._objects.move_to_end(key)
+        return instance
+
+    def put(self, type_: Any, id: int, instance: Any) -> None:
+        self._objects[(type_, id)] = instance
+        if len(self._objects) > self._size:
+            self._objects.popitem(last=False)
+
+
+@lru_cache(maxsize=None)
+def fields_of(type_: Any) -> Tuple[Tuple[str, str, Any], ...]:
+    """Return the (attribute, key, type) triples of a `_Type` subclass."""
+    fields = []
     for k, field in get_type_hints(type_, include_extras=True).items():
         if k.startswith("_"):
             continue
         type__, key = get_args(field)
-        kwargs[k] = to(type__, value.pop(key, None), client)
+        fields.append((k, key, type__))
+    return tuple(fields)
 
-    try:
-        instance = type_(**kwargs)
-    except TypeError:
-        return value
 
-    if client:
-        instance._client = client
+def _compile_lazy_type(type_: Any) -> Decoder:
+    def decode(value: Any, client: Any) -> Any:
+        if value is None:
+            return
+        instance = type_.__new__(type_)
+        instance._raw = value
+        if client:
+            instance._client = client
+        return instance
 
-    return instance
+    return decode
+
+
+@lru_cache(maxsize=None)
+def _lazy_fields_of(type_: Any) -> Dict[str, Tuple[str, Decoder]]:
+    return {k: (key, decoder_of(t, True)) for k, key, t in fields_of(type_)}
+
+
+def materialize(instance: Any, name: str) -> Any:
+    """Decode the field `name` of a lazily decoded instance and keep it."""
+    try:
+        key, decoder = _lazy_fields_of(instance.__class__)[name]
+    except KeyError:
+        raise AttributeError(name) from None
+    value = decoder(instance._raw.get(key), getattr(instance, "_client", None))
+    setattr(instance, name, value)
+    return value
 
 
 def satisfies_discriminators(of: Any, value: Any) -> bool:
-    if not hasattr(of, "__discriminators__"):
-        return False
-    a = of.__annotations__
-    for d in of.__discriminators__:
-        if d not in value:
-            return False
-        try:
-            annotation = [v for v in a.values() if v.__metadata__[0] == d][0].__args__[
-                0
-            ]
-            if get_origin(annotation) is Literal:
-                if value[d] != annotation.__args__[0]:
-                    return False
-        except IndexError:
-            continue
-    return True
+    discriminators = discriminators_of(of)
+    return bool(discriminators) and _satisfies(discriminators, value)
+
+
+def encode(value: Any) -> Any:
+    """Convert `value` into plain JSON data, leaving out None values."""
+    if isinstance(value, _Type):
+        return encoder_of(value.__class__)(value)
+    elif isinstance(value, dict):
+        return {k: encode(v) for k, v in value.items() if v is not None}
+    elif isinstance(value, (list, tuple)):
+        return [encode(i) for i in value]
+    elif isinstance(value, datetime):
+        return {"_": "date", "value": value.isoformat(timespec="milliseconds")}
+    return value
+
+
+_SCALARS = {str, int, bool, float}
+
+
+Encoder = Callable[[Any], Dict[str, Any]]
+
+_encoders: Dict[Any, Encoder] = {}
+
+
+def encoder_of(type_: Any) -> Encoder:
+    """Return the encoder of a `_Type` subclass, compiling it on first use."""
+    try:
+        return _encoders[type_]
+    except KeyError:
+        encoder = _encoders[type_] = _compile_encoder(type_)
+        return encoder
+
+
+def _compile_encoder(type_: Any) -> Encoder:
+    plan = [(k, key) for k, key, _ in fields_of(type_)]
+
+    def encode_(o: Any) -> Dict[str, Any]:
+        j = {}
+        for k, key in plan:
+            v = getattr(o, k, None)
+            if v is None:
+                continue
+            j[key] = v if v.__class__ in _SCALARS else encode(v)
+        return j
+
+    return encode_
 
 
 def default(o: Any) -> Any:
-    if not isinstance(o, _Type):
-        raise TypeError
-    j = {}
-    for k, field in get_type_hints(o.__class__, include_extras=True).items():
-        if k.startswith("_"):
-            continue
-        _, key = get_args(field)
-        if hasattr(o, k):
-            j[key] = getattr(o, k)
-    return j
+    if isinstance(o, (_Type, datetime)):
+        return encode(o)
+    raise TypeError
+
+
+class ArraySplitter:
+    """Splits a JSON array arriving in chunks into the encoded elements.
+
+    Only the structure is scanned; each element is left for the codec to
+    parse once it is complete.
+    """
+
+    _structural = re.compile(rb'[\[\]{}",]')
+    _string = re.compile(rb'["\\]')
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._pos = 0
+        self._start = 0
+        self._depth = 0
+        self._in_string = False
+        self.done = False
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        elements: List[bytes] = []
+        buffer = self._buffer
+        buffer += chunk
+        pos = self._pos
+        while not self.done:
+            if self._in_string:
+                m = self._string.search(buffer, pos)
+                if m is None:
+                    pos = len(buffer)
+                    break
+                if buffer[m.start()] == 0x5C:  # backslash
+                    if m.end() == len(buffer):
+                        pos = m.start()
+                        break
+                    pos = m.end() + 1
+                else:
+                    self._in_string = False
+                    pos = m.end()
+                continue
+            m = self._structural.search(buffer, pos)
+            if m is None:
+                pos = len(buffer)
+                break
+            c, pos = buffer[m.start()], m.end()
+            if self._depth == 0 and c != 0x5B:  # [
+                raise ValueError("Expected a JSON array")
+            if c == 0x22:  # "
+                self._in_string = True
+            elif c == 0x5B or c == 0x7B:  # [ {
+                self._depth += 1
+                if self._depth == 1:
+                    self._start = pos
+            elif c == 0x5D or c == 0x7D:  # ] }
+                self._depth -= 1
+                if self._depth == 0:
+                    self._emit(elements, m.start())
+                    self.done = True
+            elif self._depth == 1:  # ,
+                self._emit(elements, m.start())
+                self._start = pos
+        # drop what has already been emitted
+        del buffer[: self._start]
+        self._pos = pos - self._start
+        self._start = 0
+        return elements
+
+    def _emit(self, elements: List[bytes], end: int) -> None:
+        element = bytes(self._buffer[self._start : end]).strip()
+        if element:
+            elements.append(element)
@@ -1,8 +1,33 @@
+import json
 from datetime import datetime
-from typing import Literal, Optional, Union
+from typing import Any, Literal, Optional, Union
 
-from ._utils import satisfies_discriminators, to, transform
-from .types import MessageEntityBold, Update, UpdateMessageReactions
+from ._utils import (
+    ArraySplitter,
+    IdentityMap,
+    decoder_of,
+    encode,
+    satisfies_discriminators,
+    to,
+    transform,
+    union_dispatch,
+)
+from .types import (
+    Chat,
+    ChatPrivate,
+    Message,
+    MessageEntity,
+    MessageEntityBold,
+    MessageNewChatMembers,
+    MessageRefundedPayment,
+    MessageText,
+    ReplyQuote,
+    ReplyToMessage,
+    Update,
+    UpdateMessageReactions,
+    UpdateNewMessage,
+    User,
+)
 
 
 def test_transform() -> None:
@@ -33,8 +58,176 @@ def test_to() -> None:
     )
 
 
+def test_to_nested() -> None:
+    update = to(
+        Update,
+        {
+            "message": {
+                "text": "hi",
+                "entities": [{"type": "bold", "offset": 0, "length": 2}],
+                "replyToMessage": {"text": "hey", "entities": []},
+            }
+        },
+        None,
+    )
+    assert isinstance(update, UpdateNewMessage)
+    assert isinstance(update.message, MessageText)
+    assert isinstance(update.message.entities[0], MessageEntityBold)
+    assert isinstance(update.message.reply_to_message, MessageText)
+    assert update.message.reply_to_message.text == "hey"
+
+
+def test_to_dates() -> None:
+    date = {"_": "date", "value": "2024-05-08T09:39:10.307+00:00"}
+    raw = {"message": {"text": "hi", "entities": [], "date": date}}
+    update = to(Update, raw, None)
+    assert isinstance(update, UpdateNewMessage)
+    assert update.message.date == datetime.fromisoformat(date["value"])
+    assert raw == {"message": {"text": "hi", "entities": [], "date": date}}
+    assert to(Any, {"a": [date]}, None) == {"a": [update.message.date]}
+
+
+def is_decoded(instance: Any, name: str) -> bool:
+    try:
+        object.__getattribute__(instance, name)
+    except AttributeError:
+        return False
+    return True
+
+
+def test_to_lazy() -> None:
+    raw = {
+        "message": {
+            "text": "hi",
+            "entities": [{"type": "bold", "offset": 0, "length": 2}],
+            "replyToMessage": {"text": "hey", "entities": []},
+        }
+    }
+    update = to(Update, raw, None, lazy=True)
+    assert isinstance(update, UpdateNewMessage)
+    assert not is_decoded(update, "message")
+    assert isinstance(update.message, MessageText)
+    assert is_decoded(update, "message")
+    assert not is_decoded(update.message, "reply_to_message")
+    assert update.message.text == "hi"
+    assert update.message.link_preview is None
+    assert isinstance(update.message.entities[0], MessageEntityBold)
+    assert isinstance(update.message.reply_to_message, MessageText)
+    assert update.message.reply_to_message.text == "hey"
+    assert "text='hey'" in repr(update)
+    assert raw["message"]["text"] == "hi"
+
+
+def test_decoder_of() -> None:
+    assert decoder_of(list[Update]) is decoder_of(list[Update])
+    assert decoder_of(Optional[MessageText]) is decoder_of(MessageText)
+
+
 def test_satisfies_discriminators() -> None:
     assert satisfies_discriminators(UpdateMessageReactions, {"messageReactions": {}})
     assert not satisfies_discriminators(UpdateMessageReactions, {"editedMessage": {}})
     assert not satisfies_discriminators(MessageEntityBold, {"type": "mention"})
     assert satisfies_discriminators(MessageEntityBold, {"type": "bold"})
+
+
+def test_union_dispatch() -> None:
+    assert union_dispatch(Update).resolve({"message": {}}) is UpdateNewMessage
+    assert union_dispatch(Update).resolve({"unknown": {}}) is None
+    assert union_dispatch(MessageEntity).resolve({"type": "bold"}) is MessageEntityBold
+    assert union_dispatch(MessageEntity).resolve({"type": {}}) is None
+    assert union_dispatch(Chat).resolve({"type": "private"}) is ChatPrivate
+    assert (
+        union_dispatch(Message).resolve({"id": 1, "refundedPayment": {}})
+        is MessageRefundedPayment
+    )
+    # the member that comes first in the union wins
+    assert (
+        union_dispatch(Message).resolve({"groupCreated": True, "newChatMembers": []})
+        is MessageNewChatMembers
+    )
+
+
+def test_encode() -> None:
+    date = datetime.fromisoformat("2024-05-08T09:39:10.307+00:00")
+    options = {"replyTo": ReplyToMessage(message_id=1), "sendAt": date, "x": None}
+    assert encode(("me", options)) == [
+        "me",
+        {
+            "replyTo": {"messageId": 1},
+            "sendAt": {"_": "date", "value": "2024-05-08T09:39:10.307+00:00"},
+        },
+    ]
+    assert options["x"] is None
+    reply_to = ReplyToMessage(
+        message_id=1, quote=ReplyQuote(offset=0, text="a", entities=[])
+    )
+    assert encode(reply_to) == {
+        "messageId": 1,
+        "quote": {"offset": 0, "text": "a", "entities": []},
+    }
+
+
+def user(id: int, first_name: str = "A") -> dict[str, Any]:
+    return {
+        "id": id,
+        "color": 0,
+        "isBot": False,
+        "firstName": first_name,
+        "isScam": False,
+        "isFake": False,
+        "isPremium": False,
+        "isVerified": False,
+        "isSupport": False,
+        "addedToAttachmentMenu": False,
+    }
+
+
+class ClientWithIdentityMap:
+    def __init__(self) -> None:
+        self._identity_map = IdentityMap(2)
+
+
+def test_identity_map() -> None:
+    client = ClientWithIdentityMap()
+    a = to(Update, {"message": {"text": "", "entities": [], "from": user(1)}}, client)
+    b = to(
+        Update, {"message": {"text": "", "entities": [], "from": user(1, "B")}}, client
+    )
+    assert isinstance(a, UpdateNewMessage) and isinstance(b, UpdateNewMessage)
+    assert a.message.from_ is b.message.from_
+    assert a.message.from_ is not None and a.message.from_.first_name == "B"
+    to(User, user(2), client)
+    to(User, user(3), client)
+    assert len(client._identity_map) == 2
+    assert to(User, user(1), client) is not a.message.from_
+
+
+def test_identity_map_partial() -> None:
+    client = ClientWithIdentityMap()
+    a = to(User, {**user(1), "username": "a", "lastName": "B"}, client)
+    b = to(User, {**user(1, "C"), "lastName": "D"}, client)
+    # fields missing from the later payload are kept
+    assert a is b
+    assert (a.first_name, a.last_name, a.username) == ("C", "D", "a")
+
+
+def test_identity_map_without_id() -> None:
+    client = ClientWithIdentityMap()
+    a = to(User, {**user(1), "id": None}, client)
+    b = to(User, {**user(1, "B"), "id": None}, client)
+    assert a is not b
+    assert (a.first_name, b.first_name) == ("A", "B")
+    assert len(client._identity_map) == 0
+
+
+def test_array_splitter() -> None:
+    items = [{"text": 'a,]"}{[\\', "entities": [1, {"b": None}]}, 2, "c", [], {}]
+    raw = json.dumps(items).encode()
+    for size in (1, 2, 7, len(raw)):
+        splitter = ArraySplitter()
+        elements = []
+        for i in range(0, len(raw), size):
+            elements += splitter.feed(raw[i : i + size])
+        assert [json.loads(e) for e in elements] == items
+        assert splitter.done
+    assert ArraySplitter().feed(b" [ ] ") == []
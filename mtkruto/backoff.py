@@ -0,0 +1,102 @@
+"""Backing off from failing requests."""
+
+import asyncio
+import random
+import time
+from collections import Counter
+from typing import Literal, NamedTuple, Optional
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class BackoffStats(NamedTuple):
+    """A snapshot of a `Backoff`."""
+
+    state: CircuitState
+    """`"closed"` while requests succeed, `"open"` after `threshold` failures
+    in a row until the next retry is due, and `"half_open"` once it is due
+    and until a request succeeds."""
+    consecutive_failures: int
+    """Failures since the last success, not counting timeouts."""
+    failures: int
+    """Failures in total, not counting timeouts."""
+    timeouts: int
+    """Timed out requests in total."""
+    errors: "Counter[str]"
+    """Failures, including timeouts, by the name of the exception's class."""
+    last_error: Optional[str]
+    """The most recent failure or timeout."""
+    delay: float
+    """The delay, in seconds, before the most recent retry."""
+
+
+class Backoff:
+    """Exponential backoff with jitter, and a circuit breaker.
+
+    After the `n`th failure in a row, the next request is made after
+    `initial * multiplier ** (n - 1)` seconds, capped at `maximum`, less a
+    random fraction of up to `jitter` of that, so that clients that failed
+    together do not all retry together. Timeouts are retried immediately and
+    neither raise nor reset the delay.
+    """
+
+    def __init__(
+        self,
+        initial: float = 0.5,
+        maximum: float = 60.0,
+        *,
+        multiplier: float = 2.0,
+        jitter: float = 0.5,
+        threshold: int = 5,
+    ) -> None:
+        self.initial = initial
+        self.maximum = maximum
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.threshold = threshold
+        self._consecutive_failures = 0
+        self._failures = 0
+        self._timeouts = 0
+        self._errors: Counter[str] = Counter()
+        self._last_error: Optional[str] = None
+        self._delay = 0.0
+        self._retry_at = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        if self._consecutive_failures < self.threshold:
+            return "closed"
+        return "open" if time.monotonic() < self._retry_at else "half_open"
+
+    def failure(self, error: BaseException) -> float:
+        """Record a failed request and return the delay before retrying it."""
+        self._errors[error.__class__.__name__] += 1
+        self._last_error = f"{error.__class__.__name__}: {error}"
+        if isinstance(error, asyncio.TimeoutError):
+            self._timeouts += 1
+            delay = 0.0
+        else:
+            self._failures += 1
+            self._consecutive_failures += 1
+            # the exponent is capped so that a long outage cannot overflow it
+            exponent = min(self._consecutive_failures - 1, 64)
+            delay = min(self.maximum, self.initial * self.multiplier**exponent)
+            delay -= delay * self.jitter * random.random()
+        self._delay = delay
+        self._retry_at = time.monotonic() + delay
+        return delay
+
+    def success(self) -> None:
+        """Record a successful request."""
+        self._consecutive_failures = 0
+
+    def stats(self) -> BackoffStats:
+        return BackoffStats(
+            self.state,
+            self._consecutive_failures,
+            self._failures,
+            self._timeouts,
+            self._errors.copy(),
+            self._last_error,
+            self._delay,
+        )
@@ -0,0 +1,39 @@
+import asyncio
+
+from .backoff import Backoff
+
+
+def test_backoff() -> None:
+    backoff = Backoff(1, 5, jitter=0, threshold=3)
+    delays = [backoff.failure(ConnectionError()) for _ in range(5)]
+    assert delays == [1, 2, 4, 5, 5]
+    stats = backoff.stats()
+    assert (stats.state, stats.consecutive_failures, stats.failures) == ("open", 5, 5)
+    assert stats.errors["ConnectionError"] == 5
+
+    backoff.success()
+    assert backoff.state == "closed"
+    assert backoff.failure(ConnectionError()) == 1
+
+
+def test_backoff_jitter() -> None:
+    backoff = Backoff(8, jitter=0.5)
+    delays = [backoff.failure(ConnectionError()) for _ in range(3)]
+    assert 4 <= delays[0] <= 8
+    assert 8 <= delays[1] <= 16
+    assert 16 <= delays[2] <= 32
+
+
+def test_backoff_timeouts() -> None:
+    backoff = Backoff(1, jitter=0, threshold=1)
+    assert backoff.failure(asyncio.TimeoutError()) == 0
+    assert backoff.state == "closed"
+    assert backoff.failure(ConnectionError()) == 1
+    assert backoff.stats().state == "open"
+    # a timeout neither raises nor resets the delay
+    assert backoff.failure(asyncio.TimeoutError()) == 0
+    assert backoff.stats().state == "half_open"
+    assert backoff.failure(ConnectionError()) == 2
+    stats = backoff.stats()
+    assert (stats.failures, stats.timeouts) == (2, 2)
+    assert stats.last_error == "ConnectionError: "
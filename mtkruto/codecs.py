@@ -0,0 +1,73 @@
+import importlib
+import json
+from abc import ABC, abstractmethod
+from typing import Any
+
+from ._utils import default, encode
+
+
+class Codec(ABC):
+    """Serializes request bodies and parses response bodies."""
+
+    content_type = "application/json"
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes: ...
+
+    @abstractmethod
+    def decode(self, data: bytes) -> Any: ...
+
+
+class JSONCodec(Codec):
+    """The standard library's json module."""
+
+    def __init__(self) -> None:
+        self._encoder = json.JSONEncoder(default=default, separators=(",", ":"))
+
+    def encode(self, value: Any) -> bytes:
+        return self._encoder.encode(value).encode()
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(Codec):
+    """orjson, if installed."""
+
+    def __init__(self) -> None:
+        self._orjson = importlib.import_module("orjson")
+        # let datetimes reach default() so that they are sent as date objects
+        self._option = self._orjson.OPT_PASSTHROUGH_DATETIME
+
+    def encode(self, value: Any) -> bytes:
+        return self._orjson.dumps(value, default=default, option=self._option)
+
+    def decode(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(Codec):
+    """msgspec, if installed."""
+
+    def __init__(self) -> None:
+        msgspec = importlib.import_module("msgspec")
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def encode(self, value: Any) -> bytes:
+        # msgspec encodes datetimes itself, without calling an enc_hook, so
+        # they are turned into date objects beforehand
+        return self._encoder.encode(encode(value))
+
+    def decode(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+
+def default_codec() -> Codec:
+    """Return the fastest codec available, falling back to `JSONCodec`."""
+    for codec in (OrjsonCodec, MsgspecCodec):
+        try:
+            return codec()
+        except ImportError:
+            continue
+    return JSONCodec()
@@ -0,0 +1,22 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from .codecs import Codec, JSONCodec, MsgspecCodec, OrjsonCodec
+from .types import ReplyToMessage
+
+
+@pytest.mark.parametrize("codec_", [JSONCodec, OrjsonCodec, MsgspecCodec])
+def test_codec(codec_: type[Codec]) -> None:
+    try:
+        codec = codec_()
+    except ImportError:
+        pytest.skip()
+    date = datetime(2024, 5, 8, 9, 39, 10, 307000, tzinfo=timezone.utc)
+    encoded = codec.encode([1, "a", ReplyToMessage(message_id=1), date])
+    assert codec.decode(encoded) == [
+        1,
+        "a",
+        {"messageId": 1},
+        {"_": "date", "value": "2024-05-08T09:39:10.307+00:00"},
+    ]
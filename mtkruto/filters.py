@@ -1,4 +1,15 @@
-from typing import Any, Callable, List, Union
+from contextvars import ContextVar
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from .types import (
     MessageAnimation,
@@ -43,222 +54,514 @@ from .types import (
     MessageWriteAccessAllowed,
 )
 
+Memo = Dict["Filter", bool]
+MemoizedFilter = Callable[[Any, Memo], bool]
+
+_memos: "ContextVar[Optional[Dict[int, Tuple[Any, Memo]]]]" = ContextVar(
+    "_memos", default=None
+)
+
+
+def call_memoized(
+    filter_: Callable[[Any], bool], value: Any, memos: Dict[int, Tuple[Any, Memo]]
+) -> bool:
+    """Call `filter_` with `value`, recording the results of the filters it
+    evaluates in `memos` and reusing the ones already there.
+
+    Passing the same `memos` for every handler of an update makes each distinct
+    filter run at most once per value.
+    """
+    token = _memos.set(memos)
+    try:
+        return filter_(value)
+    finally:
+        _memos.reset(token)
+
 
 class Filter:
+    """A filter, or a node of a filter expression.
+
+    Filters combined with `&`, `|` and `~` form a tree that is simplified as
+    it is built and compiled into a single function when first called.
+    """
+
+    _compiled: Optional[Callable[[Any], bool]] = None
+    _compiled_memoized: Optional["MemoizedFilter"] = None
+    # nodes that cost about as much as a memo lookup are always evaluated
+    _memoized = True
+
     def __init__(self, filter_: Callable[[Any], bool]) -> None:
         self._filter = filter_
 
     def __call__(self, arg: Any) -> bool:
-        return self._filter(arg)
+        memos = _memos.get() if self._memoized else None
+        if memos is not None:
+            entry = memos.get(id(arg))
+            if entry is None:
+                entry = memos[id(arg)] = (arg, {})
+            return self.compile_memoized()(arg, entry[1])
+        compiled = self._compiled
+        if compiled is None:
+            compiled = self._compiled = self.compile()
+        return compiled(arg)
+
+    def compile(self) -> Callable[[Any], bool]:
+        """Return a function that evaluates the filter."""
+        return self._filter
+
+    def compile_memoized(self) -> "MemoizedFilter":
+        """Like `compile`, but the returned function also takes a memo in which
+        the results of the nodes are recorded and looked up.
+        """
+        compiled = self._compiled_memoized
+        if compiled is None:
+            compiled = self._compile_memoized()
+            if self._memoized:
+                compiled = self._memoize(compiled)
+            self._compiled_memoized = compiled
+        return compiled
+
+    def _compile_memoized(self) -> "MemoizedFilter":
+        compiled = self.compile()
+        return lambda v, memo: compiled(v)
+
+    def _memoize(self, compiled: "MemoizedFilter") -> "MemoizedFilter":
+        def memoized(v: Any, memo: Memo) -> bool:
+            result = memo.get(self)
+            if result is None:
+                result = memo[self] = compiled(v, memo)
+            return result
+
+        return memoized
+
+    def __repr__(self) -> str:
+        return f"Filter({self._filter!r})"
 
     def __invert__(self) -> "Filter":
-        return Filter(lambda v: not self(v))
+        return self.operand if isinstance(self, Not) else Not(self)
 
     def __and__(self, other: "Filter") -> "Filter":
-        return Filter(lambda v: self(v) and other(v))
+        and_ = And(self, other)
+        return and_.operands[0] if len(and_.operands) == 1 else and_
 
     def __or__(self, other: "Filter") -> "Filter":
-        return Filter(lambda v: self(v) or other(v))
+        or_ = Or(self, other)
+        return or_.operands[0] if len(or_.operands) == 1 else or_
+
+
+class IsInstance(Filter):
+    """Values that are instances of any of `types`."""
+
+    _memoized = False
+
+    def __init__(self, *types: type) -> None:
+        self.types = types
+
+    def compile(self) -> Callable[[Any], bool]:
+        types = self.types
+        return lambda v: isinstance(v, types)
+
+    def __repr__(self) -> str:
+        return f"IsInstance({', '.join(t.__name__ for t in self.types)})"
+
+
+class Attribute(Filter):
+    """Values with a truthy attribute `name`."""
+
+    _memoized = False
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def compile(self) -> Callable[[Any], bool]:
+        name = self.name
+        return lambda v: bool(getattr(v, name, None))
+
+    def __repr__(self) -> str:
+        return f"Attribute({self.name!r})"
+
+
+class ChatType(Filter):
+    """Values in a chat of any of `types`."""
 
+    _memoized = False
 
-text = Filter(lambda v: isinstance(v, MessageText))
+    def __init__(self, types: AbstractSet[str]) -> None:
+        self.types = frozenset(types)
+
+    def compile(self) -> Callable[[Any], bool]:
+        types = self.types
+
+        def chat_type(v: Any) -> bool:
+            chat = getattr(v, "chat", None)
+            return chat is not None and chat.type in types
+
+        return chat_type
+
+    def __repr__(self) -> str:
+        return f"ChatType({set(self.types)!r})"
+
+
+class Peer(Filter):
+    """Values whose `attribute` is a user or chat with one of the given IDs or
+    usernames."""
+
+    _memoized = False
+
+    def __init__(
+        self, attribute: str, ids: AbstractSet[int], usernames: AbstractSet[str]
+    ) -> None:
+        self.attribute = attribute
+        self.ids = frozenset(ids)
+        self.usernames = frozenset(u.lower() for u in usernames)
+
+    def compile(self) -> Callable[[Any], bool]:
+        attribute, ids, usernames = self.attribute, self.ids, self.usernames
+
+        def peer(v: Any) -> bool:
+            peer = getattr(v, attribute, None)
+            if peer is None:
+                return False
+            if peer.id in ids:
+                return True
+            if usernames:
+                username = getattr(peer, "username", None)
+                return username is not None and username.lower() in usernames
+            return False
+
+        return peer
+
+    def __repr__(self) -> str:
+        return (
+            f"Peer({self.attribute!r}, {len(self.ids)} IDs, "
+            f"{len(self.usernames)} usernames)"
+        )
+
+
+class Not(Filter):
+    def __init__(self, operand: Filter) -> None:
+        self.operand = operand
+
+    def compile(self) -> Callable[[Any], bool]:
+        operand = self.operand.compile()
+        return lambda v: not operand(v)
+
+    def _compile_memoized(self) -> "MemoizedFilter":
+        operand = self.operand.compile_memoized()
+        return lambda v, memo: not operand(v, memo)
+
+    def __repr__(self) -> str:
+        return f"Not({self.operand!r})"
+
+
+class And(Filter):
+    """Values that pass all operands, tried in order."""
+
+    operands: Tuple[Filter, ...]
+
+    def __init__(self, *operands: Filter) -> None:
+        flat: List[Filter] = []
+        for operand in operands:
+            for o in operand.operands if isinstance(operand, And) else (operand,):
+                if o not in flat:
+                    flat.append(o)
+        self.operands = tuple(flat)
+
+    def compile(self) -> Callable[[Any], bool]:
+        operands = tuple(o.compile() for o in self.operands)
+        if len(operands) == 1:
+            return operands[0]
+        if len(operands) == 2:
+            a, b = operands
+            return lambda v: a(v) and b(v)
+
+        def and_(v: Any) -> bool:
+            for operand in operands:
+                if not operand(v):
+                    return False
+            return True
+
+        return and_
+
+    def _compile_memoized(self) -> "MemoizedFilter":
+        operands = tuple(o.compile_memoized() for o in self.operands)
+
+        def and_(v: Any, memo: Memo) -> bool:
+            for operand in operands:
+                if not operand(v, memo):
+                    return False
+            return True
+
+        return and_
+
+    def __repr__(self) -> str:
+        return f"And({', '.join(map(repr, self.operands))})"
+
+
+class Or(Filter):
+    """Values that pass any of the operands, tried in order.
+
+    Operands of the same kind that only test membership (`IsInstance`,
+    `ChatType` and `Peer` of the same attribute) are merged into one.
+    """
+
+    operands: Tuple[Filter, ...]
+
+    def __init__(self, *operands: Filter) -> None:
+        flat: List[Filter] = []
+        for operand in operands:
+            for o in operand.operands if isinstance(operand, Or) else (operand,):
+                if o not in flat and not self._merge(flat, o):
+                    flat.append(o)
+        self.operands = tuple(flat)
+
+    @staticmethod
+    def _merge(flat: List[Filter], new: Filter) -> bool:
+        for i, o in enumerate(flat):
+            if isinstance(o, IsInstance) and isinstance(new, IsInstance):
+                flat[i] = IsInstance(*o.types, *new.types)
+            elif isinstance(o, ChatType) and isinstance(new, ChatType):
+                flat[i] = ChatType(o.types | new.types)
+            elif (
+                isinstance(o, Peer)
+                and isinstance(new, Peer)
+                and o.attribute == new.attribute
+            ):
+                flat[i] = Peer(
+                    o.attribute, o.ids | new.ids, o.usernames | new.usernames
+                )
+            else:
+                continue
+            return True
+        return False
+
+    def compile(self) -> Callable[[Any], bool]:
+        operands = tuple(o.compile() for o in self.operands)
+        if len(operands) == 1:
+            return operands[0]
+        if len(operands) == 2:
+            a, b = operands
+            return lambda v: a(v) or b(v)
+
+        def or_(v: Any) -> bool:
+            for operand in operands:
+                if operand(v):
+                    return True
+            return False
+
+        return or_
+
+    def _compile_memoized(self) -> "MemoizedFilter":
+        operands = tuple(o.compile_memoized() for o in self.operands)
+
+        def or_(v: Any, memo: Memo) -> bool:
+            for operand in operands:
+                if operand(v, memo):
+                    return True
+            return False
+
+        return or_
+
+    def __repr__(self) -> str:
+        return f"Or({', '.join(map(repr, self.operands))})"
+
+
+text = IsInstance(MessageText)
 """
 Text messages
 """
 
-link = Filter(lambda v: isinstance(v, MessageLink))
+link = IsInstance(MessageLink)
 """
 Messages containing only a link preview
 """
 
-photo = Filter(lambda v: isinstance(v, MessagePhoto))
+photo = IsInstance(MessagePhoto)
 """
 Photo messages
 """
 
-document = Filter(lambda v: isinstance(v, MessageDocument))
+document = IsInstance(MessageDocument)
 """
 Document messages
 """
 
-video = Filter(lambda v: isinstance(v, MessageVideo))
+video = IsInstance(MessageVideo)
 """
 Video messages
 """
 
-sticker = Filter(lambda v: isinstance(v, MessageSticker))
+sticker = IsInstance(MessageSticker)
 """
 Sticker messages
 """
 
-animation = Filter(lambda v: isinstance(v, MessageAnimation))
+animation = IsInstance(MessageAnimation)
 """
 Animation messages
 """
 
-voice = Filter(lambda v: isinstance(v, MessageVoice))
+voice = IsInstance(MessageVoice)
 """
 Voice messages
 """
 
-audio = Filter(lambda v: isinstance(v, MessageAudio))
+audio = IsInstance(MessageAudio)
 """
 Audio messages
 """
 
-dice = Filter(lambda v: isinstance(v, MessageDice))
+dice = IsInstance(MessageDice)
 """
 Dice messages
 """
 
-video_note = Filter(lambda v: isinstance(v, MessageVideoNote))
+video_note = IsInstance(MessageVideoNote)
 """
 Video note messages
 """
 
-contact = Filter(lambda v: isinstance(v, MessageContact))
+contact = IsInstance(MessageContact)
 """
 Messages that share a contact
 """
 
-game = Filter(lambda v: isinstance(v, MessageGame))
+game = IsInstance(MessageGame)
 """
 Messages that share a game
 """
 
-poll = Filter(lambda v: isinstance(v, MessagePoll))
+poll = IsInstance(MessagePoll)
 """
 Poll messages
 """
 
-venue = Filter(lambda v: isinstance(v, MessageVenue))
+venue = IsInstance(MessageVenue)
 """
 Venue messages
 """
 
-location = Filter(lambda v: isinstance(v, MessageLocation))
+location = IsInstance(MessageLocation)
 """
 Location messages
 """
 
-successful_payment = Filter(lambda v: isinstance(v, MessageSuccessfulPayment))
+successful_payment = IsInstance(MessageSuccessfulPayment)
 """
 Successful payment messages
 """
 
-new_chat_members = Filter(lambda v: isinstance(v, MessageNewChatMembers))
+new_chat_members = IsInstance(MessageNewChatMembers)
 """
 Service message: new chat members
 """
 
-left_chat_member = Filter(lambda v: isinstance(v, MessageLeftChatMember))
+left_chat_member = IsInstance(MessageLeftChatMember)
 """
 Service message: left chat members
 """
 
-new_chat_title = Filter(lambda v: isinstance(v, MessageNewChatTitle))
+new_chat_title = IsInstance(MessageNewChatTitle)
 """
 Service message: new chat title
 """
 
-new_chat_photo = Filter(lambda v: isinstance(v, MessageNewChatPhoto))
+new_chat_photo = IsInstance(MessageNewChatPhoto)
 """
 Service message: new chat photo
 """
 
-deleted_chat_photo = Filter(lambda v: isinstance(v, MessageDeletedChatPhoto))
+deleted_chat_photo = IsInstance(MessageDeletedChatPhoto)
 """
 Service message: deleted chat photo
 """
 
-group_created = Filter(lambda v: isinstance(v, MessageGroupCreated))
+group_created = IsInstance(MessageGroupCreated)
 """
 Service message: group created
 """
 
-supergroup_created = Filter(lambda v: isinstance(v, MessageSupergroupCreated))
+supergroup_created = IsInstance(MessageSupergroupCreated)
 """
 Service message: supergroup created
 """
 
-channel_created = Filter(lambda v: isinstance(v, MessageChannelCreated))
+channel_created = IsInstance(MessageChannelCreated)
 """
 Service message: channel created
 """
 
-auto_delete_timer_changed = Filter(
-    lambda v: isinstance(v, MessageAutoDeleteTimerChanged)
-)
+auto_delete_timer_changed = IsInstance(MessageAutoDeleteTimerChanged)
 """
 Service message: auto delete timer changed
 """
 
-chat_migrated_to = Filter(lambda v: isinstance(v, MessageChatMigratedTo))
+chat_migrated_to = IsInstance(MessageChatMigratedTo)
 """
 Service message: chat migrated to
 """
 
-chat_migrated_from = Filter(lambda v: isinstance(v, MessageChatMigratedFrom))
+chat_migrated_from = IsInstance(MessageChatMigratedFrom)
 """
 Service message: chat migrated from
 """
 
-pinned_message = Filter(lambda v: isinstance(v, MessagePinnedMessage))
+pinned_message = IsInstance(MessagePinnedMessage)
 """
 Service message: pinned message
 """
 
-user_chared = Filter(lambda v: isinstance(v, MessageUserShared))
+user_chared = IsInstance(MessageUserShared)
 """
 Service message: user shared
 """
 
-write_access_allowed = Filter(lambda v: isinstance(v, MessageWriteAccessAllowed))
+write_access_allowed = IsInstance(MessageWriteAccessAllowed)
 """
 Service message: write access allowed
 """
 
-forum_topic_created = Filter(lambda v: isinstance(v, MessageForumTopicCreated))
+forum_topic_created = IsInstance(MessageForumTopicCreated)
 """
 Service message: forum topic created
 """
 
-forum_topic_edited = Filter(lambda v: isinstance(v, MessageForumTopicEdited))
+forum_topic_edited = IsInstance(MessageForumTopicEdited)
 """
 Service message: forum topic edited
 """
 
-forum_topic_closed = Filter(lambda v: isinstance(v, MessageForumTopicClosed))
+forum_topic_closed = IsInstance(MessageForumTopicClosed)
 """
 Service message: forum topic closed
 """
 
-forum_topic_reopened = Filter(lambda v: isinstance(v, MessageForumTopicReopened))
+forum_topic_reopened = IsInstance(MessageForumTopicReopened)
 """
 Service message: forum topic reopened
 """
 
-video_chat_scheduled = Filter(lambda v: isinstance(v, MessageVideoChatScheduled))
+video_chat_scheduled = IsInstance(MessageVideoChatScheduled)
 """
 Service message: video chat scheduled
 """
 
-video_chat_started = Filter(lambda v: isinstance(v, MessageVideoChatStarted))
+video_chat_started = IsInstance(MessageVideoChatStarted)
 """
 Service message: video chat started
 """
 
-video_chat_ended = Filter(lambda v: isinstance(v, MessageVideoChatEnded))
+video_chat_ended = IsInstance(MessageVideoChatEnded)
 """
 Service message: video chat ended
 """
 
-giveaway = Filter(lambda v: isinstance(v, MessageGiveaway))
+giveaway = IsInstance(MessageGiveaway)
 """
 Messages about giveaways
 """
 
-unsupported = Filter(lambda v: isinstance(v, MessageUnsupported))
+unsupported = IsInstance(MessageUnsupported)
 """
 Unsupported messages
 """
@@ -292,80 +595,71 @@ service = (
 Service messages
 """
 
-out = Filter(lambda v: hasattr(v, "out"))
+out = Attribute("out")
 """
 Messages that were sent by the current account
 """
 
-bot = Filter(lambda v: hasattr(v, "from_") and v.from_.is_bot)
+bot = Filter(lambda v: getattr(v, "from_", None) is not None and v.from_.is_bot)
 """
 Messages that were sent by bots
 """
 
-via_bot = Filter(lambda v: hasattr(v, "via_bot"))
+via_bot = Attribute("via_bot")
 """
 Messages that were sent via inline bots
 """
 
-sender_chat = Filter(lambda v: hasattr(v, "sender_chat"))
+sender_chat = Attribute("sender_chat")
 """
 Messages that were sent on behalf of chats
 """
 
-media_group = Filter(lambda v: hasattr(v, "media_group_id"))
+media_group = Attribute("media_group_id")
 """
 Messages that are part of a media group
 """
 
-reply = Filter(lambda v: hasattr(v, "reply_to_message_id"))
+reply = Attribute("reply_to_message_id")
 """
 Messages that are a reply to another message
 """
 
-reply_quote = Filter(lambda v: hasattr(v, "reply_quote"))
+reply_quote = Attribute("reply_quote")
 """Messages that have a reply_quote"""
 
-forward = Filter(lambda v: hasattr(v, "forward_date"))
+forward = Attribute("forward_from")
 """Messages that have been forwarded"""
 
-topic = Filter(lambda v: hasattr(v, "is_topic_message"))
+topic = Attribute("is_topic_message")
 """Updates from forums"""
 
-private = Filter(lambda v: hasattr(v, "chat") and v.chat.type == "private")
+private = ChatType({"private"})
 """Updates from private chats"""
 
-group = Filter(lambda v: hasattr(v, "chat") and v.chat.type in {"group", "supergroup"})
+group = ChatType({"group", "supergroup"})
 """Updates from groups and supergroups"""
 
-channel = Filter(lambda v: hasattr(v, "chat") and v.chat.type == "channel")
+channel = ChatType({"channel"})
 """Updates from channels"""
 
 
-def user(ids: Union[str, int, List[Union[str, int]]]) -> Filter:
-    """Filter messages coming from one or more users"""
-    ids = (
-        [ids.lower() if isinstance(ids, str) else ids]
-        if not isinstance(ids, list)
-        else [i.lower() if isinstance(i, str) else i for i in ids]
+def _peer(attribute: str, ids: Union[str, int, Iterable[Union[str, int]]]) -> Filter:
+    if isinstance(ids, (str, int)):
+        ids = (ids,)
+    ids = list(ids)
+    return Peer(
+        attribute,
+        {i for i in ids if isinstance(i, int)},
+        {i for i in ids if isinstance(i, str)},
     )
 
-    return Filter(
-        lambda v: getattr(v, "from_")
-        and (
-            v.from_.id in ids or (v.from_.username and v.from_.username.lower() in ids)
-        )
-    )
 
+def user(ids: Union[str, int, Iterable[Union[str, int]]]) -> Filter:
+    """Filter messages coming from one or more users"""
+    return _peer("from_", ids)
 
-def chat(ids: Union[str, int, List[Union[str, int]]]) -> Filter:
-    """Filter messages coming from one or more chats"""
-    ids = (
-        [ids.lower() if isinstance(ids, str) else ids]
-        if not isinstance(ids, list)
-        else [i.lower() if isinstance(i, str) else i for i in ids]
-    )
 
-    return Filter(
-        lambda v: getattr(v, "chat")
-        and (v.chat.id in ids or (v.chat.username and v.chat.username.lower() in ids))
-    )
+def chat(ids: Union[str, int, Iterable[Union[str, int]]]) -> Filter:
+    """Filter messages coming from one or more chats"""
+    return _peer("chat", ids)
@@ -0,0 +1,60 @@
+from typing import Any, Dict
+
+from . import filters
+from ._utils import to
+from .filters import ChatType, Filter, IsInstance, Not, Or, Peer, call_memoized
+from .types import Message, MessagePhoto, MessageText
+
+
+def message(**fields: Any) -> Any:
+    return to(Message, {"text": "", "entities": [], **fields}, None)
+
+
+def test_simplify() -> None:
+    assert ~~filters.text is filters.text
+    assert filters.text & filters.text is filters.text
+    assert isinstance(~filters.text, Not)
+    text_or_photo = filters.text | filters.photo
+    assert isinstance(text_or_photo, IsInstance)
+    assert text_or_photo.types == (MessageText, MessagePhoto)
+    assert isinstance(filters.service, IsInstance)
+    assert isinstance(filters.private | filters.group, ChatType)
+    users = filters.user([1, "A"]) | filters.user(2) | filters.chat(3)
+    assert isinstance(users, Or)
+    assert isinstance(users.operands[0], Peer)
+    assert users.operands[0].ids == {1, 2}
+    assert users.operands[0].usernames == {"a"}
+
+
+def test_evaluate() -> None:
+    private = {"type": "private", "id": 1, "firstName": "", "username": "Ab"}
+    group = {"type": "group", "id": 2, "title": ""}
+    assert (filters.text & filters.private)(message(chat=private))
+    assert not (filters.text & filters.private)(message(chat=group))
+    assert (filters.photo | filters.chat("aB"))(message(chat=private))
+    assert not filters.chat([2, "b"])(message(chat=private))
+    assert (~filters.user(1))(message(chat=private))
+    assert not filters.reply(message())
+    assert filters.reply(message(replyToMessageId=1))
+
+
+def test_call_memoized() -> None:
+    calls = 0
+
+    def expensive(v: Any) -> bool:
+        nonlocal calls
+        calls += 1
+        return True
+
+    shared = filters.text & Filter(expensive)
+    a = shared & filters.private
+    b = ~filters.photo & shared
+    memos: Dict[int, Any] = {}
+    value = message()
+    assert not call_memoized(a, value, memos)
+    assert call_memoized(b, value, memos)
+    assert call_memoized(lambda v: shared(v) and b(v), value, memos)
+    assert calls == 1
+
+    assert b(value) and b(value)
+    assert calls == 3
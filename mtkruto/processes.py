@@ -0,0 +1,243 @@
+"""Handling updates in several processes.
+
+One process polls for updates and sends them, still encoded, to a number of
+worker processes, each running its own `Client`. Updates of the same chat
+always go to the same worker, which handles them in order.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import queue
+import traceback
+import zlib
+from contextvars import ContextVar
+from multiprocessing.context import BaseContext
+from typing import TYPE_CHECKING, Any, Callable, List, NamedTuple, Optional, Tuple
+
+from ._dispatcher import Dispatcher, raw_chat_key_of
+from ._utils import to, union_dispatch
+from .errors import InputError, StopPropagation
+from .types import Update
+
+if TYPE_CHECKING:
+    from ._client import Client
+
+log = logging.getLogger(__name__)
+
+_errors: "ContextVar[List[str]]" = ContextVar("_errors")
+
+
+class Result(NamedTuple):
+    """The outcome of handling an update in a worker process."""
+
+    process: int
+    """The index of the worker process."""
+    update: int
+    """The sequence number that the polling process gave the update."""
+    chat_id: Optional[int]
+    """The chat that the update belongs to, if any."""
+    errors: Tuple[str, ...]
+    """Tracebacks of the exceptions raised by handlers."""
+
+
+def process_of(chat_id: int, processes: int) -> int:
+    """Return the index of the worker process that handles a chat."""
+    return zlib.crc32(chat_id.to_bytes(8, "little", signed=True)) % processes
+
+
+def run(
+    factory: Callable[[], "Client"],
+    processes: int,
+    *,
+    on_result: Optional[Callable[[Result], None]] = None,
+    max_pending: int = 1024,
+    context: Optional[BaseContext] = None,
+) -> None:
+    """Poll for updates here and handle them in `processes` worker processes.
+
+    `factory` is called once in every process, including this one, to create
+    its `Client` and register its handlers. With a `context` that does not
+    fork, it must be picklable. `on_result` is called in this process, from
+    the event loop, for every update once a worker is done with it; updates
+    whose handlers raised are also logged. At most `max_pending` updates wait
+    for each worker before polling pauses.
+    """
+    ctx: Any = context or multiprocessing.get_context()
+    updates = [ctx.Queue(max_pending) for _ in range(processes)]
+    results = ctx.Queue()
+    workers = [
+        ctx.Process(
+            target=_work,
+            args=(factory, i, updates[i], results),
+            name=f"mtkruto-worker-{i}",
+            daemon=True,
+        )
+        for i in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    try:
+        asyncio.run(_poll(factory, updates, results, on_result, workers))
+    finally:
+        for worker in workers:
+            worker.join()
+
+
+async def _poll(
+    factory: Callable[[], "Client"],
+    updates: List[Any],
+    results: Any,
+    on_result: Optional[Callable[[Result], None]],
+    workers: List[Any],
+) -> None:
+    loop = asyncio.get_running_loop()
+    collector = asyncio.ensure_future(_collect(results, on_result, workers))
+    client: Optional["Client"] = None
+    dispatch = union_dispatch(Update)
+    next_process = 0
+    sequence = 0
+    try:
+        client = factory()
+        while True:
+            try:
+                raw_updates = await client._request("getUpdates")
+            except InputError:
+                raise
+            except Exception as e:
+                await client._back_off(e)
+                continue
+            client._backoff.success()
+            types = client._handled_types
+            for raw in raw_updates:
+                if types is not None and dispatch.resolve(raw) not in types:
+                    continue
+                chat_id = raw_chat_key_of(raw)
+                if chat_id is None:
+                    process = next_process
+                    next_process = (next_process + 1) % len(updates)
+                else:
+                    process = process_of(chat_id, len(updates))
+                item = (sequence, chat_id, raw)
+                sequence += 1
+                try:
+                    updates[process].put_nowait(item)
+                except queue.Full:
+                    await loop.run_in_executor(None, updates[process].put, item)
+    finally:
+        # the workers handle what is left in their queues before they end, and
+        # their results must still be read, or they could block on a full pipe
+        # while exiting and never be joined
+        for queue_, worker in zip(updates, workers):
+            await loop.run_in_executor(None, _stop, queue_, worker)
+        await collector
+        if client is not None:
+            await client._http_client.close()
+
+
+def _stop(updates: Any, worker: Any) -> None:
+    # a worker that died leaves its queue full for good
+    while worker.is_alive():
+        try:
+            updates.put(None, timeout=1)
+            return
+        except queue.Full:
+            continue
+
+
+async def _collect(
+    results: Any, on_result: Optional[Callable[[Result], None]], workers: List[Any]
+) -> None:
+    loop = asyncio.get_running_loop()
+    ended = 0
+    while ended < len(workers):
+        try:
+            result: Optional[Result] = await loop.run_in_executor(
+                None, results.get, True, 1
+            )
+        except queue.Empty:
+            # a worker that crashed never sends its end marker
+            if not any(worker.is_alive() for worker in workers):
+                break
+            continue
+        if result is None:
+            ended += 1
+            continue
+        for error in result.errors:
+            log.error(
+                "Handling update %d in process %d failed:\n%s",
+                result.update,
+                result.process,
+                error,
+            )
+        if on_result:
+            try:
+                on_result(result)
+            except Exception:
+                log.exception("on_result failed")
+
+
+def _work(
+    factory: Callable[[], "Client"], process: int, updates: Any, results: Any
+) -> None:
+    try:
+        asyncio.run(_work_async(factory, process, updates, results))
+    finally:
+        # tell the polling process that this worker is done
+        results.put(None)
+
+
+async def _work_async(
+    factory: Callable[[], "Client"], process: int, updates: Any, results: Any
+) -> None:
+    client = factory()
+    for handler in client._handlers:
+        handler.callback = _reporting(handler.callback)
+
+    async def handle(item: Tuple[int, Optional[int], Any]) -> None:
+        sequence, chat_id, raw = item
+        errors: List[str] = []
+        token = _errors.set(errors)
+        try:
+            update = to(Update, raw, client, client._lazy_updates)
+            await client._handle_update(update)
+        except Exception:
+            errors.append(traceback.format_exc())
+        finally:
+            _errors.reset(token)
+        results.put(Result(process, sequence, chat_id, tuple(errors)))
+
+    dispatcher = (
+        Dispatcher(handle, client._workers, key=lambda item: item[1])
+        if client._workers
+        else None
+    )
+    loop = asyncio.get_running_loop()
+    try:
+        while True:
+            item = await loop.run_in_executor(None, updates.get)
+            if item is None:
+                if dispatcher:
+                    await dispatcher.join()
+                break
+            if dispatcher:
+                await dispatcher.put(item)
+            else:
+                await handle(item)
+    finally:
+        if dispatcher:
+            await dispatcher.close()
+        await client._http_client.close()
+
+
+def _reporting(callback: Callable[..., Any]) -> Callable[..., Any]:
+    async def reporting(client: "Client", update: Any) -> None:
+        try:
+            await callback(client, update)
+        except StopPropagation:
+            raise
+        except Exception:
+            _errors.get([]).append(traceback.format_exc())
+            raise
+
+    return reporting
@@ -0,0 +1,112 @@
+import asyncio
+import queue
+from typing import Any
+
+from ._client import Client, DeletedMessagesHandler, NewMessageHandler
+from .processes import (
+    Result,
+    _collect,
+    _errors,
+    _reporting,
+    _stop,
+    _work_async,
+    process_of,
+)
+
+
+def test_process_of() -> None:
+    assert process_of(-1001234567890, 4) == process_of(-1001234567890, 4)
+    assert {process_of(id, 4) for id in range(100)} == {0, 1, 2, 3}
+
+
+def test_work() -> None:
+    handled: list[int] = []
+
+    def factory() -> Client:
+        client = Client("http://localhost/", workers=2)
+
+        async def on_message(client: Client, message: Any) -> None:
+            handled.append(message.id)
+
+        async def on_deleted(client: Client, update: Any) -> None:
+            raise ValueError("oops")
+
+        client.add_handler(NewMessageHandler(on_message))
+        client.add_handler(DeletedMessagesHandler(on_deleted))
+        return client
+
+    updates: "queue.Queue[Any]" = queue.Queue()
+    results: "queue.Queue[Result]" = queue.Queue()
+    message = {"text": "", "entities": [], "chat": {"type": "private", "firstName": ""}}
+    for i in range(3):
+        updates.put((i, 1, {"message": {**message, "id": i}}))
+    updates.put((3, None, {"deletedMessages": []}))
+    updates.put(None)
+
+    asyncio.run(_work_async(factory, 7, updates, results))
+
+    assert handled == [0, 1, 2]
+    outcomes = sorted(results.get_nowait() for _ in range(4))
+    assert [r.update for r in outcomes] == [0, 1, 2, 3]
+    assert all(r.process == 7 and not r.errors for r in outcomes[:3])
+    assert "ValueError: oops" in outcomes[3].errors[0]
+
+
+def test_collect() -> None:
+    class Worker:
+        def __init__(self, alive: bool) -> None:
+            self.alive = alive
+
+        def is_alive(self) -> bool:
+            return self.alive
+
+    results: "queue.Queue[Any]" = queue.Queue()
+    for item in (Result(0, 0, 1, ()), None, Result(1, 1, 2, ()), None):
+        results.put(item)
+    collected: list[Result] = []
+    # every worker's results are read until each has ended
+    asyncio.run(_collect(results, collected.append, [Worker(True), Worker(True)]))
+    assert [r.update for r in collected] == [0, 1]
+
+    results.put(Result(0, 2, 1, ()))
+    results.put(None)
+    # a worker that died without ending is not waited for
+    asyncio.run(_collect(results, collected.append, [Worker(False), Worker(False)]))
+    assert [r.update for r in collected] == [0, 1, 2]
+
+
+def test_stop() -> None:
+    class Worker:
+        def __init__(self, alive: bool) -> None:
+            self.alive = alive
+
+        def is_alive(self) -> bool:
+            return self.alive
+
+    updates: "queue.Queue[Any]" = queue.Queue(1)
+    _stop(updates, Worker(True))
+    assert updates.get_nowait() is None
+
+    # the full queue of a dead worker is given up on
+    updates.put(0)
+    _stop(updates, Worker(False))
+    assert updates.get_nowait() == 0
+
+
+def test_reporting_cancelled() -> None:
+    async def callback(client: Any, update: Any) -> None:
+        raise asyncio.CancelledError
+
+    async def main() -> list[str]:
+        errors: list[str] = []
+        token = _errors.set(errors)
+        try:
+            await _reporting(callback)(None, None)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            _errors.reset(token)
+        return errors
+
+    # a handler cancelled by its deadline is not a failure
+    assert asyncio.run(main()) == []
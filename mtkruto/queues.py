@@ -0,0 +1,178 @@
+"""Queues and lanes of updates between polling and handling."""
+
+import asyncio
+from collections import Counter, deque
+from datetime import datetime, timezone
+from typing import Any, Collection, Deque, Literal, NamedTuple, Optional, Tuple
+
+from ._utils import fields_of
+
+
+def date_of(update: Any) -> Optional[datetime]:
+    """Return the date of the message, or other event, that an update is about.
+
+    For an edited message, that is the date of the edit.
+    """
+    fields = fields_of(update.__class__)
+    if not fields:
+        return None
+    value = getattr(update, fields[0][0], None)
+    # an edit is as recent as the edit itself, not as the edited message
+    date = getattr(value, "edit_date", None) or getattr(value, "date", None)
+    if not isinstance(date, datetime):
+        return None
+    return date if date.tzinfo else date.replace(tzinfo=timezone.utc)
+
+
+class Lane(NamedTuple):
+    """A dispatch lane, handling updates of `types` with its own `workers`.
+
+    Updates of a lane's types are handled concurrently by the lane's workers,
+    keeping each chat's order, and never wait for the workers of other lanes.
+    They are also taken from the client's update queue, or from each batch of
+    polled updates, before the updates of other types.
+    """
+
+    types: Tuple[type, ...]
+    workers: int
+    max_pending: int = 1024
+
+
+class UpdateQueue:
+    """A bounded queue of updates that can shed load.
+
+    When the queue is full, an incoming update of one of the `shed` types is
+    dropped, or else the oldest queued update of those types is dropped to
+    make room. If there is none, `overflow` decides: `"block"` waits for room,
+    `"drop_oldest"` drops the oldest queued update and `"drop_newest"` drops
+    the incoming one.
+
+    Updates of the `priority` types are taken from the queue before any
+    other update. They are never evicted, and when one arrives at a full
+    queue, it evicts the oldest other update whatever the `overflow` policy,
+    so that it never waits behind them. It only waits, or is dropped, when
+    the queue is full of priority updates.
+
+    With `max_age`, updates whose date is more than that many seconds ago by
+    the time they are taken from the queue are dropped.
+
+    The number of dropped updates is counted in `dropped` by reason: `"type"`,
+    `"overflow"` or `"age"`.
+
+    As with `asyncio.Queue`, a `maxsize` of 0 or less means no bound.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        *,
+        overflow: Literal["block", "drop_oldest", "drop_newest"] = "block",
+        shed: Collection[type] = (),
+        priority: Collection[type] = (),
+        max_age: Optional[float] = None,
+    ) -> None:
+        self.maxsize = maxsize
+        self.overflow = overflow
+        self.shed = tuple(shed)
+        self.priority = tuple(priority)
+        self.max_age = max_age
+        self.dropped: Counter[str] = Counter()
+        self._updates: Deque[Tuple[int, Any]] = deque()
+        self._shed_updates: Deque[Tuple[int, Any]] = deque()
+        self._priority_updates: Deque[Any] = deque()
+        self._sequence = 0
+        self._getters: Deque[asyncio.Future[None]] = deque()
+        self._putters: Deque[asyncio.Future[None]] = deque()
+        self._error: Optional[BaseException] = None
+
+    def __len__(self) -> int:
+        return (
+            len(self._updates) + len(self._shed_updates) + len(self._priority_updates)
+        )
+
+    async def put(self, update: Any, *, priority: bool = False) -> None:
+        """Queue an update, or drop an update if the queue is full.
+
+        With `priority`, the update is queued as if it were of one of the
+        `priority` types.
+        """
+        priority = priority or isinstance(update, self.priority)
+        shed = not priority and isinstance(update, self.shed)
+        while 0 < self.maxsize <= len(self):
+            if shed:
+                self.dropped["type"] += 1
+                return
+            if self._shed_updates:
+                self._shed_updates.popleft()
+                self.dropped["type"] += 1
+            elif self._updates and (self.overflow == "drop_oldest" or priority):
+                self._updates.popleft()
+                self.dropped["overflow"] += 1
+            elif self.overflow != "block":
+                self.dropped["overflow"] += 1
+                return
+            else:
+                await self._wait(self._putters)
+        if priority:
+            self._priority_updates.append(update)
+        else:
+            queue = self._shed_updates if shed else self._updates
+            queue.append((self._sequence, update))
+            self._sequence += 1
+        self._wake(self._getters)
+
+    async def get(self) -> Any:
+        """Take the oldest update that is not too old, waiting for one if the
+        queue is empty."""
+        while True:
+            while not len(self):
+                if self._error is not None:
+                    raise self._error
+                await self._wait(self._getters)
+            update = self._pop()
+            self._wake(self._putters)
+            if self.max_age is not None:
+                date = date_of(update)
+                if (
+                    date is not None
+                    and (datetime.now(timezone.utc) - date).total_seconds()
+                    > self.max_age
+                ):
+                    self.dropped["age"] += 1
+                    continue
+            return update
+
+    def close(self, error: BaseException) -> None:
+        """Make `get` raise `error` once the queue is empty."""
+        self._error = error
+        while self._getters:
+            self._wake(self._getters)
+
+    def _pop(self) -> Any:
+        if self._priority_updates:
+            return self._priority_updates.popleft()
+        updates, shed_updates = self._updates, self._shed_updates
+        if not shed_updates or (updates and updates[0][0] < shed_updates[0][0]):
+            return updates.popleft()[1]
+        return shed_updates.popleft()[1]
+
+    async def _wait(self, waiters: "Deque[asyncio.Future[None]]") -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter in waiters:
+                waiters.remove(waiter)
+            elif not waiter.cancelled():
+                # woken just before being cancelled; pass the wakeup on
+                self._wake(waiters)
+            raise
+
+    @staticmethod
+    def _wake(waiters: "Deque[asyncio.Future[None]]") -> None:
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
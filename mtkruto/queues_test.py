@@ -0,0 +1,154 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from ._utils import to
+from .queues import UpdateQueue, date_of
+from .types import (
+    Update,
+    UpdateMessageEdited,
+    UpdateMessageReactions,
+    UpdateNewMessage,
+)
+
+
+def message(id: int, age: float = 0, edit_age: Optional[float] = None) -> Any:
+    now = datetime.now(timezone.utc)
+    raw = {
+        "id": id,
+        "text": "",
+        "entities": [],
+        "date": {"_": "date", "value": (now - timedelta(seconds=age)).isoformat()},
+    }
+    if edit_age is None:
+        return to(Update, {"message": raw}, None)
+    edit_date = now - timedelta(seconds=edit_age)
+    raw["editDate"] = {"_": "date", "value": edit_date.isoformat()}
+    return to(Update, {"editedMessage": raw}, None)
+
+
+def reactions() -> Any:
+    return UpdateMessageReactions.__new__(UpdateMessageReactions)
+
+
+def drain(queue: UpdateQueue) -> list[Any]:
+    async def main() -> list[Any]:
+        return [await queue.get() for _ in range(len(queue))]
+
+    return asyncio.run(main())
+
+
+def test_date_of() -> None:
+    update = message(1, 60)
+    assert isinstance(update, UpdateNewMessage)
+    assert date_of(update) == update.message.date
+    update = message(1, 60, 10)
+    assert isinstance(update, UpdateMessageEdited)
+    assert date_of(update) == update.edited_message.edit_date
+
+
+def test_overflow() -> None:
+    for overflow, ids in (("drop_oldest", [2, 3]), ("drop_newest", [1, 2])):
+        queue = UpdateQueue(2, overflow=overflow)  # type: ignore[arg-type]
+        for id in (1, 2, 3):
+            asyncio.run(queue.put(message(id)))
+        assert [u.message.id for u in drain(queue)] == ids
+        assert queue.dropped == {"overflow": 1}
+
+
+def test_block() -> None:
+    async def main() -> None:
+        queue = UpdateQueue(1)
+        await queue.put(message(1))
+        put = asyncio.ensure_future(queue.put(message(2)))
+        await asyncio.sleep(0)
+        assert not put.done()
+        assert (await queue.get()).message.id == 1
+        await put
+        assert (await queue.get()).message.id == 2
+
+    asyncio.run(main())
+
+
+def test_unbounded() -> None:
+    for overflow in ("block", "drop_oldest", "drop_newest"):
+        queue = UpdateQueue(0, overflow=overflow)
+        for id in (1, 2, 3):
+            asyncio.run(asyncio.wait_for(queue.put(message(id)), 1))
+        assert [u.message.id for u in drain(queue)] == [1, 2, 3]
+        assert not queue.dropped
+
+
+def test_shed() -> None:
+    queue = UpdateQueue(2, overflow="drop_newest", shed=[UpdateMessageReactions])
+    for update in (reactions(), message(2), message(3), reactions()):
+        asyncio.run(queue.put(update))
+    assert [u.message.id for u in drain(queue)] == [2, 3]
+    assert queue.dropped == {"type": 2}
+
+
+def test_max_age() -> None:
+    queue = UpdateQueue(3, max_age=30)
+    for update in (message(1, 60), message(2), message(3, 90)):
+        asyncio.run(queue.put(update))
+
+    async def main() -> Any:
+        return await queue.get()
+
+    assert asyncio.run(main()).message.id == 2
+    assert queue.dropped == {"age": 1}
+    assert len(queue) == 1
+
+
+def test_priority() -> None:
+    queue = UpdateQueue(2, overflow="drop_newest", priority=[UpdateMessageReactions])
+    for update in (message(1), message(2), reactions()):
+        asyncio.run(queue.put(update))
+    updates = drain(queue)
+    assert isinstance(updates[0], UpdateMessageReactions)
+    assert updates[1].message.id == 2
+    assert queue.dropped == {"overflow": 1}
+
+
+def test_put_priority() -> None:
+    queue = UpdateQueue(2)
+    for update, priority in ((message(1), False), (message(2), True)):
+        asyncio.run(queue.put(update, priority=priority))
+    assert [update.message.id for update in drain(queue)] == [2, 1]
+    assert queue.priority == ()
+
+
+def test_max_age_edited() -> None:
+    queue = UpdateQueue(2, max_age=30)
+    # old messages, edited long ago and just now
+    for update in (message(1, 3600, 60), message(2, 3600, 0)):
+        asyncio.run(queue.put(update))
+
+    async def main() -> Any:
+        return await queue.get()
+
+    assert asyncio.run(main()).edited_message.id == 2
+    assert queue.dropped == {"age": 1}
+
+
+def test_priority_block() -> None:
+    async def main() -> None:
+        queue = UpdateQueue(2, priority=[UpdateMessageReactions])
+        for update in (message(1), message(2)):
+            await queue.put(update)
+        # a priority update does not wait behind the backlog
+        await asyncio.wait_for(queue.put(reactions()), 1)
+        assert queue.dropped == {"overflow": 1}
+        assert isinstance(await queue.get(), UpdateMessageReactions)
+        assert (await queue.get()).message.id == 2
+
+        # but it does wait once only priority updates are queued
+        for _ in range(2):
+            await queue.put(reactions())
+        put = asyncio.ensure_future(queue.put(reactions()))
+        await asyncio.sleep(0)
+        assert not put.done()
+        await queue.get()
+        await put
+
+    asyncio.run(main())
@@ -1,29 +1,41 @@
+from __future__ import annotations
+
 import datetime
-from typing import Annotated, Any, List, Literal, Optional, Union
+from typing import TYPE_CHECKING, Annotated, Any, List, Literal, Optional, Union
 
 FileSource = Union[str, bytes]
 
 
 class _Type:
+    __slots__ = ("_client", "_raw")
+
     _client: Any
 
+    if not TYPE_CHECKING:
+
+        def __getattr__(self, name: str) -> Any:
+            # fields of lazily decoded objects are decoded on first access
+            if name.startswith("_") or not hasattr(self, "_raw"):
+                raise AttributeError(name)
+            from ._utils import materialize
+
+            return materialize(self, name)
+
     def __repr__(self) -> str:
         return "{}({})".format(
             self.__class__.__name__,
             ", ".join(
-                map(
-                    lambda v: "=".join(v),
-                    [
-                        [k, repr(v)]
-                        for k, v in self.__dict__.items()
-                        if not k.startswith("_")
-                    ],
-                )
+                "{}={!r}".format(k, getattr(self, k))
+                for c in self.__class__.__mro__
+                for k in c.__dict__.get("__slots__", ())
+                if not k.startswith("_")
             ),
         )
 
 
 class Birthday(_Type):
+    __slots__ = ("day", "month", "year")
+
     day: Annotated[int, "day"]
     month: Annotated[int, "month"]
     year: Annotated[Optional[int], "year"]
@@ -41,6 +53,8 @@ class Birthday(_Type):
 
 
 class BotCommand(_Type):
+    __slots__ = ("command", "description")
+
     command: Annotated[str, "command"]
     description: Annotated[str, "description"]
 
@@ -54,6 +68,8 @@ class BotCommand(_Type):
 
 
 class CallbackQueryAnswer(_Type):
+    __slots__ = ("alert", "text", "url")
+
     alert: Annotated[bool, "alert"]
     text: Annotated[str, "text"]
     url: Annotated[str, "url"]
@@ -70,6 +86,8 @@ class CallbackQueryAnswer(_Type):
 
 
 class CallbackQueryQuestionGame(_Type):
+    __slots__ = ("type",)
+
     type: Annotated[Literal["game"], "type"]
 
     def __init__(
@@ -82,6 +100,8 @@ class CallbackQueryQuestionGame(_Type):
 
 
 class CallbackQueryQuestionPassword(_Type):
+    __slots__ = ("type", "data", "password")
+
     type: Annotated[Literal["password"], "type"]
     data: Annotated[str, "data"]
     password: Annotated[str, "password"]
@@ -100,6 +120,8 @@ class CallbackQueryQuestionPassword(_Type):
 
 
 class CallbackQueryQuestionButton(_Type):
+    __slots__ = ("type", "data")
+
     type: Annotated[Literal["button"], "type"]
     data: Annotated[str, "data"]
 
@@ -136,6 +158,21 @@ ChatAction = Union[
 
 
 class ChatAdministratorRights(_Type):
+    __slots__ = (
+        "is_anonymous",
+        "can_manage_chat",
+        "can_delete_messages",
+        "can_manage_video_chats",
+        "can_restrict_members",
+        "can_promote_members",
+        "can_change_info",
+        "can_invite_users",
+        "can_post_messages",
+        "can_edit_messages",
+        "can_pin_messages",
+        "can_manage_topics",
+    )
+
     is_anonymous: Annotated[bool, "isAnonymous"]
     can_manage_chat: Annotated[bool, "canManageChat"]
     can_delete_messages: Annotated[bool, "canDeleteMessages"]
@@ -180,6 +217,26 @@ class ChatAdministratorRights(_Type):
 
 
 class ChatMemberRights(_Type):
+    __slots__ = (
+        "can_send_messages",
+        "can_send_audio",
+        "can_send_documents",
+        "can_send_photos",
+        "can_send_videos",
+        "can_send_video_notes",
+        "can_send_voice",
+        "can_send_polls",
+        "can_send_stickers",
+        "can_send_animations",
+        "can_send_games",
+        "can_send_inline_bot_results",
+        "can_add_web_page_previews",
+        "can_change_info",
+        "can_invite_users",
+        "can_pin_messages",
+        "can_manage_topics",
+    )
+
     can_send_messages: Annotated[Optional[bool], "canSendMessages"]
     can_send_audio: Annotated[Optional[bool], "canSendAudio"]
     can_send_documents: Annotated[Optional[bool], "canSendDocuments"]
@@ -243,6 +300,15 @@ class ChatMemberRights(_Type):
 
 
 class ChatPhoto(_Type):
+    __slots__ = (
+        "small_file_id",
+        "small_file_unique_id",
+        "big_file_id",
+        "big_file_unique_id",
+        "has_video",
+        "personal",
+    )
+
     small_file_id: Annotated[str, "smallFileId"]
     small_file_unique_id: Annotated[str, "smallFileUniqueId"]
     big_file_id: Annotated[str, "bigFileId"]
@@ -275,6 +341,8 @@ ConnectionStateReady = Literal["ready"]
 
 
 class Contact(_Type):
+    __slots__ = ("phone_number", "first_name", "last_name", "user_id", "vcard")
+
     phone_number: Annotated[str, "phoneNumber"]
     first_name: Annotated[str, "firstName"]
     last_name: Annotated[Optional[str], "lastName"]
@@ -298,6 +366,8 @@ class Contact(_Type):
 
 
 class Dice(_Type):
+    __slots__ = ("emoji", "value")
+
     emoji: Annotated[str, "emoji"]
     value: Annotated[int, "value"]
 
@@ -311,6 +381,12 @@ class Dice(_Type):
 
 
 class FailedInvitation(_Type):
+    __slots__ = (
+        "user_id",
+        "premium_required_to_invite",
+        "premium_required_to_send_message",
+    )
+
     user_id: Annotated[int, "userId"]
     premium_required_to_invite: Annotated[bool, "premiumRequiredToInvite"]
     premium_required_to_send_message: Annotated[bool, "premiumRequiredToSendMessage"]
@@ -329,6 +405,14 @@ class FailedInvitation(_Type):
 
 
 class GiveawayParameters(_Type):
+    __slots__ = (
+        "boosted_chat_id",
+        "additional_chat_ids",
+        "winner_selection_date",
+        "only_new_members",
+        "countries",
+    )
+
     boosted_chat_id: Annotated[int, "boostedChatId"]
     additional_chat_ids: Annotated[list[int], "additionalChatIds"]
     winner_selection_date: Annotated[datetime.datetime, "winnerSelectionDate"]
@@ -354,6 +438,8 @@ ID = Union[int, str, Literal["me"]]
 
 
 class Invoice(_Type):
+    __slots__ = ("title", "description", "start_parameter", "currency", "total_amount")
+
     title: Annotated[str, "title"]
     description: Annotated[str, "description"]
     start_parameter: Annotated[str, "startParameter"]
@@ -376,6 +462,8 @@ class Invoice(_Type):
 
 
 class KeyboardButtonPollType(_Type):
+    __slots__ = ("type",)
+
     type: Annotated[Optional[Any], "type"]
 
     def __init__(
@@ -387,6 +475,8 @@ class KeyboardButtonPollType(_Type):
 
 
 class LinkPreview(_Type):
+    __slots__ = ("disable", "url", "small_media", "large_media", "above_text")
+
     disable: Annotated[Optional[bool], "disable"]
     url: Annotated[Optional[str], "url"]
     small_media: Annotated[Optional[bool], "smallMedia"]
@@ -410,6 +500,8 @@ class LinkPreview(_Type):
 
 
 class LiveStreamChannel(_Type):
+    __slots__ = ("id", "scale", "timestamp")
+
     id: Annotated[int, "id"]
     scale: Annotated[int, "scale"]
     timestamp: Annotated[int, "timestamp"]
@@ -426,6 +518,15 @@ class LiveStreamChannel(_Type):
 
 
 class Location(_Type):
+    __slots__ = (
+        "latitude",
+        "longitude",
+        "horizontal_accuracy",
+        "live_period",
+        "heading",
+        "proximity_alert_radius",
+    )
+
     latitude: Annotated[int, "latitude"]
     longitude: Annotated[int, "longitude"]
     horizontal_accuracy: Annotated[Optional[int], "horizontalAccuracy"]
@@ -452,6 +553,8 @@ class Location(_Type):
 
 
 class LoginUrl(_Type):
+    __slots__ = ("url", "forward_text", "bot_username", "request_write_access")
+
     url: Annotated[str, "url"]
     forward_text: Annotated[Optional[str], "forwardText"]
     bot_username: Annotated[Optional[str], "botUsername"]
@@ -472,6 +575,8 @@ class LoginUrl(_Type):
 
 
 class MaskPosition(_Type):
+    __slots__ = ("point", "x_shift", "y_shift", "scale")
+
     point: Annotated[Any, "point"]
     x_shift: Annotated[int, "xShift"]
     y_shift: Annotated[int, "yShift"]
@@ -514,6 +619,8 @@ MessageEntityType = Union[
 
 
 class _MessageEntityBase(_Type):
+    __slots__ = ("type", "offset", "length")
+
     type: Annotated["MessageEntityType", "type"]
     offset: Annotated[int, "offset"]
     length: Annotated[int, "length"]
@@ -530,6 +637,8 @@ class _MessageEntityBase(_Type):
 
 
 class MessageEntityMention(_MessageEntityBase):
+    __slots__ = ()
+
     type: Annotated[Literal["mention"], "type"]
 
     def __init__(
@@ -546,6 +655,8 @@ class MessageEntityMention(_MessageEntityBase):
 
 
 class MessageEntityHashtag(_MessageEntityBase):
+    __slots__ = ()
+
     type: Annotated[Literal["hashtag"], "type"]
 
     def __init__(
@@ -562,6 +673,8 @@ class MessageEntityHashtag(_MessageEntityBase):
 
 
 class MessageEntityBotCommand(_MessageEntityBase):
+    __slots__ = ()
+
     type: Annotated[Literal["botCommand"], "type"]
 
     def __init__(
@@ -578,6 +691,8 @@ class MessageEntityBotCommand(_MessageEntityBase):
 
 
 class MessageEntityURL(_MessageEntityBase):
+    __slots__ = ()
+
     type: Annotated[Literal["url"], "type"]
 
     def __init__(
@@ -594,6 +709,8 @@ class MessageEntityURL(_MessageEntityBase):
 
 
 class MessageEntityEmailAddress(_MessageEntityBase):
+    __slots__ = ()
+
     type: Annotated[Literal["email"], "type"]
 
     def __init__(
@@ -610,6 +727,8 @@ class MessageEntityEmailAddress(_MessageEntityBase):
 
 
 class MessageEntityBold(_MessageEntityBase):
+    __slots__ = ()
+
     type: Annotated[Literal["bold"], "type"]
 
     def __init__(
@@ -626,6 +745,8 @@ class MessageEntityBold(_MessageEntityBase):
 
 
 class MessageEntityItalic(_MessageEntityBase):
+    __slots__ = ()
+
     type: Annotated[Literal["italic"], "type"]
 
     def __init__(
@@ -642,6 +763,8 @@ class MessageEntityItalic(_MessageEntityBase):
 
 
 class MessageEntityPre(_MessageEntityBase):
+    __slots__ = ("language",)
+
     type: Annotated[Literal["pre"], "type"]
     language: Annotated[str, "language"]
 
@@ -661,6 +784,8 @@ class MessageEntityPre(_MessageEntityBase):
 
 
 class MessageEntityCode(_MessageEntityBase):
+    __slots__ = ()
+
     type: Annotated[Literal["code"], "type"]
 
     def __init__(
@@ -677,6 +802,8 @@ class MessageEntityCode(_MessageEntityBase):
 
 
 class MessageEntityTextLink(_MessageEntityBase):
+    __slots__ = ("url",)
+
     type: Annotated[Literal["textLink"], "type"]
     url: Annotated[str, "url"]
 
@@ -696,6 +823,8 @@ class MessageEntityTextLink(_MessageEntityBase):
 
 
 class MessageEntityTextMention(_MessageEntityBase):
+    __slots__ = ("user_id",)
+
     type: Annotated[Literal["textMention"], "type"]
     user_id: Annotated[int, "userId"]
 
@@ -715,6 +844,8 @@ class MessageEntityTextMention(_MessageEntityBase):
 
 
 class MessageEntityCashtag(_MessageEntityBase):
+    __slots__ = ()
+
     type: Annotated[Literal["cashtag"], "type"]
 
     def __init__(
@@ -731,6 +862,8 @@ class MessageEntityCashtag(_MessageEntityBase):
 
 
 class MessageEntityPhoneNumber(_MessageEntityBase):
+    __slots__ = ()
+
     type: Annotated[Literal["phoneNumber"], "type"]
 
     def __init__(
@@ -747,6 +880,8 @@ class MessageEntityPhoneNumber(_MessageEntityBase):
 
 
 class MessageEntityUnderline(_MessageEntityBase):
+    __slots__ = ()
+
     type: Annotated[Literal["underline"], "type"]
 
     def __init__(
@@ -763,6 +898,8 @@ class MessageEntityUnderline(_MessageEntityBase):
 
 
 class MessageEntityStrikethrough(_MessageEntityBase):
+    __slots__ = ()
+
     type: Annotated[Literal["strikethrough"], "type"]
 
     def __init__(
@@ -779,6 +916,8 @@ class MessageEntityStrikethrough(_MessageEntityBase):
 
 
 class MessageEntityBlockquote(_MessageEntityBase):
+    __slots__ = ("collapsible",)
+
     type: Annotated[Literal["blockquote"], "type"]
     collapsible: Annotated[Optional[Literal[True]], "collapsible"]
 
@@ -799,6 +938,8 @@ class MessageEntityBlockquote(_MessageEntityBase):
 
 
 class MessageEntityBankCard(_MessageEntityBase):
+    __slots__ = ()
+
     type: Annotated[Literal["bankCard"], "type"]
 
     def __init__(
@@ -815,6 +956,8 @@ class MessageEntityBankCard(_MessageEntityBase):
 
 
 class MessageEntitySpoiler(_MessageEntityBase):
+    __slots__ = ()
+
     type: Annotated[Literal["spoiler"], "type"]
 
     def __init__(
@@ -831,6 +974,8 @@ class MessageEntitySpoiler(_MessageEntityBase):
 
 
 class MessageEntityCustomEmoji(_MessageEntityBase):
+    __slots__ = ("custom_emoji_id",)
+
     type: Annotated[Literal["customEmoji"], "type"]
     custom_emoji_id: Annotated[str, "customEmojiId"]
 
@@ -873,6 +1018,8 @@ MessageEntity = Union[
 
 
 class MessageReference(_Type):
+    __slots__ = ("chat_id", "message_id")
+
     chat_id: Annotated[int, "chatId"]
     message_id: Annotated[int, "messageId"]
 
@@ -904,6 +1051,8 @@ MessageSearchFilter = Union[
 
 
 class MiniAppInfo(_Type):
+    __slots__ = ("url",)
+
     url: Annotated[str, "url"]
 
     def __init__(
@@ -914,6 +1063,8 @@ class MiniAppInfo(_Type):
 
 
 class NetworkStatisticsEntry(_Type):
+    __slots__ = ("sent", "received")
+
     sent: Annotated[int, "sent"]
     received: Annotated[int, "received"]
 
@@ -927,6 +1078,8 @@ class NetworkStatisticsEntry(_Type):
 
 
 class OpeningHours(_Type):
+    __slots__ = ("timezone", "intervals")
+
     timezone: Annotated[str, "timezone"]
     intervals: Annotated[list[Any], "intervals"]
 
@@ -943,6 +1096,8 @@ ParseMode = Union[Literal["HTML"], Literal["Markdown"], None]
 
 
 class PriceTag(_Type):
+    __slots__ = ("label", "amount")
+
     label: Annotated[str, "label"]
     amount: Annotated[int, "amount"]
 
@@ -956,6 +1111,14 @@ class PriceTag(_Type):
 
 
 class RefundedPayment(_Type):
+    __slots__ = (
+        "currency",
+        "total_amount",
+        "invoice_payload",
+        "telegram_payment_charge_id",
+        "provider_payment_charge_id",
+    )
+
     currency: Annotated[str, "currency"]
     total_amount: Annotated[int, "totalAmount"]
     invoice_payload: Annotated[str, "invoicePayload"]
@@ -981,6 +1144,8 @@ class RefundedPayment(_Type):
 
 
 class ReactionEmoji(_Type):
+    __slots__ = ("type", "emoji")
+
     type: Annotated[Literal["emoji"], "type"]
     emoji: Annotated[str, "emoji"]
 
@@ -994,6 +1159,8 @@ class ReactionEmoji(_Type):
 
 
 class ReactionCustom(_Type):
+    __slots__ = ("type", "id")
+
     type: Annotated[Literal["custom"], "type"]
     id: Annotated[str, "id"]
 
@@ -1007,6 +1174,8 @@ class ReactionCustom(_Type):
 
 
 class ReactionPaid(_Type):
+    __slots__ = ("type",)
+
     type: Annotated[Literal["paid"], "type"]
 
     def __init__(
@@ -1020,6 +1189,8 @@ Reaction = Union[ReactionEmoji, ReactionCustom, ReactionPaid]
 
 
 class RestrictionReason(_Type):
+    __slots__ = ("platform", "reason", "text")
+
     platform: Annotated[str, "platform"]
     reason: Annotated[str, "reason"]
     text: Annotated[str, "text"]
@@ -1043,6 +1214,15 @@ SelfDestructOption = Union[SelfDestructAfterOpen, SelfDestructAfterSeconds]
 
 
 class ShippingAddress(_Type):
+    __slots__ = (
+        "country_code",
+        "state",
+        "city",
+        "street_line1",
+        "street_line2",
+        "post_code",
+    )
+
     country_code: Annotated[str, "countryCode"]
     state: Annotated[str, "state"]
     city: Annotated[str, "city"]
@@ -1068,6 +1248,8 @@ class ShippingAddress(_Type):
 
 
 class StoryReference(_Type):
+    __slots__ = ("chat_id", "story_id")
+
     chat_id: Annotated[int, "chatId"]
     story_id: Annotated[int, "storyId"]
 
@@ -1081,6 +1263,8 @@ class StoryReference(_Type):
 
 
 class SwitchInlineQueryChosenChats(_Type):
+    __slots__ = ("query", "allow_users", "allow_bots", "allow_groups", "allow_channels")
+
     query: Annotated[str, "query"]
     allow_users: Annotated[Optional[bool], "allowUsers"]
     allow_bots: Annotated[Optional[bool], "allowBots"]
@@ -1104,6 +1288,8 @@ class SwitchInlineQueryChosenChats(_Type):
 
 
 class Thumbnail(_Type):
+    __slots__ = ("file_id", "file_unique_id", "width", "height", "file_size")
+
     file_id: Annotated[str, "fileId"]
     file_unique_id: Annotated[str, "fileUniqueId"]
     width: Annotated[int, "width"]
@@ -1126,16 +1312,14 @@ class Thumbnail(_Type):
 
 
 class _VideoChatCommon(_Type):
-    id: Annotated[str, "id"]
+    __slots__ = ()
 
-    def __init__(
-        self,
-        id: Annotated[str, "id"],
-    ):
-        self.id = id
+    id: Annotated[str, "id"]
 
 
 class _VideoChatNotEndedCommon(_Type):
+    __slots__ = ("title", "live_stream", "participant_count")
+
     title: Annotated[str, "title"]
     live_stream: Annotated[bool, "liveStream"]
     participant_count: Annotated[int, "participantCount"]
@@ -1152,6 +1336,8 @@ class _VideoChatNotEndedCommon(_Type):
 
 
 class VideoChatActive(_VideoChatCommon, _VideoChatNotEndedCommon):
+    __slots__ = ("type", "recording", "id")
+
     type: Annotated[Literal["active"], "type"]
     recording: Annotated[bool, "recording"]
 
@@ -1173,6 +1359,8 @@ class VideoChatActive(_VideoChatCommon, _VideoChatNotEndedCommon):
 
 
 class VideoChatScheduled(_VideoChatCommon, _VideoChatNotEndedCommon):
+    __slots__ = ("type", "scheduled_for", "id")
+
     type: Annotated[Literal["scheduled"], "type"]
     scheduled_for: Annotated[datetime.datetime, "scheduledFor"]
 
@@ -1194,6 +1382,8 @@ class VideoChatScheduled(_VideoChatCommon, _VideoChatNotEndedCommon):
 
 
 class VideoChatEnded(_VideoChatCommon):
+    __slots__ = ("type", "duration", "id")
+
     type: Annotated[Literal["ended"], "type"]
     duration: Annotated[int, "duration"]
 
@@ -1212,6 +1402,8 @@ VideoChat = Union[VideoChatActive, VideoChatScheduled, VideoChatEnded]
 
 
 class Voice(_Type):
+    __slots__ = ("file_id", "file_unique_id", "duration", "mime_type", "file_size")
+
     file_id: Annotated[str, "fileId"]
     file_unique_id: Annotated[str, "fileUniqueId"]
     duration: Annotated[int, "duration"]
@@ -1234,6 +1426,18 @@ class Voice(_Type):
 
 
 class Animation(_Type):
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "width",
+        "height",
+        "duration",
+        "thumbnails",
+        "file_name",
+        "mime_type",
+        "file_size",
+    )
+
     file_id: Annotated[str, "fileId"]
     file_unique_id: Annotated[str, "fileUniqueId"]
     width: Annotated[int, "width"]
@@ -1269,6 +1473,17 @@ class Animation(_Type):
 
 
 class Audio(_Type):
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "duration",
+        "performer",
+        "title",
+        "mime_type",
+        "file_size",
+        "thumbnails",
+    )
+
     file_id: Annotated[str, "fileId"]
     file_unique_id: Annotated[str, "fileUniqueId"]
     duration: Annotated[int, "duration"]
@@ -1301,6 +1516,8 @@ class Audio(_Type):
 
 
 class BotCommandScopeDefault(_Type):
+    __slots__ = ("type",)
+
     type: Annotated[Literal["default"], "type"]
 
     def __init__(
@@ -1313,6 +1530,8 @@ class BotCommandScopeDefault(_Type):
 
 
 class BotCommandScopeAllPrivateChats(_Type):
+    __slots__ = ("type",)
+
     type: Annotated[Literal["allPrivateChats"], "type"]
 
     def __init__(
@@ -1325,6 +1544,8 @@ class BotCommandScopeAllPrivateChats(_Type):
 
 
 class BotCommandScopeAllGroupChats(_Type):
+    __slots__ = ("type",)
+
     type: Annotated[Literal["allGroupChats"], "type"]
 
     def __init__(
@@ -1337,6 +1558,8 @@ class BotCommandScopeAllGroupChats(_Type):
 
 
 class BotCommandScopeAllChatAdministrators(_Type):
+    __slots__ = ("type",)
+
     type: Annotated[Literal["allChatAdministrators"], "type"]
 
     def __init__(
@@ -1349,6 +1572,8 @@ class BotCommandScopeAllChatAdministrators(_Type):
 
 
 class BotCommandScopeChat(_Type):
+    __slots__ = ("type", "chat_id")
+
     type: Annotated[Literal["chat"], "type"]
     chat_id: Annotated["ID", "chatId"]
 
@@ -1364,6 +1589,8 @@ class BotCommandScopeChat(_Type):
 
 
 class BotCommandScopeChatAdministrators(_Type):
+    __slots__ = ("type", "chat_id")
+
     type: Annotated[Literal["chatAdministrators"], "type"]
     chat_id: Annotated["ID", "chatId"]
 
@@ -1379,6 +1606,8 @@ class BotCommandScopeChatAdministrators(_Type):
 
 
 class BotCommandScopeChatMember(_Type):
+    __slots__ = ("type", "chat_id", "user_id")
+
     type: Annotated[Literal["chatMember"], "type"]
     chat_id: Annotated["ID", "chatId"]
     user_id: Annotated[int, "userId"]
@@ -1412,6 +1641,8 @@ ChatType = Union[
 
 
 class _ChatPBase(_Type):
+    __slots__ = ("id", "type", "color")
+
     id: Annotated[int, "id"]
     type: Annotated["ChatType", "type"]
     color: Annotated[int, "color"]
@@ -1552,6 +1783,20 @@ class _ChatPBase(_Type):
 
 
 class ChatPPrivate(_ChatPBase):
+    __slots__ = (
+        "is_bot",
+        "first_name",
+        "last_name",
+        "username",
+        "also",
+        "is_scam",
+        "is_fake",
+        "is_support",
+        "is_verified",
+        "is_restricted",
+        "restriction_reason",
+    )
+
     type: Annotated[Literal["private"], "type"]
     is_bot: Annotated[Optional[bool], "isBot"]
     first_name: Annotated[str, "firstName"]
@@ -1606,6 +1851,8 @@ class ChatPPrivate(_ChatPBase):
 
 
 class ChatPGroup(_ChatPBase):
+    __slots__ = ("title", "is_creator")
+
     type: Annotated[Literal["group"], "type"]
     title: Annotated[str, "title"]
     is_creator: Annotated[bool, "isCreator"]
@@ -1628,6 +1875,17 @@ class ChatPGroup(_ChatPBase):
 
 
 class ChatPChannelBase(_ChatPBase):
+    __slots__ = (
+        "title",
+        "username",
+        "also",
+        "is_scam",
+        "is_fake",
+        "is_verified",
+        "is_restricted",
+        "restriction_reason",
+    )
+
     title: Annotated[str, "title"]
     username: Annotated[Optional[str], "username"]
     also: Annotated[Optional[list[str]], "also"]
@@ -1670,6 +1928,8 @@ class ChatPChannelBase(_ChatPBase):
 
 
 class ChatPChannel(ChatPChannelBase):
+    __slots__ = ()
+
     type: Annotated[Literal["channel"], "type"]
 
     def __init__(
@@ -1705,6 +1965,8 @@ class ChatPChannel(ChatPChannelBase):
 
 
 class ChatPSupergroup(ChatPChannelBase):
+    __slots__ = ("is_forum",)
+
     type: Annotated[Literal["supergroup"], "type"]
     is_forum: Annotated[bool, "isForum"]
 
@@ -1746,6 +2008,15 @@ ChatP = Union[ChatPPrivate, ChatPGroup, ChatPSupergroup, ChatPChannel]
 
 
 class Document(_Type):
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "thumbnails",
+        "file_name",
+        "mime_type",
+        "file_size",
+    )
+
     file_id: Annotated[str, "fileId"]
     file_unique_id: Annotated[str, "fileUniqueId"]
     thumbnails: Annotated[list["Thumbnail"], "thumbnails"]
@@ -1771,6 +2042,8 @@ class Document(_Type):
 
 
 class Giveaway(_Type):
+    __slots__ = ("parameters", "winner_count", "premium_month_count", "star_count")
+
     parameters: Annotated["GiveawayParameters", "parameters"]
     winner_count: Annotated[int, "winnerCount"]
     premium_month_count: Annotated[Optional[int], "premiumMonthCount"]
@@ -1791,6 +2064,8 @@ class Giveaway(_Type):
 
 
 class InlineQueryResultButton(_Type):
+    __slots__ = ("text", "mini_app", "start_parameter")
+
     text: Annotated[str, "text"]
     mini_app: Annotated[Optional["MiniAppInfo"], "miniApp"]
     start_parameter: Annotated[Optional[str], "startParameter"]
@@ -1808,6 +2083,15 @@ class InlineQueryResultButton(_Type):
 
 
 class _InputMediaCommon(_Type):
+    __slots__ = (
+        "file_name",
+        "mime_type",
+        "chunk_size",
+        "caption",
+        "caption_entities",
+        "parse_mode",
+    )
+
     file_name: Annotated[Optional[str], "fileName"]
     mime_type: Annotated[Optional[str], "mimeType"]
     chunk_size: Annotated[Optional[int], "chunkSize"]
@@ -1836,6 +2120,8 @@ class _InputMediaCommon(_Type):
 
 
 class InputMediaAnimation(_InputMediaCommon):
+    __slots__ = ("animation", "thumbnail", "duration", "width", "height", "has_spoiler")
+
     animation: Annotated["FileSource", "animation"]
     thumbnail: Annotated[Optional["FileSource"], "thumbnail"]
     duration: Annotated[Optional[int], "duration"]
@@ -1878,6 +2164,8 @@ class InputMediaAnimation(_InputMediaCommon):
 
 
 class InputMediaAudio(_InputMediaCommon):
+    __slots__ = ("audio", "thumbnail", "duration", "performer", "title")
+
     audio: Annotated["FileSource", "audio"]
     thumbnail: Annotated[Optional["FileSource"], "thumbnail"]
     duration: Annotated[Optional[int], "duration"]
@@ -1917,6 +2205,8 @@ class InputMediaAudio(_InputMediaCommon):
 
 
 class InputMediaDocument(_InputMediaCommon):
+    __slots__ = ("document", "thumbnail")
+
     document: Annotated["FileSource", "document"]
     thumbnail: Annotated[Optional["FileSource"], "thumbnail"]
 
@@ -1947,6 +2237,8 @@ class InputMediaDocument(_InputMediaCommon):
 
 
 class InputMediaPhoto(_InputMediaCommon):
+    __slots__ = ("photo", "width", "height", "has_spoiler", "self_destruct")
+
     photo: Annotated["FileSource", "photo"]
     width: Annotated[Optional[int], "width"]
     height: Annotated[Optional[int], "height"]
@@ -1986,6 +2278,17 @@ class InputMediaPhoto(_InputMediaCommon):
 
 
 class InputMediaVideo(_InputMediaCommon):
+    __slots__ = (
+        "video",
+        "thumbnail",
+        "duration",
+        "width",
+        "height",
+        "supports_streaming",
+        "has_spoiler",
+        "self_destruct",
+    )
+
     video: Annotated["FileSource", "video"]
     thumbnail: Annotated[Optional["FileSource"], "thumbnail"]
     duration: Annotated[Optional[int], "duration"]
@@ -2043,6 +2346,8 @@ InputMedia = Union[
 
 
 class InputStoryContentPhoto(_Type):
+    __slots__ = ("photo", "attached_sticker_file_ids")
+
     photo: Annotated["FileSource", "photo"]
     attached_sticker_file_ids: Annotated[Optional[list[str]], "attachedStickerFileIds"]
 
@@ -2061,6 +2366,8 @@ class InputStoryContentPhoto(_Type):
 
 
 class InputStoryContentVideo(_Type):
+    __slots__ = ("video", "attached_sticker_file_ids", "duration", "animation")
+
     video: Annotated["FileSource", "video"]
     attached_sticker_file_ids: Annotated[Optional[list[str]], "attachedStickerFileIds"]
     duration: Annotated[int, "duration"]
@@ -2088,6 +2395,8 @@ InputStoryContent = Union[InputStoryContentPhoto, InputStoryContentVideo]
 
 
 class KeyboardButtonText(_Type):
+    __slots__ = ("text",)
+
     text: Annotated[str, "text"]
 
     def __init__(
@@ -2100,6 +2409,8 @@ class KeyboardButtonText(_Type):
 
 
 class KeyboardButtonRequestUser(KeyboardButtonText):
+    __slots__ = ("request_user",)
+
     request_user: Annotated[Any, "requestUser"]
 
     def __init__(
@@ -2114,6 +2425,8 @@ class KeyboardButtonRequestUser(KeyboardButtonText):
 
 
 class KeyboardButtonRequestChat(KeyboardButtonText):
+    __slots__ = ("request_chat",)
+
     request_chat: Annotated[Any, "requestChat"]
 
     def __init__(
@@ -2128,6 +2441,8 @@ class KeyboardButtonRequestChat(KeyboardButtonText):
 
 
 class KeyboardButtonRequestContact(KeyboardButtonText):
+    __slots__ = ("request_contact",)
+
     request_contact: Annotated[Literal[True], "requestContact"]
 
     def __init__(
@@ -2142,6 +2457,8 @@ class KeyboardButtonRequestContact(KeyboardButtonText):
 
 
 class KeyboardButtonRequestLocation(KeyboardButtonText):
+    __slots__ = ("request_location",)
+
     request_location: Annotated[Literal[True], "requestLocation"]
 
     def __init__(
@@ -2156,6 +2473,8 @@ class KeyboardButtonRequestLocation(KeyboardButtonText):
 
 
 class KeyboardButtonRequestPoll(KeyboardButtonText):
+    __slots__ = ("request_poll",)
+
     request_poll: Annotated["KeyboardButtonPollType", "requestPoll"]
 
     def __init__(
@@ -2170,6 +2489,8 @@ class KeyboardButtonRequestPoll(KeyboardButtonText):
 
 
 class KeyboardButtonMiniApp(KeyboardButtonText):
+    __slots__ = ("mini_app",)
+
     mini_app: Annotated["MiniAppInfo", "miniApp"]
 
     def __init__(
@@ -2195,6 +2516,8 @@ KeyboardButton = Union[
 
 
 class MessageContentContact(_Type):
+    __slots__ = ("type", "phone_number", "first_name", "last_name", "vcard")
+
     type: Annotated[Literal["contact"], "type"]
     phone_number: Annotated[str, "phoneNumber"]
     first_name: Annotated[str, "firstName"]
@@ -2218,6 +2541,16 @@ class MessageContentContact(_Type):
 
 
 class MessageContentLocation(_Type):
+    __slots__ = (
+        "type",
+        "latitude",
+        "longitude",
+        "horizontal_accuracy",
+        "live_period",
+        "heading",
+        "proximity_alert_radius",
+    )
+
     type: Annotated[Literal["text"], "type"]
     latitude: Annotated[int, "latitude"]
     longitude: Annotated[int, "longitude"]
@@ -2247,6 +2580,18 @@ class MessageContentLocation(_Type):
 
 
 class MessageContentVenue(_Type):
+    __slots__ = (
+        "type",
+        "latitude",
+        "longitude",
+        "title",
+        "address",
+        "foursquare_id",
+        "foursquare_type",
+        "google_place_id",
+        "google_place_type",
+    )
+
     type: Annotated[Literal["venue"], "type"]
     latitude: Annotated[int, "latitude"]
     longitude: Annotated[int, "longitude"]
@@ -2282,6 +2627,8 @@ class MessageContentVenue(_Type):
 
 
 class MessageContentText(_Type):
+    __slots__ = ("type", "text", "parse_mode", "entities", "link_preview")
+
     type: Annotated[Literal["text"], "type"]
     text: Annotated[str, "text"]
     parse_mode: Annotated[Optional["ParseMode"], "parseMode"]
@@ -2305,6 +2652,30 @@ class MessageContentText(_Type):
 
 
 class MessageContentInvoice(_Type):
+    __slots__ = (
+        "type",
+        "title",
+        "description",
+        "payload",
+        "provider_token",
+        "currency",
+        "prices",
+        "max_tip_amount",
+        "suggested_tip_amounts",
+        "provider_data",
+        "photo_url",
+        "photo_size",
+        "photo_width",
+        "photo_height",
+        "need_name",
+        "need_phone_number",
+        "need_email",
+        "need_shipping_a_address",
+        "send_phone_number_to_porvider",
+        "send_email_to_provider",
+        "is_flexible",
+    )
+
     type: Annotated[Literal["invoice"], "type"]
     title: Annotated[str, "title"]
     description: Annotated[str, "description"]
@@ -2393,6 +2764,8 @@ MessageContent = Union[
 
 
 class MessageReaction(_Type):
+    __slots__ = ("reaction", "count", "choosers", "chosen")
+
     reaction: Annotated["Reaction", "reaction"]
     count: Annotated[int, "count"]
     choosers: Annotated[list[int], "choosers"]
@@ -2412,6 +2785,8 @@ class MessageReaction(_Type):
 
 
 class NetworkStatistics(_Type):
+    __slots__ = ("messages", "cdn")
+
     messages: Annotated["NetworkStatisticsEntry", "messages"]
     cdn: Annotated["NetworkStatisticsEntry", "cdn"]
 
@@ -2425,6 +2800,8 @@ class NetworkStatistics(_Type):
 
 
 class OrderInfo(_Type):
+    __slots__ = ("name", "phone_number", "email", "shipping_address")
+
     name: Annotated[Optional[str], "name"]
     phone_number: Annotated[Optional[str], "phoneNumber"]
     email: Annotated[Optional[str], "email"]
@@ -2447,6 +2824,15 @@ class OrderInfo(_Type):
 
 
 class Photo(_Type):
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "width",
+        "height",
+        "file_size",
+        "thumbnails",
+    )
+
     file_id: Annotated[str, "fileId"]
     file_unique_id: Annotated[str, "fileUniqueId"]
     width: Annotated[int, "width"]
@@ -2472,6 +2858,8 @@ class Photo(_Type):
 
 
 class PollOption(_Type):
+    __slots__ = ("text", "entities", "voter_count")
+
     text: Annotated[str, "text"]
     entities: Annotated[list["MessageEntity"], "entities"]
     voter_count: Annotated[int, "voterCount"]
@@ -2488,6 +2876,8 @@ class PollOption(_Type):
 
 
 class ReactionCount(_Type):
+    __slots__ = ("reaction", "count")
+
     reaction: Annotated["Reaction", "reaction"]
     count: Annotated[int, "count"]
 
@@ -2501,6 +2891,8 @@ class ReactionCount(_Type):
 
 
 class ReplyQuote(_Type):
+    __slots__ = ("offset", "text", "entities")
+
     offset: Annotated[int, "offset"]
     text: Annotated[str, "text"]
     entities: Annotated[list["MessageEntity"], "entities"]
@@ -2517,6 +2909,24 @@ class ReplyQuote(_Type):
 
 
 class Sticker(_Type):
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "type",
+        "width",
+        "height",
+        "is_animated",
+        "is_video",
+        "thumbnails",
+        "emoji",
+        "set_name",
+        "premium_animation",
+        "mask_position",
+        "custom_emoji_id",
+        "needs_repainting",
+        "file_size",
+    )
+
     file_id: Annotated[str, "fileId"]
     file_unique_id: Annotated[str, "fileUniqueId"]
     type: Annotated[Any, "type"]
@@ -2570,6 +2980,8 @@ class Sticker(_Type):
 
 
 class StoryPrivacyEveryone(_Type):
+    __slots__ = ("everyone_except",)
+
     everyone_except: Annotated[list[int], "everyoneExcept"]
 
     def __init__(
@@ -2582,6 +2994,8 @@ class StoryPrivacyEveryone(_Type):
 
 
 class StoryPrivacyConctacts(_Type):
+    __slots__ = ("contacts_except",)
+
     contacts_except: Annotated[list[int], "contactsExcept"]
 
     def __init__(
@@ -2594,6 +3008,8 @@ class StoryPrivacyConctacts(_Type):
 
 
 class StoryPrivacyCloseFriends(_Type):
+    __slots__ = ("close_friends",)
+
     close_friends: Annotated[Literal[True], "closeFriends"]
 
     def __init__(
@@ -2606,6 +3022,8 @@ class StoryPrivacyCloseFriends(_Type):
 
 
 class StoryPrivacyOnly(_Type):
+    __slots__ = ("only",)
+
     only: Annotated[list[int], "only"]
 
     def __init__(
@@ -2626,6 +3044,8 @@ StoryPrivacy = Union[
 
 
 class StoryReaction(_Type):
+    __slots__ = ("reaction", "count", "chosen")
+
     reaction: Annotated["Reaction", "reaction"]
     count: Annotated[int, "count"]
     chosen: Annotated[bool, "chosen"]
@@ -2642,6 +3062,24 @@ class StoryReaction(_Type):
 
 
 class User(_Type):
+    __slots__ = (
+        "id",
+        "color",
+        "is_bot",
+        "first_name",
+        "last_name",
+        "username",
+        "also",
+        "photo",
+        "language_code",
+        "is_scam",
+        "is_fake",
+        "is_premium",
+        "is_verified",
+        "is_support",
+        "added_to_attachment_menu",
+    )
+
     id: Annotated[int, "id"]
     color: Annotated[int, "color"]
     is_bot: Annotated[bool, "isBot"]
@@ -2721,6 +3159,8 @@ class User(_Type):
 
 
 class Venue(_Type):
+    __slots__ = ("location", "title", "address", "foursquare_id", "foursquare_type")
+
     location: Annotated["Location", "location"]
     title: Annotated[str, "title"]
     address: Annotated[str, "address"]
@@ -2744,6 +3184,18 @@ class Venue(_Type):
 
 
 class Video(_Type):
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "width",
+        "height",
+        "duration",
+        "thumbnails",
+        "file_name",
+        "mime_type",
+        "file_size",
+    )
+
     file_id: Annotated[str, "fileId"]
     file_unique_id: Annotated[str, "fileUniqueId"]
     width: Annotated[int, "width"]
@@ -2779,6 +3231,16 @@ class Video(_Type):
 
 
 class VideoNote(_Type):
+    __slots__ = (
+        "file_id",
+        "file_unique_id",
+        "length",
+        "duration",
+        "thumbnails",
+        "file_name",
+        "file_size",
+    )
+
     file_id: Annotated[str, "fileId"]
     file_unique_id: Annotated[str, "fileUniqueId"]
     length: Annotated[int, "length"]
@@ -2808,6 +3270,8 @@ class VideoNote(_Type):
 
 
 class BusinessConnection(_Type):
+    __slots__ = ("id", "user", "date", "can_reply", "is_enabled")
+
     id: Annotated[str, "id"]
     user: Annotated["User", "user"]
     date: Annotated[datetime.datetime, "date"]
@@ -2830,17 +3294,14 @@ class BusinessConnection(_Type):
 
 
 class ChatBase(_Type):
-    photo: Annotated[Optional["Photo"], "photo"]
+    __slots__ = ()
 
-    def __init__(
-        self,
-        *,
-        photo: Annotated[Optional["Photo"], "photo"] = None,
-    ):
-        self.photo = photo
+    photo: Annotated[Optional["Photo"], "photo"]
 
 
 class ChatChannel(ChatBase, ChatPChannel):
+    __slots__ = ("video_chat_id", "photo")
+
     video_chat_id: Annotated[Optional[str], "videoChatId"]
 
     def __init__(
@@ -2878,6 +3339,8 @@ class ChatChannel(ChatBase, ChatPChannel):
 
 
 class ChatSupergroup(ChatBase, ChatPSupergroup):
+    __slots__ = ("video_chat_id", "photo")
+
     video_chat_id: Annotated[Optional[str], "videoChatId"]
 
     def __init__(
@@ -2917,6 +3380,8 @@ class ChatSupergroup(ChatBase, ChatPSupergroup):
 
 
 class ChatGroup(ChatBase, ChatPGroup):
+    __slots__ = ("video_chat_id", "photo")
+
     video_chat_id: Annotated[Optional[str], "videoChatId"]
 
     def __init__(
@@ -2940,6 +3405,15 @@ class ChatGroup(ChatBase, ChatPGroup):
 
 
 class ChatPrivate(ChatBase, ChatPPrivate):
+    __slots__ = (
+        "birthday",
+        "address",
+        "location",
+        "opening_hours",
+        "has_main_mini_app",
+        "photo",
+    )
+
     birthday: Annotated[Optional["Birthday"], "birthday"]
     address: Annotated[Optional[str], "address"]
     location: Annotated[Optional["Location"], "location"]
@@ -3007,6 +3481,8 @@ ChatMemberStatus = Union[
 
 
 class _ChatMemberBase(_Type):
+    __slots__ = ("status", "user")
+
     status: Annotated["ChatMemberStatus", "status"]
     user: Annotated["User", "user"]
 
@@ -3020,6 +3496,8 @@ class _ChatMemberBase(_Type):
 
 
 class ChatMemberCreator(_ChatMemberBase):
+    __slots__ = ("is_anonymous", "title")
+
     status: Annotated[Literal["creator"], "status"]
     is_anonymous: Annotated[bool, "isAnonymous"]
     title: Annotated[Optional[str], "title"]
@@ -3039,6 +3517,8 @@ class ChatMemberCreator(_ChatMemberBase):
 
 
 class ChatMemberAdministrator(_ChatMemberBase):
+    __slots__ = ("rights", "title")
+
     status: Annotated[Literal["administrator"], "status"]
     rights: Annotated["ChatAdministratorRights", "rights"]
     title: Annotated[Optional[str], "title"]
@@ -3058,6 +3538,8 @@ class ChatMemberAdministrator(_ChatMemberBase):
 
 
 class ChatMemberMember(_ChatMemberBase):
+    __slots__ = ()
+
     status: Annotated[Literal["member"], "status"]
 
     def __init__(
@@ -3070,6 +3552,8 @@ class ChatMemberMember(_ChatMemberBase):
 
 
 class ChatMemberRestricted(_ChatMemberBase):
+    __slots__ = ("is_member", "rights", "until_date")
+
     status: Annotated[Literal["restricted"], "status"]
     is_member: Annotated[bool, "isMember"]
     rights: Annotated["ChatMemberRights", "rights"]
@@ -3092,6 +3576,8 @@ class ChatMemberRestricted(_ChatMemberBase):
 
 
 class ChatMemberLeft(_ChatMemberBase):
+    __slots__ = ()
+
     status: Annotated[Literal["left"], "status"]
 
     def __init__(
@@ -3104,6 +3590,8 @@ class ChatMemberLeft(_ChatMemberBase):
 
 
 class ChatMemberBanned(_ChatMemberBase):
+    __slots__ = ("until_date",)
+
     status: Annotated[Literal["banned"], "status"]
     until_date: Annotated[Optional[datetime.datetime], "untilDate"]
 
@@ -3130,6 +3618,8 @@ ChatMember = Union[
 
 
 class ChosenInlineResult(_Type):
+    __slots__ = ("result_id", "from_", "location", "inline_message_id", "query")
+
     result_id: Annotated[str, "resultId"]
     from_: Annotated["User", "from"]
     location: Annotated[Optional["Location"], "location"]
@@ -3153,6 +3643,8 @@ class ChosenInlineResult(_Type):
 
 
 class _ForwardHeaderCommon(_Type):
+    __slots__ = ("date",)
+
     date: Annotated[datetime.datetime, "date"]
 
     def __init__(
@@ -3163,6 +3655,8 @@ class _ForwardHeaderCommon(_Type):
 
 
 class ForwardHeaderUser(_ForwardHeaderCommon):
+    __slots__ = ("type", "user")
+
     type: Annotated[Literal["user"], "type"]
     user: Annotated["User", "user"]
 
@@ -3180,6 +3674,8 @@ class ForwardHeaderUser(_ForwardHeaderCommon):
 
 
 class ForwardHeaderChannel(_ForwardHeaderCommon):
+    __slots__ = ("type", "chat", "message_id", "author_signature")
+
     type: Annotated[Literal["channel"], "type"]
     chat: Annotated["ChatPChannel", "chat"]
     message_id: Annotated[int, "messageId"]
@@ -3204,6 +3700,8 @@ class ForwardHeaderChannel(_ForwardHeaderCommon):
 
 
 class ForwardHeaderSupergroup(_ForwardHeaderCommon):
+    __slots__ = ("type", "chat", "title")
+
     type: Annotated[Literal["supergroup"], "type"]
     chat: Annotated["ChatPSupergroup", "chat"]
     title: Annotated[Optional[str], "title"]
@@ -3223,6 +3721,8 @@ class ForwardHeaderSupergroup(_ForwardHeaderCommon):
 
 
 class ForwardHeaderHidden(_ForwardHeaderCommon):
+    __slots__ = ("type", "name")
+
     type: Annotated[Literal["hidden"], "type"]
     name: Annotated[str, "name"]
 
@@ -3238,6 +3738,8 @@ class ForwardHeaderHidden(_ForwardHeaderCommon):
 
 
 class ForwardHeaderUnsupported(_ForwardHeaderCommon):
+    __slots__ = ("type",)
+
     type: Annotated[Literal["unsupported"], "type"]
 
     def __init__(
@@ -3259,6 +3761,8 @@ ForwardHeader = Union[
 
 
 class Game(_Type):
+    __slots__ = ("title", "description", "photo", "text", "text_entities", "animation")
+
     title: Annotated[str, "title"]
     description: Annotated[str, "description"]
     photo: Annotated["Photo", "photo"]
@@ -3287,6 +3791,8 @@ class Game(_Type):
 
 
 class InactiveChat(_Type):
+    __slots__ = ("last_activity", "chat")
+
     last_activity: Annotated[datetime.datetime, "lastActivity"]
     chat: Annotated["ChatP", "chat"]
 
@@ -3300,6 +3806,8 @@ class InactiveChat(_Type):
 
 
 class _InlineKeyboardButtonBase(_Type):
+    __slots__ = ("text",)
+
     text: Annotated[str, "text"]
 
     def __init__(
@@ -3310,6 +3818,8 @@ class _InlineKeyboardButtonBase(_Type):
 
 
 class InlineKeyboardButtonURL(_InlineKeyboardButtonBase):
+    __slots__ = ("url",)
+
     url: Annotated[str, "url"]
 
     def __init__(
@@ -3324,6 +3834,8 @@ class InlineKeyboardButtonURL(_InlineKeyboardButtonBase):
 
 
 class InlineKeyboardButtonCallback(_InlineKeyboardButtonBase):
+    __slots__ = ("callback_data",)
+
     callback_data: Annotated[str, "callbackData"]
 
     def __init__(
@@ -3338,6 +3850,8 @@ class InlineKeyboardButtonCallback(_InlineKeyboardButtonBase):
 
 
 class InlineKeyboardButtonMiniApp(_InlineKeyboardButtonBase):
+    __slots__ = ("mini_app",)
+
     mini_app: Annotated["MiniAppInfo", "miniApp"]
 
     def __init__(
@@ -3352,6 +3866,8 @@ class InlineKeyboardButtonMiniApp(_InlineKeyboardButtonBase):
 
 
 class InlineKeyboardButtonLogin(_InlineKeyboardButtonBase):
+    __slots__ = ("login_url",)
+
     login_url: Annotated["LoginUrl", "loginUrl"]
 
     def __init__(
@@ -3366,6 +3882,8 @@ class InlineKeyboardButtonLogin(_InlineKeyboardButtonBase):
 
 
 class InlineKeyboardButtonSwitchInline(_InlineKeyboardButtonBase):
+    __slots__ = ("switch_inline_query",)
+
     switch_inline_query: Annotated[str, "switchInlineQuery"]
 
     def __init__(
@@ -3380,6 +3898,8 @@ class InlineKeyboardButtonSwitchInline(_InlineKeyboardButtonBase):
 
 
 class InlineKeyboardButtonSwitchInlineCurrent(_InlineKeyboardButtonBase):
+    __slots__ = ("switch_inline_query_current_chat",)
+
     switch_inline_query_current_chat: Annotated[str, "switchInlineQueryCurrentChat"]
 
     def __init__(
@@ -3396,6 +3916,8 @@ class InlineKeyboardButtonSwitchInlineCurrent(_InlineKeyboardButtonBase):
 
 
 class InlineKeyboardButtonSwitchInlineChosen(_InlineKeyboardButtonBase):
+    __slots__ = ("switch_inline_query_chosen_chats",)
+
     switch_inline_query_chosen_chats: Annotated[Any, "switchInlineQueryChosenChats"]
 
     def __init__(
@@ -3412,6 +3934,8 @@ class InlineKeyboardButtonSwitchInlineChosen(_InlineKeyboardButtonBase):
 
 
 class InlineKeyboardButtonGame(_InlineKeyboardButtonBase):
+    __slots__ = ("callback_game",)
+
     callback_game: Annotated[dict[str, Any], "callbackGame"]
 
     def __init__(
@@ -3426,6 +3950,8 @@ class InlineKeyboardButtonGame(_InlineKeyboardButtonBase):
 
 
 class InlineKeyboardButtonPay(_InlineKeyboardButtonBase):
+    __slots__ = ("pay",)
+
     pay: Annotated[bool, "pay"]
 
     def __init__(
@@ -3440,6 +3966,8 @@ class InlineKeyboardButtonPay(_InlineKeyboardButtonBase):
 
 
 class InlineKeyboardButtonCopy(_InlineKeyboardButtonBase):
+    __slots__ = ("copy",)
+
     copy: Annotated[str, "copy"]
 
     def __init__(
@@ -3468,6 +3996,8 @@ InlineKeyboardButton = Union[
 
 
 class InlineQuery(_Type):
+    __slots__ = ("id", "from_", "query", "offset", "chat_type", "location")
+
     id: Annotated[str, "id"]
     from_: Annotated["User", "from"]
     query: Annotated[str, "query"]
@@ -3514,6 +4044,19 @@ class InlineQuery(_Type):
 
 
 class InviteLink(_Type):
+    __slots__ = (
+        "invite_link",
+        "creator",
+        "requires_approval",
+        "revoked",
+        "title",
+        "expires_at",
+        "limit",
+        "pending_join_request_count",
+        "subscription_price",
+        "subscription_expires_in",
+    )
+
     invite_link: Annotated[str, "inviteLink"]
     creator: Annotated["User", "creator"]
     requires_approval: Annotated[bool, "requiresApproval"]
@@ -3556,6 +4099,8 @@ class InviteLink(_Type):
 
 
 class MessageInteractions(_Type):
+    __slots__ = ("chat_id", "message_id", "reactions", "views", "forwards")
+
     chat_id: Annotated[int, "chatId"]
     message_id: Annotated[int, "messageId"]
     reactions: Annotated[list["MessageReaction"], "reactions"]
@@ -3578,6 +4123,8 @@ class MessageInteractions(_Type):
 
 
 class MessageReactionCount(_Type):
+    __slots__ = ("chat", "message_id", "date", "reactions")
+
     chat: Annotated["ChatP", "chat"]
     message_id: Annotated[int, "messageId"]
     date: Annotated[datetime.datetime, "date"]
@@ -3597,6 +4144,16 @@ class MessageReactionCount(_Type):
 
 
 class MessageReactions(_Type):
+    __slots__ = (
+        "chat",
+        "message_id",
+        "user",
+        "actor_chat",
+        "date",
+        "old_reactions",
+        "new_reactions",
+    )
+
     chat: Annotated["ChatP", "chat"]
     message_id: Annotated[int, "messageId"]
     user: Annotated[Optional["User"], "user"]
@@ -3626,6 +4183,23 @@ class MessageReactions(_Type):
 
 
 class Poll(_Type):
+    __slots__ = (
+        "id",
+        "question",
+        "question_entities",
+        "options",
+        "total_voter_count",
+        "is_closed",
+        "is_anonymous",
+        "type",
+        "allow_multiple_answers",
+        "correct_option_index",
+        "explanation",
+        "explanation_entities",
+        "open_period",
+        "close_date",
+    )
+
     id: Annotated[str, "id"]
     question: Annotated[str, "question"]
     question_entities: Annotated[list["MessageEntity"], "questionEntities"]
@@ -3682,6 +4256,16 @@ class Poll(_Type):
 
 
 class PreCheckoutQuery(_Type):
+    __slots__ = (
+        "id",
+        "from_",
+        "currency",
+        "total_amount",
+        "invoice_payload",
+        "shipping_option_id",
+        "order_info",
+    )
+
     id: Annotated[str, "id"]
     from_: Annotated["User", "from"]
     currency: Annotated[str, "currency"]
@@ -3711,6 +4295,8 @@ class PreCheckoutQuery(_Type):
 
 
 class ReplyToMessage(_Type):
+    __slots__ = ("message_id", "quote")
+
     message_id: Annotated[int, "messageId"]
     quote: Annotated[Optional["ReplyQuote"], "quote"]
 
@@ -3727,6 +4313,8 @@ class ReplyToMessage(_Type):
 
 
 class ReplyToStory(_Type):
+    __slots__ = ("chat_id", "story_id")
+
     chat_id: Annotated["ID", "chatId"]
     story_id: Annotated[int, "storyId"]
 
@@ -3745,6 +4333,8 @@ ReplyTo = Union[ReplyToMessage, ReplyToStory]
 
 
 class StoryContentPhoto(_Type):
+    __slots__ = ("photo",)
+
     photo: Annotated["Photo", "photo"]
 
     def __init__(
@@ -3757,6 +4347,8 @@ class StoryContentPhoto(_Type):
 
 
 class StoryContentVideo(_Type):
+    __slots__ = ("video",)
+
     video: Annotated["Video", "video"]
 
     def __init__(
@@ -3769,6 +4361,8 @@ class StoryContentVideo(_Type):
 
 
 class StoryContentUnsupported(_Type):
+    __slots__ = ("unsupported",)
+
     unsupported: Annotated[Literal[True], "unsupported"]
 
     def __init__(
@@ -3784,6 +4378,8 @@ StoryContent = Union[StoryContentPhoto, StoryContentVideo, StoryContentUnsupport
 
 
 class StoryInteractions(_Type):
+    __slots__ = ("reactions", "reaction_count", "views", "forwards")
+
     reactions: Annotated[Optional[list["StoryReaction"]], "reactions"]
     reaction_count: Annotated[Optional[int], "reactionCount"]
     views: Annotated[int, "views"]
@@ -3804,6 +4400,14 @@ class StoryInteractions(_Type):
 
 
 class StoryInteractiveAreaPosition(_Type):
+    __slots__ = (
+        "x_percentage",
+        "y_percentage",
+        "width_percentage",
+        "height_percentage",
+        "rotation_angle",
+    )
+
     x_percentage: Annotated[int, "xPercentage"]
     y_percentage: Annotated[int, "yPercentage"]
     width_percentage: Annotated[int, "widthPercentage"]
@@ -3826,6 +4430,8 @@ class StoryInteractiveAreaPosition(_Type):
 
 
 class _StoryInteractiveAreaPositionCommon(_Type):
+    __slots__ = ("position",)
+
     position: Annotated["StoryInteractiveAreaPosition", "position"]
 
     def __init__(
@@ -3836,6 +4442,8 @@ class _StoryInteractiveAreaPositionCommon(_Type):
 
 
 class StoryInteractiveAreaLocation(_StoryInteractiveAreaPositionCommon):
+    __slots__ = ("location",)
+
     location: Annotated["Location", "location"]
 
     def __init__(
@@ -3848,6 +4456,8 @@ class StoryInteractiveAreaLocation(_StoryInteractiveAreaPositionCommon):
 
 
 class StoryInteractiveAreaVenue(_StoryInteractiveAreaPositionCommon):
+    __slots__ = ("venue",)
+
     venue: Annotated["Venue", "venue"]
 
     def __init__(
@@ -3860,6 +4470,8 @@ class StoryInteractiveAreaVenue(_StoryInteractiveAreaPositionCommon):
 
 
 class StoryInteractiveAreaReaction(_StoryInteractiveAreaPositionCommon):
+    __slots__ = ("reaction", "count", "dark", "flipped")
+
     reaction: Annotated["Reaction", "reaction"]
     count: Annotated[Optional[int], "count"]
     dark: Annotated[Optional[bool], "dark"]
@@ -3882,6 +4494,8 @@ class StoryInteractiveAreaReaction(_StoryInteractiveAreaPositionCommon):
 
 
 class StoryInteractiveAreaMessage(_StoryInteractiveAreaPositionCommon):
+    __slots__ = ("message_reference",)
+
     message_reference: Annotated["MessageReference", "messageReference"]
 
     def __init__(
@@ -3902,6 +4516,16 @@ StoryInteractiveArea = Union[
 
 
 class SuccessfulPayment(_Type):
+    __slots__ = (
+        "currency",
+        "total_amount",
+        "invoice_payload",
+        "telegram_payment_charge_id",
+        "provider_payment_charge_id",
+        "shipping_option_id",
+        "order_info",
+    )
+
     currency: Annotated[str, "currency"]
     total_amount: Annotated[int, "totalAmount"]
     invoice_payload: Annotated[str, "invoicePayload"]
@@ -3931,6 +4555,16 @@ class SuccessfulPayment(_Type):
 
 
 class ChatMemberUpdated(_Type):
+    __slots__ = (
+        "chat",
+        "from_",
+        "date",
+        "old_chat_member",
+        "new_chat_member",
+        "invite_link",
+        "via_shared_folder",
+    )
+
     chat: Annotated["ChatP", "chat"]
     from_: Annotated["User", "from"]
     date: Annotated[datetime.datetime, "date"]
@@ -3960,6 +4594,8 @@ class ChatMemberUpdated(_Type):
 
 
 class JoinRequest(_Type):
+    __slots__ = ("chat", "user", "date", "bio", "invite_link")
+
     chat: Annotated["ChatP", "chat"]
     user: Annotated["User", "user"]
     date: Annotated[datetime.datetime, "date"]
@@ -3983,6 +4619,8 @@ class JoinRequest(_Type):
 
 
 class ReplyMarkupInlineKeyboard(_Type):
+    __slots__ = ("inline_keyboard",)
+
     inline_keyboard: Annotated[list[list["InlineKeyboardButton"]], "inlineKeyboard"]
 
     def __init__(
@@ -3997,6 +4635,15 @@ class ReplyMarkupInlineKeyboard(_Type):
 
 
 class ReplyMarkupKeyboard(_Type):
+    __slots__ = (
+        "keyboard",
+        "is_persistent",
+        "resize_keyboard",
+        "one_time_keyboard",
+        "input_field_placeholder",
+        "selective",
+    )
+
     keyboard: Annotated[list[list["KeyboardButton"]], "keyboard"]
     is_persistent: Annotated[Optional[bool], "isPersistent"]
     resize_keyboard: Annotated[Optional[bool], "resizeKeyboard"]
@@ -4027,6 +4674,8 @@ class ReplyMarkupKeyboard(_Type):
 
 
 class ReplyMarkupRemoveKeyboard(_Type):
+    __slots__ = ("remove_keyboard", "selective")
+
     remove_keyboard: Annotated[Literal[True], "removeKeyboard"]
     selective: Annotated[Optional[bool], "selective"]
 
@@ -4043,6 +4692,8 @@ class ReplyMarkupRemoveKeyboard(_Type):
 
 
 class ReplyMarkupForceReply(_Type):
+    __slots__ = ("force_reply", "input_field_placeholder", "selective")
+
     force_reply: Annotated[Literal[True], "forceReply"]
     input_field_placeholder: Annotated[Optional[str], "inputFieldPlaceholder"]
     selective: Annotated[Optional[bool], "selective"]
@@ -4072,6 +4723,21 @@ ReplyMarkup = Union[
 
 
 class Story(_Type):
+    __slots__ = (
+        "out",
+        "id",
+        "chat",
+        "date",
+        "edited",
+        "content",
+        "interactive_areas",
+        "highlighted",
+        "interactions",
+        "privacy",
+        "caption",
+        "caption_entities",
+    )
+
     out: Annotated[bool, "out"]
     id: Annotated[int, "id"]
     chat: Annotated["ChatP", "chat"]
@@ -4134,19 +4800,15 @@ InlineQueryResultType = Union[
 
 
 class _InlineQueryResultBase(_Type):
+    __slots__ = ()
+
     type: Annotated["InlineQueryResultType", "type"]
     id: Annotated[str, "id"]
 
-    def __init__(
-        self,
-        type: Annotated["InlineQueryResultType", "type"],
-        id: Annotated[str, "id"],
-    ):
-        self.type = type
-        self.id = id
-
 
 class _InlineQueryResultCaptionCommon(_Type):
+    __slots__ = ("caption", "parse_mode", "caption_entities")
+
     caption: Annotated[Optional[str], "caption"]
     parse_mode: Annotated[Optional["ParseMode"], "parseMode"]
     caption_entities: Annotated[Optional[list["MessageEntity"]], "captionEntities"]
@@ -4166,41 +4828,37 @@ class _InlineQueryResultCaptionCommon(_Type):
 
 
 class _InlineQueryResultMessageContentReplyMarkupCommon(_Type):
+    __slots__ = ()
+
     message_content: Annotated[Optional["MessageContent"], "messageContent"]
     reply_markup: Annotated[Optional["ReplyMarkupInlineKeyboard"], "replyMarkup"]
 
-    def __init__(
-        self,
-        *,
-        message_content: Annotated[Optional["MessageContent"], "messageContent"] = None,
-        reply_markup: Annotated[
-            Optional["ReplyMarkupInlineKeyboard"], "replyMarkup"
-        ] = None,
-    ):
-        self.message_content = message_content
-        self.reply_markup = reply_markup
-
 
 class _InlineQueryResultThumbnailCommon(_Type):
+    __slots__ = ()
+
     thumbnail_url: Annotated[Optional[str], "thumbnailUrl"]
     thumbnail_width: Annotated[Optional[str], "thumbnailWidth"]
     thumbnail_height: Annotated[Optional[str], "thumbnailHeight"]
 
-    def __init__(
-        self,
-        *,
-        thumbnail_url: Annotated[Optional[str], "thumbnailUrl"] = None,
-        thumbnail_width: Annotated[Optional[str], "thumbnailWidth"] = None,
-        thumbnail_height: Annotated[Optional[str], "thumbnailHeight"] = None,
-    ):
-        self.thumbnail_url = thumbnail_url
-        self.thumbnail_width = thumbnail_width
-        self.thumbnail_height = thumbnail_height
-
 
 class InlineQueryResultArticle(
     _InlineQueryResultBase, _InlineQueryResultThumbnailCommon
 ):
+    __slots__ = (
+        "type",
+        "title",
+        "message_content",
+        "description",
+        "reply_markup",
+        "url",
+        "hide_url",
+        "id",
+        "thumbnail_url",
+        "thumbnail_width",
+        "thumbnail_height",
+    )
+
     type: Annotated[Literal["article"], "type"]
     title: Annotated[str, "title"]
     message_content: Annotated["MessageContent", "messageContent"]
@@ -4246,6 +4904,17 @@ class InlineQueryResultAudio(
     _InlineQueryResultCaptionCommon,
     _InlineQueryResultMessageContentReplyMarkupCommon,
 ):
+    __slots__ = (
+        "type",
+        "title",
+        "url",
+        "performer",
+        "audio_duration",
+        "id",
+        "message_content",
+        "reply_markup",
+    )
+
     type: Annotated[Literal["audio"], "type"]
     title: Annotated[str, "title"]
     url: Annotated[str, "url"]
@@ -4291,6 +4960,8 @@ class InlineQueryResultCachedAudio(
     _InlineQueryResultCaptionCommon,
     _InlineQueryResultMessageContentReplyMarkupCommon,
 ):
+    __slots__ = ("type", "file_id", "id", "message_content", "reply_markup")
+
     type: Annotated[Literal["audio"], "type"]
     file_id: Annotated[str, "fileId"]
 
@@ -4327,6 +4998,15 @@ class InlineQueryResultCachedDocument(
     _InlineQueryResultCaptionCommon,
     _InlineQueryResultMessageContentReplyMarkupCommon,
 ):
+    __slots__ = (
+        "type",
+        "file_id",
+        "description",
+        "id",
+        "message_content",
+        "reply_markup",
+    )
+
     type: Annotated[Literal["document"], "type"]
     file_id: Annotated[str, "fileId"]
     description: Annotated[Optional[str], "description"]
@@ -4366,6 +5046,8 @@ class InlineQueryResultCachedGif(
     _InlineQueryResultCaptionCommon,
     _InlineQueryResultMessageContentReplyMarkupCommon,
 ):
+    __slots__ = ("type", "file_id", "title", "id", "message_content", "reply_markup")
+
     type: Annotated[Literal["gif"], "type"]
     file_id: Annotated[str, "fileId"]
     title: Annotated[Optional[str], "title"]
@@ -4405,6 +5087,8 @@ class InlineQueryResultCachedMpeg4Gif(
     _InlineQueryResultCaptionCommon,
     _InlineQueryResultMessageContentReplyMarkupCommon,
 ):
+    __slots__ = ("type", "file_id", "title", "id", "message_content", "reply_markup")
+
     type: Annotated[Literal["mpeg4Gif"], "type"]
     file_id: Annotated[str, "fileId"]
     title: Annotated[Optional[str], "title"]
@@ -4444,6 +5128,17 @@ class InlineQueryResultCachedPhoto(
     _InlineQueryResultCaptionCommon,
     _InlineQueryResultMessageContentReplyMarkupCommon,
 ):
+    __slots__ = (
+        "type",
+        "file_id",
+        "thumbnails",
+        "title",
+        "description",
+        "id",
+        "message_content",
+        "reply_markup",
+    )
+
     type: Annotated[Literal["photo"], "type"]
     file_id: Annotated[str, "fileId"]
     thumbnails: Annotated[Optional[list["Thumbnail"]], "thumbnails"]
@@ -4487,6 +5182,8 @@ class InlineQueryResultCachedPhoto(
 class InlineQueryResultCachedSticker(
     _InlineQueryResultBase, _InlineQueryResultMessageContentReplyMarkupCommon
 ):
+    __slots__ = ("type", "file_id", "id", "message_content", "reply_markup")
+
     type: Annotated[Literal["sticker"], "type"]
     file_id: Annotated[str, "fileId"]
 
@@ -4515,6 +5212,16 @@ class InlineQueryResultCachedVideo(
     _InlineQueryResultCaptionCommon,
     _InlineQueryResultMessageContentReplyMarkupCommon,
 ):
+    __slots__ = (
+        "type",
+        "title",
+        "file_id",
+        "description",
+        "id",
+        "message_content",
+        "reply_markup",
+    )
+
     type: Annotated[Literal["video"], "type"]
     title: Annotated[str, "title"]
     file_id: Annotated[str, "fileId"]
@@ -4557,6 +5264,8 @@ class InlineQueryResultCachedVoice(
     _InlineQueryResultCaptionCommon,
     _InlineQueryResultMessageContentReplyMarkupCommon,
 ):
+    __slots__ = ("type", "title", "file_id", "id", "message_content", "reply_markup")
+
     type: Annotated[Literal["voice"], "type"]
     title: Annotated[str, "title"]
     file_id: Annotated[str, "fileId"]
@@ -4597,6 +5306,20 @@ class InlineQueryResultContact(
     _InlineQueryResultMessageContentReplyMarkupCommon,
     _InlineQueryResultThumbnailCommon,
 ):
+    __slots__ = (
+        "type",
+        "phone_number",
+        "first_name",
+        "last_name",
+        "vcard",
+        "id",
+        "message_content",
+        "reply_markup",
+        "thumbnail_url",
+        "thumbnail_width",
+        "thumbnail_height",
+    )
+
     type: Annotated[Literal["game"], "type"]
     phone_number: Annotated[str, "phoneNumber"]
     first_name: Annotated[str, "firstName"]
@@ -4649,6 +5372,18 @@ class InlineQueryResultDocument(
     _InlineQueryResultMessageContentReplyMarkupCommon,
     _InlineQueryResultThumbnailCommon,
 ):
+    __slots__ = (
+        "type",
+        "title",
+        "url",
+        "id",
+        "message_content",
+        "reply_markup",
+        "thumbnail_url",
+        "thumbnail_width",
+        "thumbnail_height",
+    )
+
     type: Annotated[Literal["document"], "type"]
     title: Annotated[str, "title"]
     url: Annotated[str, "url"]
@@ -4690,6 +5425,8 @@ class InlineQueryResultDocument(
 
 
 class InlineQueryResultGame(_InlineQueryResultBase):
+    __slots__ = ("type", "game_short_name", "reply_markup", "id")
+
     type: Annotated[Literal["game"], "type"]
     game_short_name: Annotated[str, "gameShortName"]
     reply_markup: Annotated[Optional["ReplyMarkupInlineKeyboard"], "replyMarkup"]
@@ -4717,6 +5454,20 @@ class InlineQueryResultGif(
     _InlineQueryResultCaptionCommon,
     _InlineQueryResultMessageContentReplyMarkupCommon,
 ):
+    __slots__ = (
+        "type",
+        "title",
+        "url",
+        "width",
+        "height",
+        "duration",
+        "thumbnail_url",
+        "thumbnail_mime_type",
+        "id",
+        "message_content",
+        "reply_markup",
+    )
+
     type: Annotated[Literal["gif"], "type"]
     title: Annotated[Optional[str], "title"]
     url: Annotated[str, "url"]
@@ -4771,6 +5522,23 @@ class InlineQueryResultLocation(
     _InlineQueryResultMessageContentReplyMarkupCommon,
     _InlineQueryResultThumbnailCommon,
 ):
+    __slots__ = (
+        "type",
+        "title",
+        "latitude",
+        "longitude",
+        "horizontal_accuracy",
+        "live_period",
+        "heading",
+        "proximity_alert_radius",
+        "id",
+        "message_content",
+        "reply_markup",
+        "thumbnail_url",
+        "thumbnail_width",
+        "thumbnail_height",
+    )
+
     type: Annotated[Literal["location"], "type"]
     title: Annotated[str, "title"]
     latitude: Annotated[int, "latitude"]
@@ -4823,6 +5591,20 @@ class InlineQueryResultMpeg4Gif(
     _InlineQueryResultCaptionCommon,
     _InlineQueryResultMessageContentReplyMarkupCommon,
 ):
+    __slots__ = (
+        "type",
+        "url",
+        "title",
+        "width",
+        "height",
+        "duration",
+        "thumbnail_url",
+        "thumbnail_mime_type",
+        "id",
+        "message_content",
+        "reply_markup",
+    )
+
     type: Annotated[Literal["mpeg4Gif"], "type"]
     url: Annotated[str, "url"]
     title: Annotated[Optional[str], "title"]
@@ -4877,6 +5659,19 @@ class InlineQueryResultPhoto(
     _InlineQueryResultCaptionCommon,
     _InlineQueryResultMessageContentReplyMarkupCommon,
 ):
+    __slots__ = (
+        "type",
+        "url",
+        "thumbnail_url",
+        "title",
+        "description",
+        "width",
+        "height",
+        "id",
+        "message_content",
+        "reply_markup",
+    )
+
     type: Annotated[Literal["photo"], "type"]
     url: Annotated[str, "url"]
     thumbnail_url: Annotated[str, "thumbnailUrl"]
@@ -4928,6 +5723,22 @@ class InlineQueryResultVenue(
     _InlineQueryResultMessageContentReplyMarkupCommon,
     _InlineQueryResultThumbnailCommon,
 ):
+    __slots__ = (
+        "type",
+        "title",
+        "latitude",
+        "longitude",
+        "address",
+        "foursquare_id",
+        "foursquare_type",
+        "id",
+        "message_content",
+        "reply_markup",
+        "thumbnail_url",
+        "thumbnail_width",
+        "thumbnail_height",
+    )
+
     type: Annotated[Literal["venue"], "type"]
     title: Annotated[str, "title"]
     latitude: Annotated[int, "latitude"]
@@ -4977,6 +5788,21 @@ class InlineQueryResultVideo(
     _InlineQueryResultCaptionCommon,
     _InlineQueryResultMessageContentReplyMarkupCommon,
 ):
+    __slots__ = (
+        "type",
+        "title",
+        "description",
+        "url",
+        "mime_type",
+        "thumbnail_url",
+        "width",
+        "height",
+        "video_duration",
+        "id",
+        "message_content",
+        "reply_markup",
+    )
+
     type: Annotated[Literal["video"], "type"]
     title: Annotated[str, "title"]
     description: Annotated[Optional[str], "description"]
@@ -5034,6 +5860,16 @@ class InlineQueryResultVoice(
     _InlineQueryResultCaptionCommon,
     _InlineQueryResultMessageContentReplyMarkupCommon,
 ):
+    __slots__ = (
+        "type",
+        "title",
+        "url",
+        "voice_duration",
+        "id",
+        "message_content",
+        "reply_markup",
+    )
+
     type: Annotated[Literal["voice"], "type"]
     title: Annotated[str, "title"]
     url: Annotated[str, "url"]
@@ -5096,6 +5932,37 @@ InlineQueryResult = Union[
 
 
 class _MessageBase(_Type):
+    __slots__ = (
+        "out",
+        "id",
+        "thread_id",
+        "from_",
+        "sender_chat",
+        "date",
+        "chat",
+        "link",
+        "forward_from",
+        "is_topic_message",
+        "is_automatic_forward",
+        "reply_to_message",
+        "reply_to_message_id",
+        "reactions",
+        "reply_quote",
+        "via_bot",
+        "edit_date",
+        "has_protected_content",
+        "media_group_id",
+        "author_signature",
+        "views",
+        "forwards",
+        "reply_markup",
+        "business_connection_id",
+        "sender_boost_count",
+        "via_business_bot",
+        "effect_id",
+        "scheduled",
+    )
+
     out: Annotated[bool, "out"]
     id: Annotated[int, "id"]
     thread_id: Annotated[Optional[int], "threadId"]
@@ -5865,6 +6732,8 @@ class _MessageBase(_Type):
 
 
 class _MessageMediaBase(_MessageBase):
+    __slots__ = ("caption", "caption_entities", "has_media_spoiler")
+
     caption: Annotated[Optional[str], "caption"]
     caption_entities: Annotated[Optional[list["MessageEntity"]], "captionEntities"]
     has_media_spoiler: Annotated[Optional[bool], "hasMediaSpoiler"]
@@ -5940,6 +6809,8 @@ class _MessageMediaBase(_MessageBase):
 
 
 class MessageText(_MessageBase):
+    __slots__ = ("text", "entities", "link_preview")
+
     text: Annotated[str, "text"]
     entities: Annotated[list["MessageEntity"], "entities"]
     link_preview: Annotated[Optional["LinkPreview"], "linkPreview"]
@@ -6015,6 +6886,8 @@ class MessageText(_MessageBase):
 
 
 class MessageLink(_MessageBase):
+    __slots__ = ("link_preview",)
+
     link_preview: Annotated[Any, "linkPreview"]
 
     def __init__(
@@ -6084,6 +6957,8 @@ class MessageLink(_MessageBase):
 
 
 class MessagePhoto(_MessageMediaBase):
+    __slots__ = ("photo",)
+
     photo: Annotated["Photo", "photo"]
 
     def __init__(
@@ -6161,6 +7036,8 @@ class MessagePhoto(_MessageMediaBase):
 
 
 class MessageDocument(_MessageMediaBase):
+    __slots__ = ("document",)
+
     document: Annotated["Document", "document"]
 
     def __init__(
@@ -6238,6 +7115,8 @@ class MessageDocument(_MessageMediaBase):
 
 
 class MessageVideo(_MessageMediaBase):
+    __slots__ = ("video",)
+
     video: Annotated["Video", "video"]
 
     def __init__(
@@ -6315,6 +7194,8 @@ class MessageVideo(_MessageMediaBase):
 
 
 class MessageSticker(_MessageBase):
+    __slots__ = ("sticker",)
+
     sticker: Annotated["Sticker", "sticker"]
 
     def __init__(
@@ -6384,6 +7265,8 @@ class MessageSticker(_MessageBase):
 
 
 class MessageAnimation(_MessageMediaBase):
+    __slots__ = ("animation",)
+
     animation: Annotated["Animation", "animation"]
 
     def __init__(
@@ -6461,6 +7344,8 @@ class MessageAnimation(_MessageMediaBase):
 
 
 class MessageVoice(_MessageMediaBase):
+    __slots__ = ("voice",)
+
     voice: Annotated["Voice", "voice"]
 
     def __init__(
@@ -6538,6 +7423,8 @@ class MessageVoice(_MessageMediaBase):
 
 
 class MessageAudio(_MessageMediaBase):
+    __slots__ = ("audio",)
+
     audio: Annotated["Audio", "audio"]
 
     def __init__(
@@ -6615,6 +7502,8 @@ class MessageAudio(_MessageMediaBase):
 
 
 class MessageDice(_MessageBase):
+    __slots__ = ("dice",)
+
     dice: Annotated["Dice", "dice"]
 
     def __init__(
@@ -6684,6 +7573,8 @@ class MessageDice(_MessageBase):
 
 
 class MessageVideoNote(_MessageBase):
+    __slots__ = ("video_note",)
+
     video_note: Annotated["VideoNote", "videoNote"]
 
     def __init__(
@@ -6753,6 +7644,8 @@ class MessageVideoNote(_MessageBase):
 
 
 class MessageContact(_MessageBase):
+    __slots__ = ("contact",)
+
     contact: Annotated["Contact", "contact"]
 
     def __init__(
@@ -6822,6 +7715,8 @@ class MessageContact(_MessageBase):
 
 
 class MessageGame(_MessageBase):
+    __slots__ = ("game",)
+
     game: Annotated["Game", "game"]
 
     def __init__(
@@ -6891,6 +7786,8 @@ class MessageGame(_MessageBase):
 
 
 class MessagePoll(_MessageBase):
+    __slots__ = ("poll",)
+
     poll: Annotated["Poll", "poll"]
 
     def __init__(
@@ -6960,6 +7857,8 @@ class MessagePoll(_MessageBase):
 
 
 class MessageInvoice(_MessageBase):
+    __slots__ = ("invoice",)
+
     invoice: Annotated["Invoice", "invoice"]
 
     def __init__(
@@ -7029,6 +7928,8 @@ class MessageInvoice(_MessageBase):
 
 
 class MessageVenue(_MessageBase):
+    __slots__ = ("venue",)
+
     venue: Annotated["Venue", "venue"]
 
     def __init__(
@@ -7098,6 +7999,8 @@ class MessageVenue(_MessageBase):
 
 
 class MessageLocation(_MessageBase):
+    __slots__ = ("location",)
+
     location: Annotated["Location", "location"]
 
     def __init__(
@@ -7167,6 +8070,8 @@ class MessageLocation(_MessageBase):
 
 
 class MessageNewChatMembers(_MessageBase):
+    __slots__ = ("new_chat_members",)
+
     new_chat_members: Annotated[list["User"], "newChatMembers"]
 
     def __init__(
@@ -7236,6 +8141,8 @@ class MessageNewChatMembers(_MessageBase):
 
 
 class MessageLeftChatMember(_MessageBase):
+    __slots__ = ("left_chat_member",)
+
     left_chat_member: Annotated["User", "leftChatMember"]
 
     def __init__(
@@ -7305,6 +8212,8 @@ class MessageLeftChatMember(_MessageBase):
 
 
 class MessageNewChatTitle(_MessageBase):
+    __slots__ = ("new_chat_title",)
+
     new_chat_title: Annotated[str, "newChatTitle"]
 
     def __init__(
@@ -7374,6 +8283,8 @@ class MessageNewChatTitle(_MessageBase):
 
 
 class MessageNewChatPhoto(_MessageBase):
+    __slots__ = ("new_chat_photo",)
+
     new_chat_photo: Annotated["Photo", "newChatPhoto"]
 
     def __init__(
@@ -7443,6 +8354,8 @@ class MessageNewChatPhoto(_MessageBase):
 
 
 class MessageDeletedChatPhoto(_MessageBase):
+    __slots__ = ("deleted_chat_photo",)
+
     deleted_chat_photo: Annotated[Literal[True], "deletedChatPhoto"]
 
     def __init__(
@@ -7512,6 +8425,8 @@ class MessageDeletedChatPhoto(_MessageBase):
 
 
 class MessageGroupCreated(_MessageBase):
+    __slots__ = ("group_created", "new_chat_members")
+
     group_created: Annotated[Literal[True], "groupCreated"]
     new_chat_members: Annotated[list["User"], "newChatMembers"]
 
@@ -7584,6 +8499,8 @@ class MessageGroupCreated(_MessageBase):
 
 
 class MessageSupergroupCreated(_MessageBase):
+    __slots__ = ("supergroup_created",)
+
     supergroup_created: Annotated[Literal[True], "supergroupCreated"]
 
     def __init__(
@@ -7653,6 +8570,8 @@ class MessageSupergroupCreated(_MessageBase):
 
 
 class MessageChannelCreated(_MessageBase):
+    __slots__ = ("channel_created",)
+
     channel_created: Annotated[Literal[True], "channelCreated"]
 
     def __init__(
@@ -7722,6 +8641,8 @@ class MessageChannelCreated(_MessageBase):
 
 
 class MessageAutoDeleteTimerChanged(_MessageBase):
+    __slots__ = ("new_auto_delete_time",)
+
     new_auto_delete_time: Annotated[int, "newAutoDeleteTime"]
 
     def __init__(
@@ -7791,6 +8712,8 @@ class MessageAutoDeleteTimerChanged(_MessageBase):
 
 
 class MessageChatMigratedTo(_MessageBase):
+    __slots__ = ("chat_migrated_to",)
+
     chat_migrated_to: Annotated[int, "chatMigratedTo"]
 
     def __init__(
@@ -7860,6 +8783,8 @@ class MessageChatMigratedTo(_MessageBase):
 
 
 class MessageChatMigratedFrom(_MessageBase):
+    __slots__ = ("chat_migrated_from",)
+
     chat_migrated_from: Annotated[int, "chatMigratedFrom"]
 
     def __init__(
@@ -7929,6 +8854,8 @@ class MessageChatMigratedFrom(_MessageBase):
 
 
 class MessagePinnedMessage(_MessageBase):
+    __slots__ = ("pinned_message",)
+
     pinned_message: Annotated["Message", "pinnedMessage"]
 
     def __init__(
@@ -7998,6 +8925,8 @@ class MessagePinnedMessage(_MessageBase):
 
 
 class MessageUserShared(_MessageBase):
+    __slots__ = ("user_shared",)
+
     user_shared: Annotated[Any, "userShared"]
 
     def __init__(
@@ -8067,6 +8996,8 @@ class MessageUserShared(_MessageBase):
 
 
 class MessageWriteAccessAllowed(_MessageBase):
+    __slots__ = ("write_access_allowed",)
+
     write_access_allowed: Annotated[Any, "writeAccessAllowed"]
 
     def __init__(
@@ -8136,6 +9067,8 @@ class MessageWriteAccessAllowed(_MessageBase):
 
 
 class MessageForumTopicCreated(_MessageBase):
+    __slots__ = ("forum_topic_created",)
+
     forum_topic_created: Annotated[Any, "forumTopicCreated"]
 
     def __init__(
@@ -8205,6 +9138,8 @@ class MessageForumTopicCreated(_MessageBase):
 
 
 class MessageForumTopicEdited(_MessageBase):
+    __slots__ = ("forum_topic_edited",)
+
     forum_topic_edited: Annotated[Any, "forumTopicEdited"]
 
     def __init__(
@@ -8274,6 +9209,8 @@ class MessageForumTopicEdited(_MessageBase):
 
 
 class MessageForumTopicClosed(_MessageBase):
+    __slots__ = ("forum_topic_closed",)
+
     forum_topic_closed: Annotated[Literal[True], "forumTopicClosed"]
 
     def __init__(
@@ -8343,6 +9280,8 @@ class MessageForumTopicClosed(_MessageBase):
 
 
 class MessageForumTopicReopened(_MessageBase):
+    __slots__ = ("forum_topic_reopened",)
+
     forum_topic_reopened: Annotated[Literal[True], "forumTopicReopened"]
 
     def __init__(
@@ -8412,6 +9351,8 @@ class MessageForumTopicReopened(_MessageBase):
 
 
 class MessageVideoChatScheduled(_MessageBase):
+    __slots__ = ("video_chat_scheduled",)
+
     video_chat_scheduled: Annotated[Any, "videoChatScheduled"]
 
     def __init__(
@@ -8481,6 +9422,8 @@ class MessageVideoChatScheduled(_MessageBase):
 
 
 class MessageVideoChatStarted(_MessageBase):
+    __slots__ = ("video_chat_started",)
+
     video_chat_started: Annotated[Literal[True], "videoChatStarted"]
 
     def __init__(
@@ -8550,6 +9493,8 @@ class MessageVideoChatStarted(_MessageBase):
 
 
 class MessageVideoChatEnded(_MessageBase):
+    __slots__ = ("video_chat_ended",)
+
     video_chat_ended: Annotated[Any, "videoChatEnded"]
 
     def __init__(
@@ -8619,6 +9564,8 @@ class MessageVideoChatEnded(_MessageBase):
 
 
 class MessageGiveaway(_MessageBase):
+    __slots__ = ("giveaway",)
+
     giveaway: Annotated["Giveaway", "giveaway"]
 
     def __init__(
@@ -8688,6 +9635,8 @@ class MessageGiveaway(_MessageBase):
 
 
 class MessageUnsupported(_MessageBase):
+    __slots__ = ("unsupported",)
+
     unsupported: Annotated[Literal[True], "unsupported"]
 
     def __init__(
@@ -8757,6 +9706,8 @@ class MessageUnsupported(_MessageBase):
 
 
 class MessageSuccessfulPayment(_MessageBase):
+    __slots__ = ("successful_payment",)
+
     successful_payment: Annotated["SuccessfulPayment", "successfulPayment"]
 
     def __init__(
@@ -8826,6 +9777,8 @@ class MessageSuccessfulPayment(_MessageBase):
 
 
 class MessageRefundedPayment(_MessageBase):
+    __slots__ = ("refunded_payment",)
+
     refunded_payment: Annotated["RefundedPayment", "refundedPayment"]
 
     def __init__(
@@ -8941,6 +9894,16 @@ Message = Union[
 
 
 class CallbackQuery(_Type):
+    __slots__ = (
+        "id",
+        "from_",
+        "message",
+        "inline_message_id",
+        "chat_instance",
+        "data",
+        "game_short_name",
+    )
+
     id: Annotated[str, "id"]
     from_: Annotated["User", "from"]
     message: Annotated[Optional["Message"], "message"]
@@ -9038,6 +10001,8 @@ class CallbackQuery(_Type):
 
 
 class ChatListItem(_Type):
+    __slots__ = ("chat", "order", "pinned", "last_message")
+
     chat: Annotated["ChatP", "chat"]
     order: Annotated[str, "order"]
     pinned: Annotated[int, "pinned"]
@@ -9058,6 +10023,8 @@ class ChatListItem(_Type):
 
 
 class InlineQueryAnswer(_Type):
+    __slots__ = ("id", "results", "next_offset")
+
     id: Annotated[str, "id"]
     results: Annotated[list["InlineQueryResult"], "results"]
     next_offset: Annotated[Optional[str], "nextOffset"]
@@ -9075,6 +10042,8 @@ class InlineQueryAnswer(_Type):
 
 
 class UpdateNewMessage(_Type):
+    __slots__ = ("message",)
+
     message: Annotated["Message", "message"]
 
     def __init__(
@@ -9087,6 +10056,8 @@ class UpdateNewMessage(_Type):
 
 
 class UpdateMessageEdited(_Type):
+    __slots__ = ("edited_message",)
+
     edited_message: Annotated["Message", "editedMessage"]
 
     def __init__(
@@ -9099,6 +10070,8 @@ class UpdateMessageEdited(_Type):
 
 
 class UpdateMessageScheduled(_Type):
+    __slots__ = ("scheduled_message",)
+
     scheduled_message: Annotated["Message", "scheduledMessage"]
 
     def __init__(
@@ -9111,6 +10084,8 @@ class UpdateMessageScheduled(_Type):
 
 
 class UpdateMessagesDeleted(_Type):
+    __slots__ = ("deleted_messages", "scheduled", "business_connection_id")
+
     deleted_messages: Annotated[list["MessageReference"], "deletedMessages"]
     scheduled: Annotated[Optional[bool], "scheduled"]
     business_connection_id: Annotated[Optional[str], "businessConnectionId"]
@@ -9130,6 +10105,8 @@ class UpdateMessagesDeleted(_Type):
 
 
 class UpdateCallbackQuery(_Type):
+    __slots__ = ("callback_query",)
+
     callback_query: Annotated["CallbackQuery", "callbackQuery"]
 
     def __init__(
@@ -9142,6 +10119,8 @@ class UpdateCallbackQuery(_Type):
 
 
 class UpdateInlineQuery(_Type):
+    __slots__ = ("inline_query",)
+
     inline_query: Annotated["InlineQuery", "inlineQuery"]
 
     def __init__(
@@ -9154,6 +10133,8 @@ class UpdateInlineQuery(_Type):
 
 
 class UpdateChosenInlineResult(_Type):
+    __slots__ = ("chosen_inline_result",)
+
     chosen_inline_result: Annotated["ChosenInlineResult", "chosenInlineResult"]
 
     def __init__(
@@ -9166,6 +10147,8 @@ class UpdateChosenInlineResult(_Type):
 
 
 class UpdateNewChat(_Type):
+    __slots__ = ("new_chat",)
+
     new_chat: Annotated["ChatListItem", "newChat"]
 
     def __init__(
@@ -9178,6 +10161,8 @@ class UpdateNewChat(_Type):
 
 
 class UpdateEditedChat(_Type):
+    __slots__ = ("edited_chat",)
+
     edited_chat: Annotated["ChatListItem", "editedChat"]
 
     def __init__(
@@ -9190,6 +10175,8 @@ class UpdateEditedChat(_Type):
 
 
 class UpdateDeletedChat(_Type):
+    __slots__ = ("deleted_chat",)
+
     deleted_chat: Annotated[Any, "deletedChat"]
 
     def __init__(
@@ -9202,6 +10189,8 @@ class UpdateDeletedChat(_Type):
 
 
 class UpdateMessageInteractions(_Type):
+    __slots__ = ("message_interactions",)
+
     message_interactions: Annotated["MessageInteractions", "messageInteractions"]
 
     def __init__(
@@ -9214,6 +10203,8 @@ class UpdateMessageInteractions(_Type):
 
 
 class UpdateMessageReactionCount(_Type):
+    __slots__ = ("message_reaction_count",)
+
     message_reaction_count: Annotated["MessageReactionCount", "messageReactionCount"]
 
     def __init__(
@@ -9228,6 +10219,8 @@ class UpdateMessageReactionCount(_Type):
 
 
 class UpdateMessageReactions(_Type):
+    __slots__ = ("message_reactions",)
+
     message_reactions: Annotated["MessageReactions", "messageReactions"]
 
     def __init__(
@@ -9240,6 +10233,8 @@ class UpdateMessageReactions(_Type):
 
 
 class UpdateChatMember(_Type):
+    __slots__ = ("chat_member",)
+
     chat_member: Annotated["ChatMemberUpdated", "chatMember"]
 
     def __init__(
@@ -9252,6 +10247,8 @@ class UpdateChatMember(_Type):
 
 
 class UpdateMyChatMember(_Type):
+    __slots__ = ("my_chat_member",)
+
     my_chat_member: Annotated["ChatMemberUpdated", "myChatMember"]
 
     def __init__(
@@ -9264,6 +10261,8 @@ class UpdateMyChatMember(_Type):
 
 
 class UpdateDeletedStory(_Type):
+    __slots__ = ("deleted_story",)
+
     deleted_story: Annotated["StoryReference", "deletedStory"]
 
     def __init__(
@@ -9276,6 +10275,8 @@ class UpdateDeletedStory(_Type):
 
 
 class UpdateNewStory(_Type):
+    __slots__ = ("story",)
+
     story: Annotated["Story", "story"]
 
     def __init__(
@@ -9288,6 +10289,8 @@ class UpdateNewStory(_Type):
 
 
 class UpdateBusinessConnection(_Type):
+    __slots__ = ("business_connection",)
+
     business_connection: Annotated["BusinessConnection", "businessConnection"]
 
     def __init__(
@@ -9300,6 +10303,8 @@ class UpdateBusinessConnection(_Type):
 
 
 class UpdateVideoChat(_Type):
+    __slots__ = ("video_chat",)
+
     video_chat: Annotated["VideoChat", "videoChat"]
 
     def __init__(
@@ -9312,6 +10317,8 @@ class UpdateVideoChat(_Type):
 
 
 class UpdatePreCheckoutQuery(_Type):
+    __slots__ = ("pre_checkout_query",)
+
     pre_checkout_query: Annotated["PreCheckoutQuery", "preCheckoutQuery"]
 
     def __init__(
@@ -9324,6 +10331,8 @@ class UpdatePreCheckoutQuery(_Type):
 
 
 class UpdateJoinRequest(_Type):
+    __slots__ = ("join_request",)
+
     join_request: Annotated["JoinRequest", "joinRequest"]
 
     def __init__(